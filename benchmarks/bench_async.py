@@ -0,0 +1,68 @@
+"""
+Benchmark the responsiveness of an event loop while AsyncSizer sizes a project. A synthetic catalogue is loaded and a
+project, see bench_sizing.make_project(), is sized as a number of concurrent requests, while a ticker coroutine records
+how late each of its 1 ms sleeps wakes up. The same requests are then sized by calling select_cable_from_database()
+directly on the event loop one request at a time, as the synchronous code would be.
+
+Usage: python benchmarks/bench_async.py [runs] [cables] [requests]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import CableSizer.asyncsizer as asyncsizer
+import CableSizer.cablesizer as cablesizer
+
+from bench_import import write_catalogue
+from bench_sizing import make_project
+
+
+async def ticker(lags: list, stop: asyncio.Event):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def run(sizer, cable_catalogue, requests: list, offload: bool):
+    lags, stop = [], asyncio.Event()
+    tick = asyncio.ensure_future(ticker(lags, stop))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    if offload:
+        await asyncio.gather(*(sizer.size(cable_catalogue, request) for request in requests))
+    else:
+        for request in requests:
+            cablesizer.select_cable_from_database(cable_catalogue, request, cache=sizer.cache)
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await tick
+    name = "executor" if offload else "on loop"
+    print(f"{name:>8}: {len(requests)} requests in {elapsed:.3f}s, event loop lag max {max(lags) * 1000:.1f}ms, "
+          f"{sizer.batches} batches")
+
+
+async def main(runs: int = 50000, cables: int = 20000, count: int = 50):
+    project = make_project(runs)
+    requests = [project[index::count] for index in range(count)]
+    with tempfile.TemporaryDirectory() as directory:
+        fp = Path(directory) / "catalogue.csv"
+        write_catalogue(fp, cables)
+        async with asyncsizer.AsyncSizer() as sizer:
+            lags, stop = [], asyncio.Event()
+            tick = asyncio.ensure_future(ticker(lags, stop))
+            start = time.perf_counter()
+            cable_catalogue = await sizer.load_catalogue([fp])
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await tick
+            print(f"    load: {cables} cables in {elapsed:.3f}s, event loop lag max {max(lags) * 1000:.1f}ms")
+            await run(sizer, cable_catalogue, requests, offload=True)
+            await run(sizer, cable_catalogue, requests, offload=False)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:])))
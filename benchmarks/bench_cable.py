@@ -0,0 +1,73 @@
+"""
+Benchmark the footprint and construction time of Cable objects. Cables are materialised from a synthetic catalogue with
+CableCatalogue.get_cables() and measured with tracemalloc. A sizing job is then simulated which builds a cable for every
+row but only reads the size and current carrying capacity of 5% of them, with eager and with lazy cables. Finally the
+rows with a neutral of at least half the active size are found from each cable's csa and from the catalogue's CSAMatrix.
+
+Usage: python benchmarks/bench_cable.py [cables]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import CableSizer.csvimporter as csvimporter
+
+from bench_import import write_catalogue
+
+
+def bench_construction(cable_catalogue) -> float:
+    start = time.perf_counter()
+    for _ in cable_catalogue.get_cables():
+        pass
+    return time.perf_counter() - start
+
+
+def bench_sizing_job(cable_catalogue, lazy: bool, fraction: float = 0.05) -> float:
+    step = round(1 / fraction)
+    start = time.perf_counter()
+    for index, each in enumerate(cable_catalogue.get_cables(lazy=lazy)):
+        if index % step == 0:
+            each.installation_ccc("unenclosed_spaced")
+            each.activeCores.size
+    return time.perf_counter() - start
+
+
+def bench_neutral_filter(cable_catalogue, matrix: bool) -> float:
+    start = time.perf_counter()
+    if matrix:
+        cable_catalogue.csa_matrix.compare("NEUTRAL", "POWER", 0.5)
+    else:
+        [index for index, each in enumerate(cable_catalogue.get_cables(lazy=True))
+         if each.csa["NEUTRAL"] >= 0.5 * each.csa["POWER"]]
+    return time.perf_counter() - start
+
+
+def bench_footprint(cable_catalogue) -> int:
+    tracemalloc.start()
+    cables = list(cable_catalogue.get_cables())
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current // len(cables)
+
+
+def main(cables: int = 20000):
+    with tempfile.TemporaryDirectory() as directory:
+        fp = Path(directory) / "catalogue.csv"
+        write_catalogue(fp, cables)
+        cable_catalogue = csvimporter.CSVImporter(fp).load()
+    elapsed = min(bench_construction(cable_catalogue) for _ in range(3))
+    print(f"construction: {elapsed / cables * 1e6:.1f}us per cable ({cables / elapsed:,.0f} cables/s)")
+    print(f"   footprint: {bench_footprint(cable_catalogue):,} bytes per cable")
+    for lazy in (False, True):
+        elapsed = min(bench_sizing_job(cable_catalogue, lazy) for _ in range(3))
+        print(f"  sizing job: {elapsed:.3f}s {'lazy' if lazy else 'eager'}")
+    print(f"neutral >= 50%: {bench_neutral_filter(cable_catalogue, False):.3f}s per cable csa")
+    cable_catalogue.csa_matrix
+    elapsed = min(bench_neutral_filter(cable_catalogue, True) for _ in range(3))
+    print(f"neutral >= 50%: {elapsed:.3f}s csa matrix")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,68 @@
+"""
+Benchmark the catalogue import throughput in rows per second. A synthetic catalogue .csv is written using the
+importcables headers and then imported with:
+    dict rows: csv.DictReader rows appended one at a time with CableCatalogue.extend().
+    compiled: CSVImporter.load(), which converts whole chunks a column at a time.
+
+Usage: python benchmarks/bench_import.py [rows]
+"""
+import csv
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import CableSizer.catalogue as catalogue
+import CableSizer.csvimporter as csvimporter
+import CableSizer.importcables as importcables
+
+
+def write_catalogue(fp: Path, rows: int):
+    sizes = [1.5, 2.5, 4, 6, 10, 16, 25, 35, 50, 70, 95, 120, 150, 185, 240, 300, 400, 500, 630]
+    with open(fp, "w", newline="", encoding="utf-8-sig") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(importcables.HEADERS)
+        for row in range(rows):
+            size = random.choice(sizes)
+            values = {"conductorMaterial": random.choice(["CU", "AL"]), "cableType": "POWER",
+                      "cableCoreArrangement": random.choice(["1C", "3C+E", "4C+E"]), "circuitType": "MULTI_PHASE",
+                      "description": f"{size}mm2 cable {row}", "activeCores_size": size,
+                      "activeCores_sizeUnit": "MM2", "activeCores_number": 3, "earthCores_size": size / 2,
+                      "earthCores_sizeUnit": "MM2", "earthCores_number": 1, "insulation_name": "XLPE",
+                      "insulation_code": random.choice(["X-90", "V-90", "R-EP-90"]), "sheath": "PVC",
+                      "armoured": random.choice(["NIL", "SWA"]), "voltRating": "0.6/1KV", "isFlex": "FALSE",
+                      "impedance_MVAM": round(40 / size, 3), "manufacturer_name": "ACME",
+                      "manufacturer_partNumber": f"P{row}", "rev_number": "A", "rev_date": "2020-03-02"}
+            for header in importcables.HEADERS:
+                if header.endswith("_current"):
+                    values[header] = int(size * 4)
+                elif header.endswith("_installTemp"):
+                    values[header] = 40
+            writer.writerow([values.get(header, "") for header in importcables.HEADERS])
+
+
+def bench_dict_rows(fp: Path) -> float:
+    start = time.perf_counter()
+    with open(fp, newline="", encoding="utf-8-sig") as csvfile:
+        catalogue.CableCatalogue(csv.DictReader(csvfile))
+    return time.perf_counter() - start
+
+
+def bench_compiled(fp: Path) -> float:
+    start = time.perf_counter()
+    csvimporter.CSVImporter(fp, chunk_size=5000).load()
+    return time.perf_counter() - start
+
+
+def main(rows: int = 50000):
+    with tempfile.TemporaryDirectory() as directory:
+        fp = Path(directory) / "catalogue.csv"
+        write_catalogue(fp, rows)
+        for name, bench in (("dict rows", bench_dict_rows), ("compiled", bench_compiled)):
+            elapsed = min(bench(fp) for _ in range(3))
+            print(f"{name:>10}: {rows / elapsed:>10,.0f} rows/s ({elapsed:.3f}s for {rows} rows)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,57 @@
+"""
+Benchmark the peak memory and time taken to export and import a project of cable runs. The runs are written with:
+    save: serializers.save(), which encodes the whole project as one string.
+    stream: jsonstream.dump_runs(), which encodes and writes the runs a chunk at a time.
+and read back with serializers.load() and jsonstream.iter_runs(). Only the cable runs being converted are held in memory
+while streaming, so the runs are generated as they are written and discarded as they are read.
+
+Usage: python benchmarks/bench_jsonstream.py [runs]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import CableSizer.cable as cable
+import CableSizer.jsonstream as jsonstream
+import CableSizer.serializers as serializers
+
+
+def _runs(count: int):
+    for index in range(count):
+        yield cable.CableRun(cable.Cable(cable_type="power", active_size=float(index % 300 + 1),
+                                         unenclosed_spaced_ccc=index % 500, mvam=1.2), tag=f"RUN-{index}",
+                             length=50.0, required_ccc=32.0)
+
+
+def _measure(function, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def _drain(iterator):
+    for _ in iterator:
+        pass
+
+
+def main(runs: int = 20000):
+    with tempfile.TemporaryDirectory() as directory:
+        fp = Path(directory) / "project.json"
+        for name, dump, load in (("save", lambda: serializers.save(_runs(runs), fp),
+                                  lambda: serializers.load(cable.CableRun, fp)),
+                                 ("stream", lambda: jsonstream.dump_runs(_runs(runs), fp),
+                                  lambda: _drain(jsonstream.iter_runs(fp)))):
+            dump_time, dump_peak = _measure(dump)
+            load_time, load_peak = _measure(load)
+            print(f"{name:>7}: write {dump_time:.2f}s peak {dump_peak / 1e6:.1f} MB, "
+                  f"read {load_time:.2f}s peak {load_peak / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
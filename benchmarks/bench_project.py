@@ -0,0 +1,49 @@
+"""
+Benchmark the scaling of cablesizer.size_project() with the number of worker processes. A synthetic catalogue is
+imported and compiled, and a project of cable runs, see bench_sizing.make_project(), is sized with 1, 2, 4, ... workers
+up to the number of processors, and 2 workers on a single processor machine. The speed up over a single worker and the
+parallel efficiency are printed for each, so scaling stops where efficiency falls away.
+
+Usage: python benchmarks/bench_project.py [runs] [cables]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import CableSizer.cablesizer as cablesizer
+import CableSizer.cataloguecache as cataloguecache
+import CableSizer.csvimporter as csvimporter
+
+from bench_import import write_catalogue
+from bench_sizing import make_project
+
+
+def main(runs: int = 200000, cables: int = 20000):
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] < max(cpus, 2):
+        counts.append(min(counts[-1] * 2, max(cpus, 2)))
+    project = make_project(runs)
+    with tempfile.TemporaryDirectory() as directory:
+        fp = Path(directory) / "catalogue.csv"
+        write_catalogue(fp, cables)
+        cable_catalogue = csvimporter.CSVImporter(fp).load()
+        compiled = Path(directory) / f"catalogue{cataloguecache.SUFFIX}"
+        cataloguecache.dump(cable_catalogue, compiled)
+        baseline, expected = None, None
+        for jobs in counts:
+            start = time.perf_counter()
+            selections = cablesizer.size_project(cable_catalogue, project, jobs=jobs, catalogue_fp=compiled)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            expected = expected or selections
+            print(f"jobs {jobs:>3}: {runs} runs in {elapsed:.3f}s ({runs / elapsed:,.0f} runs/s), speed up "
+                  f"{baseline / elapsed:.2f}, efficiency {baseline / elapsed / jobs:.0%}, "
+                  f"{'same' if selections == expected else 'DIFFERENT'} selections")
+    print(f"{cpus} processors")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,63 @@
+"""
+Benchmark saving and loading a project of cable runs. Each run holds a single cable materialised from a synthetic
+catalogue. The runs are converted with:
+    methods: the classes' own to_dict() and from_dict() methods.
+    generated: serializers.dump_many() and serializers.load_many().
+The time taken by json to encode, decode and write the file is reported separately.
+
+Usage: python benchmarks/bench_serializers.py [runs]
+"""
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import CableSizer.cable as cable
+import CableSizer.csvimporter as csvimporter
+import CableSizer.serializers as serializers
+
+from bench_import import write_catalogue
+
+
+def _timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def _method_dump(runs):
+    return [run.to_dict() for run in runs]
+
+
+def _method_load(details):
+    runs = []
+    for each in details:
+        run = cable.CableRun()
+        run.from_dict(each)
+        runs.append(run)
+    return runs
+
+
+def main(runs: int = 20000):
+    with tempfile.TemporaryDirectory() as directory:
+        fp = Path(directory) / "catalogue.csv"
+        write_catalogue(fp, runs)
+        cable_catalogue = csvimporter.CSVImporter(fp).load()
+        project = [cable.CableRun(each, tag=f"RUN-{index}", length=50.0, required_ccc=32.0)
+                   for index, each in enumerate(cable_catalogue.get_cables())]
+        output = Path(directory) / "project.json"
+        for name, dump, load in (("methods", _method_dump, _method_load),
+                                 ("generated", serializers.dump_many, lambda data: serializers.load_many(
+                                     cable.CableRun, data))):
+            dump_time, data = _timed(dump, project)
+            load_time, _ = _timed(load, data)
+            print(f"{name:>10}: dump {dump_time:.3f}s, load {load_time:.3f}s")
+        encode_time, _ = _timed(serializers.save, project, output)
+        decode_time, _ = _timed(lambda: json.loads(output.read_text(encoding="utf-8")))
+        print(f"      json: encode and write {encode_time - dump_time:.3f}s, read and decode {decode_time:.3f}s "
+              f"({output.stat().st_size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
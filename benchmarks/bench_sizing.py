@@ -0,0 +1,110 @@
+"""
+Benchmark batch cable sizing with cablesizer.select_cable_from_database(). A synthetic catalogue is imported and a
+project of cable runs is sized against it. The runs share a few dozen specifications, as a real project does, and have
+loads drawn from a few hundred feeder ratings, lengths to the nearest 5 m and random installation methods. The project
+is sized for the fewest parallel cables and for the least total conductor area, without a cache, and then with a cache
+that is empty and that already holds the project. The project is also sized without a store and then twice with an
+empty ResultStore, as consecutive nightly jobs would, against the catalogue and one five times its size: a warm store
+saves the frontiers built for each specification, so it gains most on large catalogues. Lastly the runs are arranged
+in supply chains, held by an IncrementalSizer and re-sized after single edits of a run's length.
+
+Usage: python benchmarks/bench_sizing.py [runs] [cables]
+"""
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import CableSizer.cable as cable
+import CableSizer.cablesizer as cablesizer
+import CableSizer.csvimporter as csvimporter
+import CableSizer.resultstore as resultstore
+import CableSizer.sizingcache as sizingcache
+
+from bench_import import write_catalogue
+
+
+def make_project(runs: int, seed: int = 1) -> list:
+    generator = random.Random(seed)
+    specs = [cable.CableSpec(conductor_material=material, armour=armour, insulation_code=code, max_parallel=parallel,
+                             vd_max=vd_max)
+             for material in ("CU", "AL") for armour in ("NIL", "SWA") for code in ("X-90", "V-90", "")
+             for parallel in (1, 4) for vd_max in (0.0, 20.0)]
+    methods = ["UNENCLOSED_SPACED", "UNENCLOSED_TOUCHING", "ENCLOSED_CONDUIT", "UNDERGROUND_DUCTS"]
+    ratings = sorted({round(generator.uniform(5, 1500), 1) for _ in range(300)})
+    project = []
+    for index in range(runs):
+        load_current = generator.choice(ratings)
+        run = cable.CableRun(tag=f"C{index}", length=5 * generator.randint(1, 60), required_ccc=load_current)
+        run.circuit_details.load_current = load_current
+        run.circuit_details.installation.physical_installation = generator.choice(methods)
+        project.append((run, generator.choice(specs)))
+    return project
+
+
+def bench_incremental(cable_catalogue, project: list, edits: int = 200):
+    for index, (run, _) in enumerate(project):
+        run.supply, run.load = (f"L{(index - 1) // 10}" if index else "MSB"), f"L{index}"
+    start = time.perf_counter()
+    sizer = cablesizer.IncrementalSizer(cable_catalogue, project)
+    elapsed = time.perf_counter() - start
+    print(f"incremental: {len(project)} runs in supply chains sized in {elapsed:.3f}s")
+    generator = random.Random(2)
+    latencies, changed = [], 0
+    for _ in range(edits):
+        run = generator.choice(project)[0]
+        run.length = 5 * generator.randint(1, 60)
+        start = time.perf_counter()
+        sizer.mark_dirty(run)
+        changed += len(sizer.resize())
+        latencies.append(time.perf_counter() - start)
+    print(f"incremental: {edits} single edits re-sized in a median of {statistics.median(latencies) * 1000:.3f}ms, "
+          f"max {max(latencies) * 1000:.3f}ms, {changed / edits:.1f} selections changed per edit")
+    run.length += 5
+    start = time.perf_counter()
+    sizer.refresh()
+    print(f"incremental: edit found and re-sized by refresh() in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+def bench_store(directory: Path, cables: int, project: list):
+    fp = directory / f"catalogue-{cables}.csv"
+    write_catalogue(fp, cables)
+    for job in ("no store", "first", "second"):
+        # Each job loads its own catalogue, as a nightly job would, so none reuses another's indexes or digest.
+        cable_catalogue = csvimporter.CSVImporter(fp).load()
+        start = time.perf_counter()
+        if job == "no store":
+            cablesizer.select_cable_from_database(cable_catalogue, project)
+            counts = ""
+        else:
+            with resultstore.ResultStore(directory / f"results-{cables}.sqlite") as store:
+                cablesizer.select_cable_from_database(cable_catalogue, project, store=store)
+            counts = f", {store.hits} hits, {store.misses} misses"
+        elapsed = time.perf_counter() - start
+        print(f"store {job:>8}: {len(project)} runs against {cables} cables in {elapsed:.3f}s{counts}")
+
+
+def main(runs: int = 50000, cables: int = 20000):
+    project = make_project(runs)
+    with tempfile.TemporaryDirectory() as directory:
+        fp = Path(directory) / "catalogue.csv"
+        write_catalogue(fp, cables)
+        cable_catalogue = csvimporter.CSVImporter(fp).load()
+        for count in (cables, cables * 5):
+            bench_store(Path(directory), count, project)
+    for minimise in ("parallel", "csa"):
+        cache = sizingcache.SizingCache()
+        for name, each in (("no cache", sizingcache.SizingCache(0)), ("cold", cache), ("warm", cache)):
+            start = time.perf_counter()
+            selections = cablesizer.select_cable_from_database(cable_catalogue, project, minimise=minimise, cache=each)
+            elapsed = time.perf_counter() - start
+            sized = sum(selection.row is not None for selection in selections)
+            print(f"{minimise:>8} {name:>8}: {runs} runs against {cables} cables in {elapsed:.3f}s "
+                  f"({runs / elapsed:,.0f} runs/s), {sized} sized, hit ratio {each.info()['hit_ratio']:.2f}")
+    bench_incremental(cable_catalogue, project[:30000])
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
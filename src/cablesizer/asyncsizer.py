@@ -0,0 +1,256 @@
+"""
+An asyncio interface to catalogue loading and cable sizing, for applications such as web backends that run on an event
+loop. The CPU bound work is run in an executor so the event loop is never blocked by it, and every call accepts a
+timeout and may be cancelled.
+
+Sizing requests for the same catalogue that arrive within a few milliseconds of each other are sized together in a
+single select_cable_from_database() batch, so concurrent requests share the catalogue's frontiers rather than each
+paying for them:
+
+    async with AsyncSizer() as sizer:
+        cable_catalogue = await sizer.load_catalogue(["catalogue.csv"])
+        selections = await sizer.size(cable_catalogue, runs, timeout=5.0)
+"""
+import asyncio
+import concurrent.futures as futures
+import itertools
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+import CableSizer.cable as cable
+import CableSizer.cablesizer as cablesizer
+import CableSizer.catalogue as catalogue
+import CableSizer.cataloguecache as cataloguecache
+import CableSizer.sizingcache as sizingcache
+
+"""The time, in seconds, a sizing request waits for other requests to join its batch."""
+BATCH_DELAY = 0.002
+
+"""The number of runs that sends a batch to the executor without waiting for BATCH_DELAY."""
+BATCH_SIZE = 8192
+
+
+class _Batch:
+    """
+    The sizing requests waiting to be sized together: their runs and the future each request is waiting on.
+    """
+    __slots__ = ("catalogue", "requests", "size", "handle")
+
+    def __init__(self, cable_catalogue: catalogue.CableCatalogue):
+        self.catalogue = cable_catalogue
+        self.requests: List[Tuple[list, asyncio.Future]] = []
+        self.size: int = 0
+        self.handle: Optional[asyncio.TimerHandle] = None
+
+
+class AsyncSizer:
+    """
+    Load catalogues and size cable runs without blocking the event loop. By default the work is run in a single
+    background thread. When jobs is not 1 the batches are sized by cablesizer.size_project() in a process pool that
+    is started on first use and kept until the sizer is closed. Each catalogue is compiled to a temporary file once,
+    and again only when its generation changes, and the workers keep it mapped between batches.
+    """
+    def __init__(self, executor: futures.Executor = None, cache: sizingcache.SizingCache = None, jobs: int = 1,
+                 batch_delay: float = BATCH_DELAY, batch_size: int = BATCH_SIZE,
+                 chunk_size: int = cablesizer.CHUNK_SIZE):
+        """
+        :param executor: The executor the work is run in. Defaults to a single thread owned, and shut down, by the
+        sizer. An executor given here must not run two sizing batches at once if a cache is given, since a SizingCache
+        is not thread safe.
+        :param cache: An optional cache of selections, see SizingCache. Every run is sized from the catalogue if None.
+        :param jobs: The number of worker processes batches are sized with, see size_project(). Defaults to the number
+        of processors if None. Batches are sized in the executor with select_cable_from_database() if jobs is 1.
+        :param batch_delay: The time, in seconds, a request waits for other requests to join its batch.
+        :param batch_size: The number of runs that sends a batch without waiting for batch_delay.
+        :param chunk_size: The number of runs sent to a worker process at a time when jobs is not 1.
+        """
+        self._owns_executor: bool = executor is None
+        self._executor = futures.ThreadPoolExecutor(max_workers=1) if executor is None else executor
+        self.cache: Optional[sizingcache.SizingCache] = cache
+        self.jobs: Optional[int] = jobs
+        self.batch_delay: float = batch_delay
+        self.batch_size: int = batch_size
+        self.chunk_size: int = chunk_size
+        self.batches: int = 0
+        self._batches: Dict[tuple, _Batch] = {}
+        self._loading: Dict[tuple, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Future] = set()
+        self._pool: Optional[futures.ProcessPoolExecutor] = None
+        self._directory: Optional[tempfile.TemporaryDirectory] = None
+        self._compiled: Dict[int, Tuple[catalogue.CableCatalogue, int, Path]] = {}
+        self._names = itertools.count()
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> "AsyncSizer":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Cancel the requests that are waiting, or being sized, stop the process pool and shut down the sizer's own
+        executor.
+        """
+        for batch in self._batches.values():
+            batch.handle.cancel()
+            for _, future in batch.requests:
+                future.cancel()
+        self._batches.clear()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._pool is not None:
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._shutdown_pool)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def load_catalogue(self, fps: Sequence[Union[str, Path]], output: Union[str, Path] = None,
+                             mapped: bool = False, timeout: float = None) -> catalogue.CableCatalogue:
+        """
+        Load a number of catalogue .csv files in the executor, see cataloguecache.load_catalogue(). Concurrent loads of
+        the same files share a single load, and a load that times out or is cancelled is left running for the others.
+        :param fps: The source .csv files.
+        :param output: The path of the compiled catalogue.
+        :param mapped: Memory map the compiled catalogue rather than reading it.
+        :param timeout: The time, in seconds, to wait for the catalogue. Waits indefinitely if None.
+        :return: CableCatalogue
+        """
+        key = (tuple(str(fp) for fp in fps), None if output is None else str(output), mapped)
+        loading = self._loading.get(key)
+        if loading is None:
+            loop = asyncio.get_running_loop()
+            loading = self._loading[key] = loop.run_in_executor(
+                self._executor, cataloguecache.load_catalogue, [Path(fp) for fp in fps], output, mapped)
+            loading.add_done_callback(lambda _: self._loading.pop(key, None))
+        return await asyncio.wait_for(asyncio.shield(loading), timeout)
+
+    async def size(self, cable_catalogue: catalogue.CableCatalogue,
+                   runs: Iterable[Tuple[cable.CableRun, cable.CableSpec]], install_method: str = None,
+                   minimise: str = "parallel", timeout: float = None) -> List[cablesizer.Selection]:
+        """
+        Size a number of cable runs, see cablesizer.select_cable_from_database(). The request joins the batch of
+        requests waiting for the same catalogue, installation method and objective. A request that times out or is
+        cancelled is removed from its batch if the batch has not yet been sent to the executor.
+        :param cable_catalogue: The CableCatalogue to select from.
+        :param runs: The (CableRun, CableSpec) pairs.
+        :param install_method: The installation method of runs that do not have one.
+        :param minimise: 'parallel' for the fewest cables or 'csa' for the least total active conductor area.
+        :param timeout: The time, in seconds, to wait for the selections. Waits indefinitely if None.
+        :return: The selection for each run, in the order of runs.
+        """
+        pairs = list(runs)
+        if not pairs:
+            return []
+        loop = asyncio.get_running_loop()
+        key = (id(cable_catalogue), install_method, minimise)
+        batch = self._batches.get(key)
+        if batch is None or batch.catalogue is not cable_catalogue:
+            batch = self._batches[key] = _Batch(cable_catalogue)
+            batch.handle = loop.call_later(self.batch_delay, self._flush, key, batch)
+        future = loop.create_future()
+        batch.requests.append((pairs, future))
+        batch.size += len(pairs)
+        if batch.size >= self.batch_size:
+            batch.handle.cancel()
+            self._flush(key, batch)
+        return await asyncio.wait_for(future, timeout)
+
+    def _flush(self, key: tuple, batch: _Batch):
+        """
+        Send a batch to the executor. Requests that have already timed out or been cancelled are left out.
+        """
+        if self._batches.get(key) is batch:
+            del self._batches[key]
+        requests = [(pairs, future) for pairs, future in batch.requests if not future.done()]
+        if requests:
+            task = asyncio.ensure_future(self._run(batch.catalogue, requests, *key[1:]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _size(self, cable_catalogue: catalogue.CableCatalogue, pairs: list, install_method: Optional[str],
+              minimise: str) -> List[cablesizer.Selection]:
+        """
+        Size a batch. This is the work run in the executor.
+        """
+        if self.jobs == 1:
+            return cablesizer.select_cable_from_database(cable_catalogue, pairs, install_method, minimise, self.cache)
+        fp = self._compiled_path(cable_catalogue)
+        return cablesizer.size_project(cable_catalogue, pairs, install_method=install_method, minimise=minimise,
+                                       chunk_size=self.chunk_size, catalogue_fp=fp, pool=self._pool)
+
+    def _compiled_path(self, cable_catalogue: catalogue.CableCatalogue) -> Path:
+        """
+        The compiled copy of a catalogue mapped by the worker processes, written once for each catalogue generation.
+        The process pool is started on first use.
+        """
+        with self._lock:
+            if self._pool is None:
+                self._directory = tempfile.TemporaryDirectory()
+                self._pool = futures.ProcessPoolExecutor(max_workers=self.jobs)
+            compiled = self._compiled.get(id(cable_catalogue))
+            if compiled is None or compiled[0] is not cable_catalogue or compiled[1] != cable_catalogue.generation:
+                if compiled is not None:
+                    try:
+                        os.unlink(compiled[2])
+                    except OSError:
+                        pass
+                fp = Path(self._directory.name) / f"catalogue-{next(self._names)}{cataloguecache.SUFFIX}"
+                cataloguecache.dump(cable_catalogue, fp)
+                compiled = self._compiled[id(cable_catalogue)] = (cable_catalogue, cable_catalogue.generation, fp)
+            return compiled[2]
+
+    def _shutdown_pool(self):
+        """
+        Stop the worker processes and delete the compiled catalogues.
+        """
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._directory.cleanup()
+                self._pool = self._directory = None
+                self._compiled.clear()
+
+    async def _run(self, cable_catalogue: catalogue.CableCatalogue, requests: List[Tuple[list, asyncio.Future]],
+                   install_method: Optional[str], minimise: str):
+        """
+        Size a batch in the executor and hand each request its selections. If the batch fails, e.g. a run has no
+        installation method, each request is sized on its own so only the requests at fault fail.
+        """
+        loop = asyncio.get_running_loop()
+        pairs = [pair for request, _ in requests for pair in request]
+        self.batches += 1
+        try:
+            selections = await loop.run_in_executor(self._executor, self._size, cable_catalogue, pairs,
+                                                     install_method, minimise)
+        except asyncio.CancelledError:
+            for _, future in requests:
+                future.cancel()
+            raise
+        except Exception as error:
+            if len(requests) == 1:
+                if not requests[0][1].done():
+                    requests[0][1].set_exception(error)
+                return
+            for request, future in requests:
+                if future.done():
+                    continue
+                try:
+                    result = await loop.run_in_executor(self._executor, self._size, cable_catalogue, request,
+                                                        install_method, minimise)
+                except Exception as request_error:
+                    if not future.done():
+                        future.set_exception(request_error)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            return
+        start = 0
+        for request, future in requests:
+            if not future.done():
+                future.set_result(selections[start:start + len(request)])
+            start += len(request)
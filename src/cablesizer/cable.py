@@ -1,5 +1,176 @@
 import datetime
-from typing import Tuple, List, Union
+import sys
+from array import array
+from typing import Iterable, Tuple, List, Union
+
+import CableSizer.csa as csa
+import CableSizer.installmethods as installmethods
+
+"""The maximum number of shared sub-objects held by the flyweight cache of each class. A cache is cleared when it is
+full."""
+_FLYWEIGHT_SIZE = 4096
+_flyweights: dict = {}
+
+"""The mutable class of each read only class used for shared sub-objects."""
+_SHARED_BASES: dict = {}
+_SHARED_CLASSES: dict = {}
+
+"""The copy on write view class of each sub-object class, see SubObject."""
+_VIEW_CLASSES: dict = {}
+_VIEW_BASES: dict = {}
+
+"""The shared tuples of (install_temp, arrangement) pairs held by cables, one pair per installation method."""
+_CONDITIONS: dict = {}
+_BLANK_CONDITION = (0, "")
+
+"""The installation methods set by the Cable() keyword arguments, in argument order."""
+_KEYWORD_METHODS = installmethods.method_ids(("unenclosed_spaced", "unenclosed_surface", "unenclosed_touching",
+                                              "enclosed_conduit", "enclosed_partial", "enclosed_complete",
+                                              "buried_direct", "ducts_single", "ducts_per_cable"))
+
+
+def _shared_class(cls):
+    """
+    The read only variant of a sub-object class, used for instances shared between cables.
+    """
+    shared = _SHARED_CLASSES.get(cls)
+    if shared is None:
+        def __setattr__(self, name, value):
+            raise AttributeError(f"{cls.__name__} is shared between cables and is read only. Call Cable.unshare() "
+                                 f"before modifying it.")
+        shared = type(f"Shared{cls.__name__}", (cls,), {"__slots__": (), "__setattr__": __setattr__})
+        _SHARED_CLASSES[cls] = shared
+        _SHARED_BASES[shared] = cls
+    return shared
+
+
+def _view_class(cls):
+    """
+    The copy on write view of a sub-object class, returned by SubObject for instances shared between cables.
+    """
+    view = _VIEW_CLASSES.get(cls)
+    if view is None:
+        def __init__(self, owner, slot: str):
+            object.__setattr__(self, "_owner", owner)
+            object.__setattr__(self, "_slot", slot)
+
+        def __getattr__(self, name):
+            # Only called for the attributes of cls, which are never set on the view itself.
+            return getattr(getattr(self._owner, self._slot), name)
+
+        def __setattr__(self, name, value):
+            target = getattr(self._owner, self._slot)
+            if type(target) in _SHARED_BASES:
+                target = unshare(target)
+                setattr(self._owner, self._slot, target)
+            setattr(target, name, value)
+
+        view = type(f"{cls.__name__}View", (cls,), {"__slots__": ("_owner", "_slot"), "__init__": __init__,
+                                                    "__getattr__": __getattr__, "__setattr__": __setattr__})
+        _VIEW_CLASSES[cls] = view
+        _VIEW_BASES[view] = cls
+    return view
+
+
+def _target(instance):
+    """
+    The sub-object seen through a copy on write view, or the instance itself.
+    """
+    if type(instance) in _VIEW_BASES:
+        return getattr(instance._owner, instance._slot)
+    return instance
+
+
+class SubObject:
+    """
+    A Cable attribute holding a sub-object, kept in the slot of the same name prefixed with an underscore. A shared
+    sub-object, see flyweight(), is returned as a copy on write view: it is read from the shared instance, and the
+    first change made through it replaces the shared instance held by the cable with a private copy. Other cables are
+    never affected.
+    """
+    __slots__ = ("slot",)
+
+    def __init__(self, slot: str):
+        """
+        :param slot: The slot holding the sub-object.
+        """
+        self.slot = slot
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        cls = _SHARED_BASES.get(type(value))
+        if cls is None:
+            return value
+        return _view_class(cls)(instance, self.slot)
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, _target(value))
+
+
+def flyweight(cls, *args):
+    """
+    Return a read only instance of a sub-object class. Every call with the same class and equal arguments of the same
+    types returns the same instance, so identical sub-objects, e.g. the empty data cores of a power cable, are only
+    held once.
+    :param cls: The sub-object class.
+    :param args: The positional arguments used to create the instance.
+    :return: The shared instance.
+    """
+    cache = _flyweights.get(cls)
+    if cache is None:
+        cache = _flyweights[cls] = {}
+    # 1, 1.0 and True are equal, so the types are part of the key to keep each instance's values as given.
+    key = (args, tuple(map(type, args)))
+    instance = cache.get(key)
+    if instance is None:
+        if len(cache) >= _FLYWEIGHT_SIZE:
+            cache.clear()
+        instance = cls(*args)
+        instance.__class__ = _shared_class(cls)
+        cache[key] = instance
+    return instance
+
+
+def shared_conditions(conditions: tuple) -> tuple:
+    """
+    Return the shared copy of a cable's installation conditions, so that cables installed under the same conditions
+    hold a single tuple.
+    :param conditions: A tuple of (install_temp, arrangement) pairs indexed by installation method id.
+    :return: The shared tuple.
+    """
+    key = (conditions, tuple(type(install_temp) for install_temp, _ in conditions))
+    shared = _CONDITIONS.get(key)
+    if shared is None:
+        if len(_CONDITIONS) >= _FLYWEIGHT_SIZE:
+            _CONDITIONS.clear()
+        shared = _CONDITIONS[key] = conditions
+    return shared
+
+
+def is_shared(instance) -> bool:
+    """
+    Check if a sub-object is a read only instance shared between cables.
+    """
+    return type(_target(instance)) in _SHARED_BASES
+
+
+def unshare(instance):
+    """
+    Return a private, modifiable copy of a shared sub-object. Instances that are not shared are returned unchanged.
+    """
+    instance = _target(instance)
+    cls = _SHARED_BASES.get(type(instance))
+    if cls is None:
+        return instance
+    copy = cls.__new__(cls)
+    for slot in cls.__slots__:
+        value = getattr(instance, slot)
+        if isinstance(value, Vector):
+            value = Vector(value.magnitude, value.unit)
+        setattr(copy, slot, value)
+    return copy
 
 
 class CableRun:
@@ -26,8 +197,11 @@ class CableRun:
         """
         if cable_list is None:
             cable_list = []
+        elif not isinstance(cable_list, list):
+            cable_list = [cable_list]
         self.cables: list = []
-        self.add_cable(cable_list)
+        for each in cable_list:
+            self.add_cable(each)
         self.circuit_details = Circuit()
         self.conductor = ConductorDetail()
         self.impedance = Impedance()
@@ -44,27 +218,31 @@ class CableRun:
 
     def to_dict(self):
         return {
-            "cables": self.cables,
-            "circuit_details": self.circuit_details,
-            "conductor": self.conductor,
-            "impedance": self.impedance,
+            "cables": [cable.to_dict() for cable in self.cables],
+            "circuit_details": self.circuit_details.to_dict(),
+            "conductor": self.conductor.to_dict(),
+            "impedance": self.impedance.to_dict(),
             "tag": self.tag,
             "length": self.length,
             "description": self.description,
             "supply": self.supply,
             "load": self.load,
             "notes": self.notes,
-            "contracts": self.contracts,
-            "revision": self.revision,
+            "contracts": self.contracts.to_dict(),
+            "revision": self.revision.to_dict(),
+            "required_ccc": self.required_ccc,
             "derate_run": self.derate_run,
         }
 
     def from_dict(self, cable: dict):
-        self.cables = cable["cables"]
+        self.cables = []
+        for details in cable["cables"]:
+            self.add_cable(Cable())
+            self.cables[-1].from_dict(details)
         self.circuit_details.from_dict(cable["circuit_details"])
         self.conductor.from_dict(cable["conductor"])
         self.impedance.from_dict(cable["impedance"])
-        self.tag = cable["tag"] = self.tag
+        self.tag = cable["tag"]
         self.length = cable["length"]
         self.description = cable["description"]
         self.supply = cable["supply"]
@@ -72,6 +250,7 @@ class CableRun:
         self.notes = cable["notes"]
         self.contracts.from_dict(cable["contracts"])
         self.revision.from_dict(cable["revision"])
+        self.required_ccc = cable.get("required_ccc", self.required_ccc)
         self.derate_run = cable["derate_run"]
 
     def add_cable(self, cable):
@@ -174,7 +353,7 @@ class CableSpec:
 
     @type.setter
     def type(self, value: str):
-        self._type = value.upper()
+        self._type = sys.intern(value.upper())
 
     @property
     def max_parallel(self) -> int:
@@ -200,7 +379,7 @@ class CableSpec:
 
     @shape.setter
     def shape(self, value: str):
-        self._shape = value.upper()
+        self._shape = sys.intern(value.upper())
 
     @property
     def conductor_material(self) -> str:
@@ -208,7 +387,7 @@ class CableSpec:
 
     @conductor_material.setter
     def conductor_material(self, value: str):
-        self._conductor_material = value.upper()
+        self._conductor_material = sys.intern(value.upper())
 
     @property
     def min_size(self) -> float:
@@ -226,7 +405,7 @@ class CableSpec:
 
     @core_arrangement.setter
     def core_arrangement(self, value: str):
-        self._core_arrangement = value.upper()
+        self._core_arrangement = sys.intern(value.upper())
 
     @property
     def sheath(self) -> str:
@@ -234,7 +413,7 @@ class CableSpec:
 
     @sheath.setter
     def sheath(self, value: str):
-        self._sheath = value.upper()
+        self._sheath = sys.intern(value.upper())
 
     @property
     def insulation_material(self) -> str:
@@ -242,7 +421,7 @@ class CableSpec:
 
     @insulation_material.setter
     def insulation_material(self, value):
-        self.insulation.material = value.upper()
+        self.insulation.material = sys.intern(value.upper())
 
     @property
     def insulation_code(self) -> str:
@@ -250,7 +429,7 @@ class CableSpec:
 
     @insulation_code.setter
     def insulation_code(self, value: str):
-        self.insulation.code = value.upper()
+        self.insulation.code = sys.intern(value.upper())
 
     @property
     def operating_temp(self) -> int:
@@ -274,7 +453,7 @@ class CableSpec:
 
     @armour.setter
     def armour(self, value: str):
-        self._armour = value.upper()
+        self._armour = sys.intern(value.upper())
 
     @property
     def screen_cable(self) -> str:
@@ -282,7 +461,7 @@ class CableSpec:
 
     @screen_cable.setter
     def screen_cable(self, value: str):
-        self._scn_cable = value.upper()
+        self._scn_cable = sys.intern(value.upper())
 
     @property
     def screen_core(self) -> str:
@@ -290,7 +469,7 @@ class CableSpec:
 
     @screen_core.setter
     def screen_core(self, value: str):
-        self._scn_core = value.upper()
+        self._scn_core = sys.intern(value.upper())
 
     @property
     def volt_rating(self) -> str:
@@ -298,7 +477,7 @@ class CableSpec:
 
     @volt_rating.setter
     def volt_rating(self, value: str):
-        self._volt_rating = value.upper()
+        self._volt_rating = sys.intern(value.upper())
 
     @property
     def flexible(self) -> bool:
@@ -373,6 +552,39 @@ class CableSpec:
 
 
 class Cable:
+    """
+    A single manufacturer's cable. The sub-objects describing the cores, impedance, screens, insulation and revision
+    are shared with every other cable holding the same values, see flyweight(). They are copied on write, see
+    SubObject, so cable.activeCores.size = 16 changes this cable only. A sub-object held in a variable, e.g.
+    cores = cable.activeCores, remains a view of the cable's current sub-object.
+
+    The current carrying capacities are held in a single array indexed by installation method id, see installmethods.
+    The details of each method are available from installation(), or from the attribute named after the method, e.g.
+    unenclosedSpaced.
+    """
+    __slots__ = ("_cable_type", "_activeCores", "_neutralCores", "_earthCores", "_controlCores",
+                 "_instrumentCores", "_communicationCores", "_dataCores", "_impedance", "_cableScreen", "_coreScreen",
+                 "_insulation", "_ccc", "_conditions", "_sheath", "voltage_rating", "flexible", "armour", "_revision",
+                 "description", "_circuit_type", "_c_material", "_c_arrangement", "_shape")
+
+    """The attributes holding shared sub-objects."""
+    SUB_OBJECTS = ("activeCores", "neutralCores", "earthCores", "controlCores", "instrumentCores",
+                   "communicationCores", "dataCores", "impedance", "cableScreen", "coreScreen", "insulation",
+                   "revision")
+
+    activeCores = SubObject("_activeCores")
+    neutralCores = SubObject("_neutralCores")
+    earthCores = SubObject("_earthCores")
+    controlCores = SubObject("_controlCores")
+    instrumentCores = SubObject("_instrumentCores")
+    communicationCores = SubObject("_communicationCores")
+    dataCores = SubObject("_dataCores")
+    impedance = SubObject("_impedance")
+    cableScreen = SubObject("_cableScreen")
+    coreScreen = SubObject("_coreScreen")
+    insulation = SubObject("_insulation")
+    revision = SubObject("_revision")
+
     def __init__(self, cable_type: str = "", active_size: float = 0.0, active_number: int = 0,
                  active_unit: str = "", active_name: str = "", neutral_size: float = 0.0, neutral_number: int = 0,
                  neutral_unit: str = "", neutral_name: str = "", earth_size: float = 0.0, earth_number: int = 0,
@@ -400,7 +612,7 @@ class Cable:
                  max_conductor_temp: int = 0, cable_sheath: str = "", volt_rating: str = "", flexible: bool = False,
                  armour: [None, str] = None, rev_number: str = "", rev_date: datetime = None, description: str = "",
                  core_arrangement: str = "", cable_shape: str = "", conductor_material: str = "",
-                 circuit_type: str = ""
+                 circuit_type: str = "", installations: dict = None
                  ):
         """
         :param cable_type:
@@ -505,43 +717,50 @@ class Cable:
         :param cable_shape:
         :param conductor_material:
         :param circuit_type:
+        :param installations: The (ccc, install_temp, arrangement) of any installation method, keyed by the method name
+        or id. Used for the methods without keyword arguments, see installmethods.
         """
         self.cable_type: str = cable_type
-        self.activeCores = CoreDetails(active_size, active_unit, active_number, active_name)
-        self.neutralCores = CoreDetails(neutral_size, neutral_unit, neutral_number, neutral_name)
-        self.earthCores = CoreDetails(earth_size, earth_unit, earth_number, earth_name)
-        self.controlCores = CoreDetails(control_size, control_unit, control_number, control_name)
-        self.instrumentCores = CoreDetails(instrument_size, instrument_unit, instrument_number, instrument_name)
-        self.communicationCores = CoreDetails(communication_size, communication_unit, communication_number,
-                                              communication_name)
-        self.dataCores = CoreDetails(data_size, data_unit, data_number, data_name)
-        self.impedance = Impedance(mvam, r, r_unit, x, x_unit, z, z_unit)
-        self.cableScreen = Screen(cable_screen_type, cable_screen_withstand)
-        self.coreScreen = Screen(core_screen_type, core_screen_withstand)
-        self.insulation = Insulation(insulation_material, insulation_code, cont_conductor_temp, max_conductor_temp)
-        self.unenclosedSpaced = CableInstallationMethod(unenclosed_spaced_ccc, unenclosed_spaced_install_temp,
-                                                        unenclosed_spaced_arrangement)
-        self.unenclosedSurface = CableInstallationMethod(unenclosed_surface_ccc, unenclosed_surface_install_temp,
-                                                         unenclosed_surface_arrangement)
-        self.unenclosedTouching = CableInstallationMethod(unenclosed_touching_ccc, unenclosed_touching_install_temp,
-                                                          unenclosed_touching_arrangement)
-        self.enclosedConduit = CableInstallationMethod(enclosed_conduit_ccc, enclosed_conduit_install_temp,
-                                                       enclosed_conduit_arrangement,)
-        self.enclosedPartial = CableInstallationMethod(enclosed_partial_ccc, enclosed_partial_install_temp,
-                                                       enclosed_partial_arrangement)
-        self.enclosedComplete = CableInstallationMethod(enclosed_complete_ccc, enclosed_complete_install_temp,
-                                                        enclosed_complete_arrangement)
-        self.buriedDirect = CableInstallationMethod(buried_direct_ccc, buried_direct_install_temp,
-                                                    buried_direct_arrangement)
-        self.ductsSingle = CableInstallationMethod(ducts_single_ccc, ducts_single_install_temp,
-                                                   ducts_single_arrangement)
-        self.ductsPerCable = CableInstallationMethod(ducts_per_cable_ccc, ducts_per_cable_install_temp,
-                                                     ducts_per_cable_arrangement)
+        self._activeCores = flyweight(CoreDetails, active_size, active_unit, active_number, active_name)
+        self._neutralCores = flyweight(CoreDetails, neutral_size, neutral_unit, neutral_number, neutral_name)
+        self._earthCores = flyweight(CoreDetails, earth_size, earth_unit, earth_number, earth_name)
+        self._controlCores = flyweight(CoreDetails, control_size, control_unit, control_number, control_name)
+        self._instrumentCores = flyweight(CoreDetails, instrument_size, instrument_unit, instrument_number,
+                                         instrument_name)
+        self._communicationCores = flyweight(CoreDetails, communication_size, communication_unit, communication_number,
+                                            communication_name)
+        self._dataCores = flyweight(CoreDetails, data_size, data_unit, data_number, data_name)
+        self._impedance = flyweight(Impedance, mvam, r, r_unit, x, x_unit, z, z_unit)
+        self._cableScreen = flyweight(Screen, cable_screen_type, cable_screen_withstand)
+        self._coreScreen = flyweight(Screen, core_screen_type, core_screen_withstand)
+        self._insulation = flyweight(Insulation, insulation_material, insulation_code, cont_conductor_temp,
+                                    max_conductor_temp)
+        ccc = [0] * installmethods.COUNT
+        conditions = [_BLANK_CONDITION] * installmethods.COUNT
+        for method_id, details in zip(_KEYWORD_METHODS, (
+                (unenclosed_spaced_ccc, unenclosed_spaced_install_temp, unenclosed_spaced_arrangement),
+                (unenclosed_surface_ccc, unenclosed_surface_install_temp, unenclosed_surface_arrangement),
+                (unenclosed_touching_ccc, unenclosed_touching_install_temp, unenclosed_touching_arrangement),
+                (enclosed_conduit_ccc, enclosed_conduit_install_temp, enclosed_conduit_arrangement),
+                (enclosed_partial_ccc, enclosed_partial_install_temp, enclosed_partial_arrangement),
+                (enclosed_complete_ccc, enclosed_complete_install_temp, enclosed_complete_arrangement),
+                (buried_direct_ccc, buried_direct_install_temp, buried_direct_arrangement),
+                (ducts_single_ccc, ducts_single_install_temp, ducts_single_arrangement),
+                (ducts_per_cable_ccc, ducts_per_cable_install_temp, ducts_per_cable_arrangement))):
+            ccc[method_id] = details[0]
+            conditions[method_id] = (details[1], sys.intern(details[2].upper()))
+        if installations:
+            for method, details in installations.items():
+                method_id = installmethods.method_id(method)
+                ccc[method_id] = details[0]
+                conditions[method_id] = (details[1], sys.intern(details[2].upper()))
+        self._ccc = array("d", ccc)
+        self._conditions = shared_conditions(tuple(conditions))
         self.sheath = cable_sheath
         self.voltage_rating: str = volt_rating
         self.flexible: bool = flexible
         self.armour: [None, bool] = armour
-        self.revision = RevisionDetail(rev_number, rev_date)
+        self._revision = flyweight(RevisionDetail, rev_number, rev_date)
         self.description = description
         self.circuit_type = circuit_type
         self.conductor_material = conductor_material
@@ -554,7 +773,7 @@ class Cable:
 
     @cable_type.setter
     def cable_type(self, value: str):
-        self._cable_type = value.upper()
+        self._cable_type = sys.intern(value.upper())
 
     @property
     def circuit_type(self) -> str:
@@ -562,7 +781,7 @@ class Cable:
 
     @circuit_type.setter
     def circuit_type(self, value: str):
-        self._circuit_type = value.upper()
+        self._circuit_type = sys.intern(value.upper())
 
     @property
     def core_arrangement(self) -> str:
@@ -570,7 +789,7 @@ class Cable:
 
     @core_arrangement.setter
     def core_arrangement(self, value: str):
-        self._c_arrangement = value.upper()
+        self._c_arrangement = sys.intern(value.upper())
 
     @property
     def shape(self) -> str:
@@ -578,7 +797,7 @@ class Cable:
 
     @shape.setter
     def shape(self, value):
-        self._shape = value.upper()
+        self._shape = sys.intern(value.upper())
 
     @property
     def conductor_material(self) -> str:
@@ -586,7 +805,7 @@ class Cable:
 
     @conductor_material.setter
     def conductor_material(self, value):
-        self._c_material = value.upper()
+        self._c_material = sys.intern(value.upper())
 
     @property
     def sheath(self) -> str:
@@ -594,127 +813,153 @@ class Cable:
 
     @sheath.setter
     def sheath(self, value: str):
-        self._sheath = value.upper()
+        self._sheath = sys.intern(value.upper())
 
     @property
     def csa(self) -> dict:
         """
         A simple getter for the CSA of each conductor in the cable. THERE IS NO SIMILAR GETTER PROPERTY FOR
-        CROSS-SECTIONAL AREA.
+        CROSS-SECTIONAL AREA. The sizes are in each core's own unit, see csa_mm2 for sizes that can be compared.
         :return: dict containing the CSA details
         """
-        return {"POWER": self.activeCores.size,
-                "NEUTRAL": self.neutralCores.size,
-                "EARTH": self.earthCores.size,
-                "CONTROL": self.controlCores.size,
-                "INSTRUMENT": self.instrumentCores.size,
-                "DATA": self.dataCores.size,
-                "COMMUNICATION": self.communicationCores.size
-                }
+        return dict(zip(csa.ROLES, (cores.size for cores in self._role_cores())))
 
-    def installation_ccc(self, install_method: str) -> Union[float, int]:
+    @property
+    def csa_mm2(self) -> Tuple[float, ...]:
+        """
+        The CSA of each conductor role normalised to mm², in csa.ROLES order, i.e. the cable's row of a CSAMatrix.
+        """
+        return tuple(csa.to_mm2(cores.size, cores.unit) for cores in self._role_cores())
+
+    def _role_cores(self) -> tuple:
+        return (self._activeCores, self._neutralCores, self._earthCores, self._controlCores, self._instrumentCores,
+                self._dataCores, self._communicationCores)
+
+    def installation(self, install_method: Union[str, int]) -> "BoundInstallationMethod":
+        """
+        The details of a single installation method. Changes to the returned object are made to the cable.
+        :param install_method: The installation method name or id.
+        :return: BoundInstallationMethod
+        """
+        return BoundInstallationMethod(self, installmethods.method_id(install_method))
+
+    def set_installation(self, install_method: Union[str, int], ccc: float = 0, install_temp: int = 0,
+                         arrangement: str = ""):
+        """
+        Set the details of a single installation method.
+        :param install_method: The installation method name or id.
+        :param ccc: The current carrying capacity.
+        :param install_temp: The ambient temperature associated with the current carrying capacity.
+        :param arrangement: The single core cable arrangement associated with the installation method.
+        """
+        method_id = installmethods.method_id(install_method)
+        self._set_ccc(method_id, ccc)
+        self._set_condition(method_id, install_temp, arrangement)
+
+    def _set_ccc(self, method_id: int, ccc: float):
+        self._ccc[method_id] = ccc
+
+    def _set_condition(self, method_id: int, install_temp: int, arrangement: str):
+        conditions = list(self._conditions)
+        conditions[method_id] = (install_temp, sys.intern(arrangement.upper()))
+        self._conditions = shared_conditions(tuple(conditions))
+
+    def installation_ccc(self, install_method: Union[str, int]) -> Union[float, None]:
         """
         Find the current carrying capacity for the cable for a given installation method.
         :param install_method: The cable installation method associated with the current carrying capacity.
-        :return:
+        :return: The current carrying capacity, or None if the installation method is unknown.
         """
-        if install_method.upper() in ["UNENCLOSED_SPACED", "UNENCLOSEDSPACED"]:
-            return self.unenclosedSpaced.ccc
-        elif install_method.upper() in ["UNENCLOSED_SURFACE", "UNENCLOSEDSURFACE"]:
-            return self.unenclosedSurface.ccc
-        elif install_method.upper() in ["UNENCLOSED_TOUCHING", "UNENCLOSEDTOUCHING"]:
-            return self.unenclosedTouching.ccc
-        elif install_method.upper() in ["ENCLOSED_CONDUIT", "ENCLOSEDCONDUIT"]:
-            return self.enclosedConduit.ccc
-        elif install_method.upper() in ["ENCLOSED_PARTIAL", "ENCLOSEDPARTIAL"]:
-            return self.enclosedPartial.ccc
-        elif install_method.upper() in ["ENCLOSED_COMPLETE", "ENCLOSEDCOMPLETE"]:
-            return self.enclosedComplete.ccc
-        elif install_method.upper() in ["BURIED_DIRECT", "BURIEDDIRECT"]:
-            return self.buriedDirect.ccc
-        elif install_method.upper() in ["DUCTS_SINGLE", "DUCTSSINGLE"]:
-            return self.ductsSingle.ccc
-        elif install_method.upper() in ["DUCTS_PER_CABLE", "DUCTSPERCABLE"]:
-            return self.ductsPerCable.ccc
+        method_id = installmethods.find(install_method)
+        if method_id is None:
+            return None
+        return self._ccc[method_id]
+
+    def installation_ccc_many(self, method_ids: Iterable[int]) -> array:
+        """
+        Find the current carrying capacity of the cable for a number of installation methods.
+        :param method_ids: The installation method ids, see installmethods.method_ids().
+        :return: An array of the current carrying capacities, in the order of method_ids.
+        """
+        ccc = self._ccc
+        return array("d", [ccc[method_id] for method_id in method_ids])
 
     @property
     def mvam(self) -> float:
-        return self.impedance.mvam
+        return self._impedance.mvam
 
     @mvam.setter
     def mvam(self, value: float):
         self.impedance.mvam = value
 
+    def unshare(self):
+        """
+        Replace the sub-objects shared with other cables by private copies, so that they can be modified.
+        """
+        for attribute in self.SUB_OBJECTS:
+            slot = f"_{attribute}"
+            setattr(self, slot, unshare(getattr(self, slot)))
+
     def has_active(self):
-        return self.activeCores.number > 0
+        return self._activeCores.number > 0
 
     def has_neutral(self):
-        return self.neutralCores.number > 0
+        return self._neutralCores.number > 0
 
     def has_earth(self):
-        return self.earthCores.number > 0
+        return self._earthCores.number > 0
 
     def to_dict(self):
-        return {"cable_type": self.cable_type,
-                "active_cores": self.activeCores.to_dict(),
-                "neutral_cores": self.neutralCores.to_dict(),
-                "earth_cores": self.earthCores.to_dict(),
-                "instrument_cores": self.instrumentCores.to_dict(),
-                "control_cores": self.controlCores.to_dict(),
-                "communication_cores": self.communicationCores.to_dict(),
-                "data_cores": self.dataCores.to_dict(),
-                "unenclosed_spaced": self.unenclosedSpaced.to_dict(),
-                "unenclosed_surface": self.unenclosedSurface.to_dict(),
-                "unenclosed_touching": self.unenclosedTouching.to_dict(),
-                "enclosed_conduit": self.enclosedConduit.to_dict(),
-                "enclosed_partial": self.enclosedPartial.to_dict(),
-                "enclosed_complete": self.enclosedComplete.to_dict(),
-                "buried_direct": self.buriedDirect.to_dict(),
-                "ducts_single": self.ductsSingle.to_dict(),
-                "ducts_per_cable": self.ductsPerCable.to_dict(),
-                "impedance": self.impedance.to_dict(),
-                "cable_screen": self.cableScreen.to_dict(),
-                "core_screen": self.coreScreen.to_dict(),
-                "insulation": self.insulation.to_dict(),
-                "sheath": self.sheath,
-                "volt_rating": self.voltage_rating,
-                "flexible": self.flexible,
-                "armour": self.armour,
-                "revision": self.revision.to_dict(),
-                "description": self.description,
-                "circuit_type": self.circuit_type,
-                "conductor_material": self.conductor_material,
-                "core_arrangement": self.core_arrangement,
-                "cable_shape": self.shape,
-                }
+        details = {"cable_type": self.cable_type,
+                   "active_cores": self._activeCores.to_dict(),
+                   "neutral_cores": self._neutralCores.to_dict(),
+                   "earth_cores": self._earthCores.to_dict(),
+                   "instrument_cores": self._instrumentCores.to_dict(),
+                   "control_cores": self._controlCores.to_dict(),
+                   "communication_cores": self._communicationCores.to_dict(),
+                   "data_cores": self._dataCores.to_dict(),
+                   "impedance": self._impedance.to_dict(),
+                   "cable_screen": self._cableScreen.to_dict(),
+                   "core_screen": self._coreScreen.to_dict(),
+                   "insulation": self._insulation.to_dict(),
+                   "sheath": self.sheath,
+                   "volt_rating": self.voltage_rating,
+                   "flexible": self.flexible,
+                   "armour": self.armour,
+                   "revision": self._revision.to_dict(),
+                   "description": self.description,
+                   "circuit_type": self.circuit_type,
+                   "conductor_material": self.conductor_material,
+                   "core_arrangement": self.core_arrangement,
+                   "cable_shape": self.shape,
+                   }
+        for method in installmethods.METHODS:
+            details[method.name] = self.installation(method.id).to_dict()
+        return details
 
     def from_dict(self, cable_dict: dict):
+        self.unshare()
         self.cable_type = cable_dict["cable_type"]
-        self.activeCores.from_dict(cable_dict["active_cores"])
-        self.neutralCores.from_dict(cable_dict["neutral_cores"])
-        self.earthCores.from_dict(cable_dict["earth_cores"])
-        self.instrumentCores.from_dict(cable_dict["instrument_cores"])
-        self.controlCores.from_dict(cable_dict["control_cores"])
-        self.communicationCores.from_dict(cable_dict["communication_cores"])
-        self.dataCores.from_dict(cable_dict["data_cores"])
-        self.unenclosedSpaced.from_dict(cable_dict["unenclosed_spaced"])
-        self.unenclosedSurface.from_dict(cable_dict["unenclosed_surface"])
-        self.unenclosedTouching.from_dict(cable_dict["unenclosed_touching"])
-        self.enclosedConduit.from_dict(cable_dict["enclosed_conduit"])
-        self.enclosedPartial.from_dict(cable_dict["enclosed_partial"])
-        self.enclosedComplete.from_dict(cable_dict["enclosed_complete"])
-        self.buriedDirect.from_dict(cable_dict["buried_direct"])
-        self.ductsSingle.from_dict(cable_dict["ducts_single"])
-        self.ductsPerCable.from_dict(cable_dict["ducts_per_cable"])
-        self.impedance.from_dict(cable_dict["impedance"])
-        self.cableScreen.from_dict(cable_dict["cable_screen"])
-        self.coreScreen.from_dict(cable_dict["core_screen"])
-        self.insulation.from_dict(cable_dict["insulation"])
+        self._activeCores.from_dict(cable_dict["active_cores"])
+        self._neutralCores.from_dict(cable_dict["neutral_cores"])
+        self._earthCores.from_dict(cable_dict["earth_cores"])
+        self._instrumentCores.from_dict(cable_dict["instrument_cores"])
+        self._controlCores.from_dict(cable_dict["control_cores"])
+        self._communicationCores.from_dict(cable_dict["communication_cores"])
+        self._dataCores.from_dict(cable_dict["data_cores"])
+        for method in installmethods.METHODS:
+            details = cable_dict.get(method.name)
+            if details is not None:
+                self.set_installation(method.id, details["ccc"], details["install_temp"], details["arrangement"])
+        self._impedance.from_dict(cable_dict["impedance"])
+        self._cableScreen.from_dict(cable_dict["cable_screen"])
+        self._coreScreen.from_dict(cable_dict["core_screen"])
+        self._insulation.from_dict(cable_dict["insulation"])
         self.sheath = cable_dict["sheath"]
         self.voltage_rating = cable_dict["volt_rating"]
         self.flexible = cable_dict["flexible"]
         self.armour = cable_dict["armour"]
-        self.revision.from_dict(cable_dict["revision"])
+        self._revision.from_dict(cable_dict["revision"])
         self.description = cable_dict["description"]
         self.circuit_type = cable_dict["circuit_type"]
         self.conductor_material = cable_dict["conductor_material"]
@@ -745,7 +990,7 @@ class ConductorDetail:
 
     @unit.setter
     def unit(self, unit: str):
-        self._size_unit = unit.upper()
+        self._size_unit = sys.intern(unit.upper())
 
     def to_dict(self):
         return {'size': self.size, 'key': self.unit}
@@ -790,6 +1035,8 @@ class ConductorCableRun:
 
 
 class RevisionDetail:
+    __slots__ = ("_number", "_date")
+
     def __init__(self, number: str = '', date: datetime.datetime = None):
         self.number = number
         self.date = date
@@ -800,7 +1047,7 @@ class RevisionDetail:
 
     @number.setter
     def number(self, value: str):
-        self._number = value.upper()
+        self._number = sys.intern(value.upper())
 
     @property
     def date(self) -> [None, datetime.datetime]:
@@ -822,6 +1069,8 @@ class RevisionDetail:
 
 
 class Impedance:
+    __slots__ = ("_mvam", "_r", "_x", "_z")
+
     def __init__(self, mvam: float = 0.0,
                  r: float = 0.0, r_unit: str = '',
                  x: float = 0.0, x_unit: str = '',
@@ -868,7 +1117,7 @@ class Impedance:
 
     @r_unit.setter
     def r_unit(self, unit: str):
-        self._r.unit = unit.upper()
+        self._r.unit = sys.intern(unit.upper())
 
     @property
     def x(self) -> float:
@@ -884,7 +1133,7 @@ class Impedance:
 
     @x_unit.setter
     def x_unit(self, unit: str):
-        self._x.unit = unit.upper()
+        self._x.unit = sys.intern(unit.upper())
 
     @property
     def z(self) -> float:
@@ -933,6 +1182,8 @@ class Impedance:
 
 
 class Insulation:
+    __slots__ = ("_material", "_code", "_op_temp", "_max_temp")
+
     def __init__(self, insulation_material: str = "", insulation_code: str = '', op_temp: int = 0, max_temp: int = 0):
         """
         :param insulation_material: The cable_list's insulation material.
@@ -950,7 +1201,7 @@ class Insulation:
 
     @material.setter
     def material(self, value):
-        self._material = value.upper()
+        self._material = sys.intern(value.upper())
 
     @property
     def code(self) -> str:
@@ -958,7 +1209,7 @@ class Insulation:
 
     @code.setter
     def code(self, code: str):
-        self._code = code.upper()
+        self._code = sys.intern(code.upper())
 
     @property
     def op_temp(self) -> int:
@@ -1012,7 +1263,7 @@ class Contracts:
 
     @supply.setter
     def supply(self, supplier: str):
-        self._supply = supplier.upper()
+        self._supply = sys.intern(supplier.upper())
 
     @property
     def install(self) -> str:
@@ -1020,7 +1271,7 @@ class Contracts:
 
     @install.setter
     def install(self, installer: str):
-        self._install = installer.upper()
+        self._install = sys.intern(installer.upper())
 
     @property
     def connect(self) -> str:
@@ -1028,7 +1279,7 @@ class Contracts:
 
     @connect.setter
     def connect(self, connecter: str):
-        self._connect = connecter.upper()
+        self._connect = sys.intern(connecter.upper())
 
     def to_dict(self) -> dict:
         return {'supply': self.supply,
@@ -1071,7 +1322,7 @@ class Circuit:
 
     @circuit_type.setter
     def circuit_type(self, value: str):
-        self._type = value.upper()
+        self._type = sys.intern(value.upper())
 
     @property
     def load_current(self) -> float:
@@ -1098,6 +1349,8 @@ class Vector:
     """
     A simple class to represent a magnitude, key vector pair.
     """
+    __slots__ = ("_scalar", "_unit")
+
     def __init__(self, magnitude=None, unit: str = ''):
         self.magnitude = magnitude
         self.unit = unit
@@ -1116,7 +1369,7 @@ class Vector:
 
     @unit.setter
     def unit(self, unit: str):
-        self._unit = unit.upper()
+        self._unit = sys.intern(unit.upper())
 
     def to_dict(self) -> dict:
         return {"magnitude": self.magnitude, "key": self.unit}
@@ -1143,7 +1396,7 @@ class InstallationMethod:
         if installation is None:
             self._physical_installation = installation
         else:
-            self._physical_installation = installation.upper()
+            self._physical_installation = sys.intern(installation.upper())
 
     @property
     def cable_arrangement(self) -> str:
@@ -1154,7 +1407,7 @@ class InstallationMethod:
         if arrangement is None:
             self._cable_arrangement = arrangement
         else:
-            self._cable_arrangement = arrangement.upper()
+            self._cable_arrangement = sys.intern(arrangement.upper())
 
     def to_dict(self) -> dict:
         x: dict = dict()
@@ -1182,7 +1435,7 @@ class Frequency:
 
     @waveform.setter
     def waveform(self, wf: str):
-        self._wf = wf.upper()
+        self._wf = sys.intern(wf.upper())
 
     @property
     def frequency(self) -> int:
@@ -1198,7 +1451,7 @@ class Frequency:
 
     @unit.setter
     def unit(self, unit: str):
-        self._unit = unit.upper()
+        self._unit = sys.intern(unit.upper())
 
     def to_dict(self) -> dict:
         return {
@@ -1245,7 +1498,7 @@ class Voltage:
 
     @unit.setter
     def unit(self, unit: str):
-        self._unit = unit.upper()
+        self._unit = sys.intern(unit.upper())
 
     @property
     def neutral_required(self) -> bool:
@@ -1271,6 +1524,8 @@ class Voltage:
 
 
 class CoreDetails:
+    __slots__ = ("_csa", "_csa_unit", "_number", "_name")
+
     def __init__(self, csa: float = 0, csa_unit: str = "", number: int = 0, name: str = ""):
         """
         This class defines and checks the details of a cable_list core.
@@ -1298,7 +1553,7 @@ class CoreDetails:
 
     @unit.setter
     def unit(self, value: str):
-        self._csa_unit = value.upper()
+        self._csa_unit = sys.intern(value.upper())
 
     @property
     def number(self) -> int:
@@ -1314,7 +1569,7 @@ class CoreDetails:
 
     @name.setter
     def name(self, value: str):
-        self._name = value.upper()
+        self._name = sys.intern(value.upper())
 
     def to_dict(self) -> dict:
         """
@@ -1336,6 +1591,8 @@ class CoreDetails:
 
 
 class CableInstallationMethod:
+    __slots__ = ("_ccc", "_temp", "_cable_arrangement")
+
     def __init__(self, ccc: int = 0, install_temp: int = 0, cable_arrangement: str = ""):
         """
         This class defines and checks the details of the cable_list installation details.
@@ -1369,7 +1626,7 @@ class CableInstallationMethod:
 
     @cable_arrangement.setter
     def cable_arrangement(self, value: str):
-        self._cable_arrangement = value.upper()
+        self._cable_arrangement = sys.intern(value.upper())
 
     def to_dict(self) -> dict:
         """
@@ -1388,7 +1645,68 @@ class CableInstallationMethod:
         self.cable_arrangement = details["arrangement"]
 
 
+class BoundInstallationMethod(CableInstallationMethod):
+    """
+    The details of one installation method of a cable. The details are read from, and written to, the cable's capacity
+    array and installation conditions, see Cable.installation().
+    """
+    __slots__ = ("_cable", "_id")
+
+    def __init__(self, cable: "Cable", method_id: int):
+        """
+        :param cable: The cable.
+        :param method_id: The installation method id, see installmethods.
+        """
+        self._cable = cable
+        self._id = method_id
+
+    @property
+    def method(self) -> installmethods.InstallMethod:
+        return installmethods.METHODS[self._id]
+
+    @property
+    def ccc(self) -> float:
+        return self._cable._ccc[self._id]
+
+    @ccc.setter
+    def ccc(self, value: float):
+        self._cable._set_ccc(self._id, value)
+
+    @property
+    def install_temp(self) -> int:
+        return self._cable._conditions[self._id][0]
+
+    @install_temp.setter
+    def install_temp(self, value: int):
+        self._cable._set_condition(self._id, value, self.cable_arrangement)
+
+    @property
+    def cable_arrangement(self) -> str:
+        return self._cable._conditions[self._id][1]
+
+    @cable_arrangement.setter
+    def cable_arrangement(self, value: str):
+        self._cable._set_condition(self._id, self.install_temp, value)
+
+
+def _installation_property(method: installmethods.InstallMethod) -> property:
+    def getter(self) -> BoundInstallationMethod:
+        return BoundInstallationMethod(self, method.id)
+
+    def setter(self, value: CableInstallationMethod):
+        self.set_installation(method.id, value.ccc, value.install_temp, value.cable_arrangement)
+
+    return property(getter, setter, doc=f"The details of the {method.name} installation method.")
+
+
+for _method in installmethods.METHODS:
+    setattr(Cable, _method.attribute, _installation_property(_method))
+del _method
+
+
 class Screen:
+    __slots__ = ("_name", "_fault_withstand")
+
     def __init__(self, name: str = "", fault_withstand: int = 0):
         self.name: str = name
         self.fault_withstand: int = fault_withstand
@@ -1399,7 +1717,7 @@ class Screen:
 
     @name.setter
     def name(self, value: str):
-        self._name = value.upper()
+        self._name = sys.intern(value.upper())
 
     @property
     def fault_withstand(self):
@@ -1428,7 +1746,7 @@ class Manufacturer:
 
     @name.setter
     def name(self, value: str):
-        self._name = value.upper()
+        self._name = sys.intern(value.upper())
 
     @property
     def part_number(self) -> str:
@@ -1436,7 +1754,7 @@ class Manufacturer:
 
     @part_number.setter
     def part_number(self, value: str):
-        self._number = value.upper()
+        self._number = sys.intern(value.upper())
 
     def to_dict(self):
         return {'name': self.name, 'part_number': self.part_number}
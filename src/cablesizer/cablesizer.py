@@ -1,6 +1,48 @@
 #
 #
+import concurrent.futures as futures
+import heapq
 import json
+import math
+import os
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import CableSizer.cable as cable
+import CableSizer.cataloguecache as cataloguecache
+import CableSizer.indexes as indexes
+import CableSizer.resultstore as resultstore
+import CableSizer.sizingcache as sizingcache
+
+
+def filter_catalogue(catalogue, spec) -> int:
+    """
+    Apply the categorical criteria of a cable specification to a catalogue. This is the filter stage of
+    select_cable_from_database() and is answered from the catalogue's bitmap index.
+    :param catalogue: The CableCatalogue to filter.
+    :param spec: The CableSpec containing the selection criteria.
+    :return: A bitset of the matching catalogue rows.
+    """
+    return catalogue.bitmap_index.query(spec)
+
+
+def find_smallest_cable(catalogue, run, spec, install_method: str) -> Optional[int]:
+    """
+    Find the catalogue row with the smallest current carrying capacity that meets the cable run's required current
+    carrying capacity and the specification's criteria. The specification's min_size is compared in mm², see
+    CSAMatrix, as by select_cable_from_database().
+    :param catalogue: The CableCatalogue to search.
+    :param run: The CableRun. Its required_ccc is used as the minimum current carrying capacity.
+    :param spec: The CableSpec containing the selection criteria.
+    :param install_method: The cable installation method.
+    :return: The catalogue row number, or None if no cable is suitable.
+    """
+    bitset = filter_catalogue(catalogue, spec)
+    if spec.min_size:
+        bitset = catalogue.csa_matrix.at_least("POWER", spec.min_size, bitset)
+    return catalogue.ampacity_index.smallest(install_method, run.required_ccc, bitset)
 
 
 def determine_electrical_load(load, unit, voltage, phases):
@@ -20,32 +62,784 @@ def determine_electrical_load(load, unit, voltage, phases):
     pass
 
 
-def select_cable_from_database():
-    """
-
-    runType: string
-    cableArmour: string
-    cableArrangement: string
-    cableFlexible: bool
-    cableInsulationCode: string
-    cableMultiCoreMax: string
-    cableMultiCoreMin: string
-    cableMaxParallelRuns: bool
-    cableScreen: string
-    cableShape: string
-    cableSheath: string
-    cableSingleCoreMin: string
-    cableSingleCoreMax: string
-    cableType: string
-    cableVoltRating: string
-    conductorMaterial: string
-    coreArrangement: string
-    allowSingleCore: bool
-    allowParallelMulti: bool
-    coreScreen: string
-    manufacturerName: string
-    neutralSize: float
-    runDerating
+class Selection(NamedTuple):
+    """
+    The cable selected for a cable run.
+    row: The catalogue row of the selected cable, or None if no cable is suitable.
+    parallel: The number of cables installed in parallel, or 0 if no cable is suitable.
+    ccc: The current carrying capacity of each cable.
+    vd: The voltage drop across the run in volts, calculated from the cable's mV/A.m.
+    """
+    row: Optional[int]
+    parallel: int
+    ccc: float
+    vd: float
 
-    :return:
+
+"""The result for a run that no cable in the catalogue is suitable for."""
+NO_SELECTION = Selection(None, 0, 0.0, 0.0)
+
+"""The core arrangement of single core cables. Only single core cables are run in parallel unless the specification
+allows parallel multicore cables."""
+SINGLE_CORE = "1C"
+
+"""A candidate cable: its active conductor size in mm², current carrying capacity, mV/A.m and catalogue row."""
+Candidate = Tuple[float, float, float, int]
+
+
+def _filter_key(spec) -> tuple:
+    """
+    The specification attributes that decide which catalogue rows may be selected, see filter_catalogue().
+    """
+    return tuple(getattr(spec, attribute) for attribute in indexes.SPEC_COLUMNS) + (spec.flexible, spec.min_size)
+
+
+def _frontier(catalogue, bitset: int, column: str) -> List[Candidate]:
+    """
+    The candidate cables that are not dominated by another candidate, in ascending order of active conductor size. A
+    cable is dominated if another cable that is no larger has at least its current carrying capacity and no more than
+    its voltage drop, since the other cable is selected wherever this one would be. A catalogue holds only a handful of
+    undominated cables for each specification and installation method, so a run is checked against those alone.
+    :param catalogue: The CableCatalogue.
+    :param bitset: The rows that may be selected.
+    :param column: The installation method's catalogue column prefix.
+    :return: The candidates.
+    """
+    size = catalogue.csa_matrix.column("POWER")
+    ccc = catalogue.column(f"{column}_current")
+    mvam = catalogue.column("impedance_MVAM")
+    rows = sorted((size[row], -ccc[row], mvam[row], row) for row in indexes.iter_rows(bitset) if ccc[row] > 0)
+    frontier: List[Candidate] = []
+    for csa, capacity, impedance, row in rows:
+        capacity = -capacity
+        if not any(kept[1] >= capacity and kept[2] <= impedance for kept in frontier):
+            frontier.append((csa, capacity, impedance, row))
+    return frontier
+
+
+def _smallest(frontier: List[Candidate], required_ccc: float, max_mvam: float, end: int = None) -> Optional[int]:
+    """
+    The position of the smallest candidate meeting a current carrying capacity and mV/A.m.
+    :param end: Only the candidates before this position are checked.
+    :return: The position in the frontier, or None if no candidate is suitable.
+    """
+    for position in range(len(frontier) if end is None else end):
+        candidate = frontier[position]
+        if candidate[1] >= required_ccc and candidate[2] <= max_mvam:
+            return position
+    return None
+
+
+class _Frontiers:
+    """
+    The frontier of candidate cables for each distinct (specification filter, installation method, parallel) seen in
+    a batch, so the catalogue is only filtered and scanned once for each.
+    """
+    def __init__(self, catalogue, install_method: str = None):
+        self.catalogue = catalogue
+        self._install_method = install_method
+        self.mvam = catalogue.column("impedance_MVAM")
+        self._filters: Dict[tuple, int] = {}
+        self._frontiers: Dict[tuple, List[Candidate]] = {}
+        self._columns: Dict[str, str] = {}
+        self._specs: Dict[int, tuple] = {}
+        self._single_core: Optional[int] = None
+
+    def _keys(self, spec) -> tuple:
+        """
+        The (spec, filter key, fingerprint) of a specification, calculated once for each specification in the batch.
+        The spec is held so that its id is not reused.
+        """
+        held = self._specs.get(id(spec))
+        if held is None or held[0] is not spec:
+            held = self._specs[id(spec)] = (spec, _filter_key(spec), spec_fingerprint(spec))
+        return held
+
+    def forget(self, spec):
+        """
+        Drop the keys calculated for a specification, after it has been changed.
+        """
+        self._specs.pop(id(spec), None)
+
+    def fingerprint(self, spec) -> tuple:
+        """
+        The specification's fingerprint, see spec_fingerprint().
+        """
+        return self._keys(spec)[2]
+
+    def column(self, run) -> str:
+        """
+        The catalogue column prefix of a run's installation method.
+        """
+        method = run.circuit_details.installation.physical_installation or self._install_method
+        if not method:
+            raise ValueError(f"Cable run ({run.tag}) has no installation method.")
+        column = self._columns.get(method)
+        if column is None:
+            column = self._columns[method] = indexes.normalise_install_method(method)
+        return column
+
+    def _bitset(self, spec, key: tuple) -> int:
+        bitset = self._filters.get(key)
+        if bitset is None:
+            bitset = filter_catalogue(self.catalogue, spec)
+            if spec.min_size:
+                bitset = self.catalogue.csa_matrix.at_least("POWER", spec.min_size, bitset)
+            self._filters[key] = bitset
+        return bitset
+
+    def get(self, spec, column: str, parallel: bool) -> List[Candidate]:
+        """
+        The frontier for a specification and installation method.
+        :param spec: The CableSpec.
+        :param column: The installation method's catalogue column prefix.
+        :param parallel: Restrict the candidates to cables that may be run in parallel.
+        """
+        key = self._keys(spec)[1]
+        single_core = parallel and not spec.allow_parallel_multicore
+        frontier_key = (key, column, single_core)
+        frontier = self._frontiers.get(frontier_key)
+        if frontier is None:
+            bitset = self._bitset(spec, key)
+            if single_core:
+                if self._single_core is None:
+                    self._single_core = self.catalogue.bitmap_index.bitmap("cableCoreArrangement", SINGLE_CORE)
+                bitset &= self._single_core
+            frontier = self._frontiers[frontier_key] = _frontier(self.catalogue, bitset, column)
+        return frontier
+
+
+def _load_current(run) -> float:
+    """
+    The run's load current, taken from its required current carrying capacity if the circuit's is not set.
+    """
+    return run.circuit_details.load_current or run.required_ccc * run.derate_run
+
+
+def _drop_factor(load_current: float, length: float) -> float:
+    """
+    The voltage drop in volts per mV/A.m of a single cable carrying a load current, i.e. I x L / 1000.
+    """
+    return load_current * length / 1000
+
+
+def _max_mvam(vd_max: float, factor: float, parallel: int) -> float:
+    return vd_max * parallel / factor if vd_max and factor else math.inf
+
+
+def _selection(candidate: Candidate, parallel: int, factor: float) -> Selection:
+    return Selection(candidate[3], parallel, candidate[1], candidate[2] * factor / parallel)
+
+
+def _select(frontiers: _Frontiers, spec, column: str, required_ccc: float, factor: float,
+            vd_max: float = None) -> Selection:
+    if vd_max is None:
+        vd_max = spec.vd_max
+    for parallel in range(1, spec.max_parallel + 1):
+        frontier = frontiers.get(spec, column, parallel > 1)
+        found = _smallest(frontier, required_ccc / parallel, _max_mvam(vd_max, factor, parallel))
+        if found is not None:
+            return _selection(frontier[found], parallel, factor)
+    return NO_SELECTION
+
+
+def _select_cheapest(frontiers: _Frontiers, spec, column: str, required_ccc: float, factor: float,
+                     vd_max: float = None) -> Selection:
+    """
+    Select the number of parallel cables, and the cable, with the least total active conductor area. Each added cable
+    divides the current carried by every cable and relaxes the mV/A.m limit, so the smallest suitable cable for n + 1
+    cables is never larger than the one for n cables: it is found by checking only the candidates before the previous
+    one. The search stops once n times the smallest candidate is no cheaper than the best selection found.
+    :param vd_max: The voltage drop allowed across the run, if not the specification's vd_max.
+    """
+    if vd_max is None:
+        vd_max = spec.vd_max
+    best, best_cost = NO_SELECTION, math.inf
+    frontier, end = None, None
+    for parallel in range(1, spec.max_parallel + 1):
+        candidates = frontiers.get(spec, column, parallel > 1)
+        if candidates is not frontier:
+            frontier, end = candidates, None
+        if not frontier or parallel * frontier[0][0] >= best_cost:
+            if parallel > 1:
+                break
+            continue
+        found = _smallest(frontier, required_ccc / parallel, _max_mvam(vd_max, factor, parallel), end)
+        if found is None:
+            continue
+        end = found + 1
+        cost = parallel * frontier[found][0]
+        if cost < best_cost:
+            best, best_cost = _selection(frontier[found], parallel, factor), cost
+    return best
+
+
+"""The selection made for each run by select_cable_from_database(): the fewest cables, or the least total active
+conductor area."""
+_SELECTORS = {
+    "parallel": _select,
+    "csa": _select_cheapest,
+}
+
+
+def spec_fingerprint(spec) -> tuple:
+    """
+    The specification attributes that decide the cable selected for a run, as a hashable tuple. Specifications with
+    equal fingerprints select the same cable for the same run.
+    :param spec: The CableSpec, or FrozenCableSpec.
+    :return: tuple
+    """
+    return _filter_key(spec) + (spec.max_parallel, spec.allow_parallel_multicore, spec.vd_max)
+
+
+def _inputs(cache: sizingcache.SizingCache, frontiers: _Frontiers, run, spec) -> tuple:
+    """
+    The sizing inputs of a run, see _values().
+    :return: The installation method's column prefix, spec fingerprint, required_ccc, load current and length.
+    """
+    return (frontiers.column(run), frontiers.fingerprint(spec)) + _values(cache, run, spec.vd_max)
+
+
+def _values(cache: sizingcache.SizingCache, run, vd_max: float) -> tuple:
+    """
+    The run's required_ccc, load current and length, rounded up to the cache's steps, if it has any, so a selection
+    made from them is sized for at least the run's own values. The load current and length only decide the selection
+    when the specification limits the voltage drop, so they are 0 otherwise.
+    """
+    if vd_max:
+        return (cache.quantise_current(run.required_ccc), cache.quantise_current(_load_current(run)),
+                cache.quantise_length(run.length))
+    return cache.quantise_current(run.required_ccc), 0.0, 0.0
+
+
+def _compute(select, frontiers: _Frontiers, spec, inputs: tuple) -> Selection:
+    column, _, required_ccc, load_current, length = inputs
+    return select(frontiers, spec, column, required_ccc, _drop_factor(load_current, length))
+
+
+def _for_run(frontiers: _Frontiers, selection: Selection, run) -> Selection:
     """
+    A stored selection with its voltage drop recalculated for the run's own load current and length.
+    """
+    row, parallel, ccc, vd = selection
+    if row is not None:
+        drop = frontiers.mvam[row] * _drop_factor(_load_current(run), run.length) / parallel
+        if drop != vd:
+            selection = Selection(row, parallel, ccc, drop)
+    return selection
+
+
+def _size_cached(cache: sizingcache.SizingCache, select, frontiers: _Frontiers, run, spec, prefix: tuple) -> Selection:
+    """
+    Size a run from the cache, see _inputs().
+    """
+    inputs = _inputs(cache, frontiers, run, spec)
+    key = prefix + inputs
+    selection = cache.get(key)
+    if selection is None:
+        selection = _compute(select, frontiers, spec, inputs)
+        cache.put(key, selection)
+    return _for_run(frontiers, selection, run)
+
+
+def _size_stored(store: resultstore.ResultStore, cache: sizingcache.SizingCache, select, frontiers: _Frontiers,
+                 pairs: list, prefix: tuple) -> List[Selection]:
+    """
+    Size a batch of runs from the cache, then from the store, and size the remaining runs from the catalogue. A run's
+    store key is the group_key() of its objective, installation method and specification fingerprint, digested once
+    for each distinct specification and method in the batch, followed by its own values, see _values(). The store is
+    read, and the new selections written, in a single query of each for the whole batch.
+    """
+    groups: Dict[tuple, tuple] = {}
+    cached = bool(cache.maxsize)
+    selections: List[Optional[Selection]] = []
+    missing: Dict[resultstore.Key, List[int]] = {}
+    for index, (run, spec) in enumerate(pairs):
+        group_id = (id(spec), run.circuit_details.installation.physical_installation)
+        group = groups.get(group_id)
+        if group is None:
+            head = (frontiers.column(run), frontiers.fingerprint(spec))
+            group = groups[group_id] = (head, resultstore.group_key(prefix[1:] + head), spec.vd_max)
+        values = _values(cache, run, group[2])
+        selection = cache.get(prefix + group[0] + values) if cached else None
+        if selection is None:
+            key = (group[1],) + values
+            indexes = missing.get(key)
+            if indexes is None:
+                missing[key] = [index]
+            else:
+                indexes.append(index)
+        selections.append(selection)
+    catalogue_digest = frontiers.catalogue.digest
+    keys = list(missing)
+    new = []
+    for key, stored in zip(keys, store.get_many(catalogue_digest, keys)):
+        indexes = missing[key]
+        run, spec = pairs[indexes[0]]
+        if stored is None:
+            selection = select(frontiers, spec, frontiers.column(run), key[1], _drop_factor(key[2], key[3]))
+            new.append((key, selection))
+        else:
+            selection = Selection(*stored)
+        if cached:
+            cache.put(prefix + _inputs(cache, frontiers, run, spec), selection)
+        for index in indexes:
+            selections[index] = selection
+    if new:
+        store.put_many(catalogue_digest, sorted(new))
+    return [_for_run(frontiers, selection, run) for selection, (run, _) in zip(selections, pairs)]
+
+
+def select_cable_from_database(catalogue, runs: Iterable[Tuple[cable.CableRun, cable.CableSpec]],
+                               install_method: str = None, minimise: str = "parallel",
+                               cache: sizingcache.SizingCache = None,
+                               store: resultstore.ResultStore = None) -> List[Selection]:
+    """
+    Select the smallest compliant cable for each of a batch of cable runs. A cable complies if it matches the
+    specification's categorical criteria and min_size, its current carrying capacity for the run's installation
+    method is at least required_ccc and the voltage drop, mV/A.m x load current x length / 1000, is within vd_max. A
+    vd_max of 0 is not checked. If no single cable complies, up to spec.max_parallel cables are run in parallel,
+    each carrying an equal share of the current. By default the fewest cables that comply are selected, or with
+    minimise='csa' the number of cables with the least total active conductor area, e.g. two 95 mm² cables rather
+    than a single 240 mm² cable.
+
+    Runs sharing a specification and installation method are checked against a single frontier of candidate cables,
+    see _frontier(), so a batch of many thousands of runs only filters the catalogue once for each distinct
+    specification. Selections may be cached, keyed by the catalogue's generation, the specification's fingerprint and
+    the run's installation method, current and length, so repeated runs, e.g. identical motor feeders, are only
+    sized once. A cache only pays for itself when many runs repeat; on a cold cache it is slower than sizing every run.
+    :param catalogue: The CableCatalogue to select from.
+    :param runs: The (CableRun, CableSpec) pairs. The run's installation method is read from
+    run.circuit_details.installation.
+    :param install_method: The installation method of runs that do not have one.
+    :param minimise: 'parallel' for the fewest cables or 'csa' for the least total active conductor area.
+    :param cache: An optional cache of previous selections, see SizingCache. Every run is sized from the catalogue if
+    None, or if the cache has a maxsize of 0. A cache with steps may select a larger cable than an exact one.
+    :param store: An optional persistent store of selections shared between sizing jobs, see ResultStore. Runs
+    missing from the cache are looked up in the store, keyed by the catalogue's digest, and the new selections are
+    added to it. A run found in the store needs no frontier, so the store gains most against large catalogues: the
+    50,000 unchanged runs of benchmarks/bench_sizing.py are read in 0.64 s, against 0.82 s to size them from 20,000
+    cables and 2.4 s from 100,000. A job whose runs are mostly new is slower with a store, since each new selection is
+    also written to it.
+    :return: The selection for each run, in the order of runs.
+    """
+    select = _SELECTORS.get(minimise)
+    if select is None:
+        raise ValueError(f"Unknown sizing objective ({minimise}).")
+    frontiers = _Frontiers(catalogue, install_method)
+    prefix = (catalogue.generation, minimise)
+    if store is not None:
+        cache = sizingcache.SizingCache(0) if cache is None else cache
+        return _size_stored(store, cache, select, frontiers, list(runs), prefix)
+    if cache is None or not cache.maxsize:
+        return [select(frontiers, spec, frontiers.column(run), run.required_ccc,
+                       _drop_factor(_load_current(run), run.length)) for run, spec in runs]
+    return [_size_cached(cache, select, frontiers, run, spec, prefix) for run, spec in runs]
+
+
+"""The number of runs sent to a worker process at a time by size_project()."""
+CHUNK_SIZE = 4096
+
+"""The frontiers of each compiled catalogue mapped by a size_project() worker process, keyed by the file's path, size
+and modification time, so a worker kept between projects maps each catalogue once."""
+_worker_frontiers: Dict[tuple, _Frontiers] = {}
+
+"""The number of catalogues a worker process keeps mapped before the oldest is dropped."""
+_WORKER_CATALOGUES = 8
+
+
+def _encode(frontiers: _Frontiers, pairs: Iterable[Tuple[cable.CableRun, cable.CableSpec]], specs: Dict[int, int],
+            columns: Dict[str, int]) -> Tuple[bytes, bytes, bytes, bytes]:
+    """
+    Encode the sizing inputs of a chunk of runs as arrays: the number of each run's specification and installation
+    method column, its required_ccc and its voltage drop factor, see _drop_factor(). New specifications and columns
+    are numbered as they are found.
+    """
+    spec_numbers, column_numbers, required, factors = array("L"), array("H"), array("d"), array("d")
+    for run, spec in pairs:
+        spec_numbers.append(specs.setdefault(id(spec), len(specs)))
+        column_numbers.append(columns.setdefault(frontiers.column(run), len(columns)))
+        required.append(run.required_ccc)
+        factors.append(_drop_factor(_load_current(run), run.length))
+    return spec_numbers.tobytes(), column_numbers.tobytes(), required.tobytes(), factors.tobytes()
+
+
+def _size_encoded(state: tuple, chunk: Tuple[bytes, bytes, bytes, bytes]) -> Tuple[bytes, bytes, bytes, bytes]:
+    """
+    Size a chunk of runs encoded by _encode().
+    :return: The selections as arrays of row, with -1 for no selection, parallel, ccc and voltage drop.
+    """
+    select, frontiers, specs, columns = state
+    spec_numbers, column_numbers, required, factors = (array(typecode, data) for typecode, data in zip("LHdd", chunk))
+    rows, parallels, cccs, drops = array("l"), array("l"), array("d"), array("d")
+    for spec, column, required_ccc, factor in zip(spec_numbers, column_numbers, required, factors):
+        row, parallel, ccc, vd = select(frontiers, specs[spec], columns[column], required_ccc, factor)
+        rows.append(-1 if row is None else row)
+        parallels.append(parallel)
+        cccs.append(ccc)
+        drops.append(vd)
+    return rows.tobytes(), parallels.tobytes(), cccs.tobytes(), drops.tobytes()
+
+
+def _size_chunk(fp: str, minimise: str, specs: List[cable.CableSpec], columns: List[str],
+                chunk: Tuple[bytes, bytes, bytes, bytes]) -> Tuple[bytes, bytes, bytes, bytes]:
+    """
+    Size a chunk of runs in a worker process, see _size_encoded(). The compiled catalogue is mapped on first use.
+    """
+    status = os.stat(fp)
+    key = (fp, status.st_size, status.st_mtime_ns)
+    frontiers = _worker_frontiers.get(key)
+    if frontiers is None:
+        if len(_worker_frontiers) >= _WORKER_CATALOGUES:
+            del _worker_frontiers[next(iter(_worker_frontiers))]
+        frontiers = _worker_frontiers[key] = _Frontiers(cataloguecache.map_catalogue(fp))
+    frontiers._specs.clear()
+    return _size_encoded((_SELECTORS[minimise], frontiers, specs, columns), chunk)
+
+
+def _decode(payload: Tuple[bytes, bytes, bytes, bytes]) -> Iterable[Selection]:
+    rows, parallels, cccs, drops = (array(typecode, data) for typecode, data in zip("lldd", payload))
+    for row, parallel, ccc, vd in zip(rows, parallels, cccs, drops):
+        yield NO_SELECTION if row < 0 else Selection(row, parallel, ccc, vd)
+
+
+def _map_chunks(pool: futures.Executor, fp: str, minimise: str, specs: List[cable.CableSpec], columns: List[str],
+                chunks: list) -> List[Selection]:
+    count = len(chunks)
+    payloads = pool.map(_size_chunk, [fp] * count, [minimise] * count, [specs] * count, [columns] * count, chunks)
+    return [selection for payload in payloads for selection in _decode(payload)]
+
+
+def size_project(catalogue, runs: Iterable[Tuple[cable.CableRun, cable.CableSpec]], jobs: int = None,
+                 install_method: str = None, minimise: str = "parallel", chunk_size: int = CHUNK_SIZE,
+                 catalogue_fp: Union[str, Path] = None,
+                 pool: futures.ProcessPoolExecutor = None) -> List[Selection]:
+    """
+    Size a project's cable runs in a process pool. The runs are split into chunks and each chunk is sent to a worker
+    as arrays of its sizing inputs, see _encode(), rather than as pickled runs, with the project's specifications.
+    Each worker memory maps a compiled copy of the catalogue, see cataloguecache.map_catalogue(), so the catalogue's
+    pages are shared by every worker, and keeps it mapped for later chunks and projects. The selections are returned
+    in the order of runs, whichever worker finishes first, and are the same as select_cable_from_database() without a
+    cache.
+    :param catalogue: The CableCatalogue to select from.
+    :param runs: The (CableRun, CableSpec) pairs.
+    :param jobs: The number of worker processes. Defaults to the number of processors. The runs are sized in this
+    process if jobs is 1 or there is a single chunk. Not used if a pool is given.
+    :param install_method: The installation method of runs that do not have one.
+    :param minimise: 'parallel' for the fewest cables or 'csa' for the least total active conductor area, see
+    select_cable_from_database().
+    :param chunk_size: The number of runs sent to a worker at a time.
+    :param catalogue_fp: A compiled catalogue holding the same catalogue, e.g. from cataloguecache.compile_catalogue().
+    The catalogue is written to a temporary file if not given. Required if a pool is given.
+    :param pool: A process pool kept by the caller, so a number of projects are sized without starting a pool, and
+    writing the catalogue, for each.
+    :return: The selection for each run, in the order of runs.
+    """
+    if minimise not in _SELECTORS:
+        raise ValueError(f"Unknown sizing objective ({minimise}).")
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size ({chunk_size}) must be at least 1.")
+    if pool is not None and catalogue_fp is None:
+        raise ValueError(f"A compiled catalogue must be given to size a project in a pool.")
+    pairs = list(runs)
+    frontiers = _Frontiers(catalogue, install_method)
+    specs: Dict[int, int] = {}
+    columns: Dict[str, int] = {}
+    chunks = [_encode(frontiers, pairs[start:start + chunk_size], specs, columns)
+              for start in range(0, len(pairs), chunk_size)]
+    spec_list = list({id(spec): spec for _, spec in pairs}.values())
+    column_list = list(columns)
+    if (jobs == 1 and pool is None) or len(chunks) < 2:
+        state = (_SELECTORS[minimise], frontiers, spec_list, column_list)
+        return [selection for chunk in chunks for selection in _decode(_size_encoded(state, chunk))]
+    if pool is not None:
+        return _map_chunks(pool, str(catalogue_fp), minimise, spec_list, column_list, chunks)
+    with tempfile.TemporaryDirectory() as directory:
+        if catalogue_fp is None:
+            catalogue_fp = Path(directory) / f"catalogue{cataloguecache.SUFFIX}"
+            cataloguecache.dump(catalogue, catalogue_fp)
+        with futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            return _map_chunks(pool, str(catalogue_fp), minimise, spec_list, column_list, chunks)
+
+
+class _Tracked:
+    """
+    A run held by an IncrementalSizer: its specification, the inputs its selection was made from and the selection.
+    """
+    __slots__ = ("run", "spec", "nodes", "inputs", "fingerprint", "selection", "upstream", "drop")
+
+    def __init__(self, run, spec):
+        self.run = run
+        self.spec = spec
+        self.nodes: Tuple[str, str] = (run.supply, run.load)
+        self.inputs: Optional[tuple] = None
+        self.fingerprint: Optional[tuple] = None
+        self.selection: Selection = NO_SELECTION
+        self.upstream: float = 0.0
+        self.drop: float = 0.0
+
+
+def _run_inputs(run) -> tuple:
+    """
+    The fields of a run its selection depends on: the load current, length, derating, required_ccc and installation
+    method, followed by its supply and load, which place it in a supply chain.
+    """
+    return (run.circuit_details.load_current, run.length, run.derate_run, run.required_ccc,
+            run.circuit_details.installation.physical_installation, run.supply, run.load)
+
+
+class IncrementalSizer:
+    """
+    The selections for a schedule of cable runs, kept up to date as the runs are edited. Each selection records the
+    inputs it was made from: the run's load current, length, derating, required_ccc and installation method, the
+    specification's fingerprint and the catalogue's generation. After an edit only the runs whose inputs have
+    changed are sized again, against frontiers of candidate cables that are kept between edits, so re-sizing a
+    single run takes microseconds rather than the time to size the whole schedule.
+
+    Runs form supply chains through their supply and load: a run whose supply is another run's load is downstream of
+    that run. With cumulative_vd, a specification's vd_max limits the voltage drop from the start of the chain to the
+    run's load, so a run may only use the part of vd_max left by the runs upstream of it. A change to a run's voltage
+    drop re-sizes the runs downstream of it, in supply order.
+
+    Edits are made to the runs themselves and then reported with mark_dirty(), or found by refresh():
+
+        sizer = IncrementalSizer(catalogue, zip(runs, specs))
+        runs[10].length = 120.0
+        sizer.mark_dirty(runs[10])
+        changed = sizer.resize()
+    """
+    def __init__(self, catalogue, runs: Iterable[Tuple[cable.CableRun, cable.CableSpec]] = (),
+                 install_method: str = None, minimise: str = "parallel", cumulative_vd: bool = True):
+        """
+        :param catalogue: The CableCatalogue to select from.
+        :param runs: The (CableRun, CableSpec) pairs. They are sized when the sizer is created.
+        :param install_method: The installation method of runs that do not have one.
+        :param minimise: 'parallel' for the fewest cables or 'csa' for the least total active conductor area, see
+        select_cable_from_database().
+        :param cumulative_vd: Limit the voltage drop from the start of each supply chain, rather than across each run.
+        """
+        self._select = _SELECTORS.get(minimise)
+        if self._select is None:
+            raise ValueError(f"Unknown sizing objective ({minimise}).")
+        self.catalogue = catalogue
+        self.install_method: Optional[str] = install_method
+        self.cumulative_vd: bool = cumulative_vd
+        self._generation: int = catalogue.generation
+        self._frontiers = _Frontiers(catalogue, install_method)
+        self._tracked: Dict[int, _Tracked] = {}
+        self._by_supply: Dict[str, List[_Tracked]] = {}
+        self._by_load: Dict[str, List[_Tracked]] = {}
+        self._depths: Dict[int, int] = {}
+        self._dirty: Dict[int, _Tracked] = {}
+        for run, spec in runs:
+            self.add(run, spec)
+        self.resize()
+
+    def __len__(self) -> int:
+        return len(self._tracked)
+
+    def __contains__(self, run) -> bool:
+        return id(run) in self._tracked
+
+    def _get(self, run) -> _Tracked:
+        tracked = self._tracked.get(id(run))
+        if tracked is None:
+            raise ValueError(f"Cable run ({run.tag}) is not held by the sizer.")
+        return tracked
+
+    def _index(self, tracked: _Tracked, add: bool = True):
+        for nodes, node in zip((self._by_supply, self._by_load), tracked.nodes):
+            if not node:
+                continue
+            if add:
+                nodes.setdefault(node, []).append(tracked)
+            else:
+                nodes[node].remove(tracked)
+                if not nodes[node]:
+                    del nodes[node]
+        self._depths.clear()
+
+    def _downstream(self, load: str) -> List[_Tracked]:
+        return self._by_supply.get(load, []) if load else []
+
+    def _upstream(self, tracked: _Tracked) -> List[_Tracked]:
+        supply = tracked.nodes[0]
+        return self._by_load.get(supply, []) if supply else []
+
+    def _depth(self, tracked: _Tracked, visiting: set = None) -> int:
+        """
+        The number of runs upstream of a run in its supply chain.
+        """
+        depth = self._depths.get(id(tracked))
+        if depth is None:
+            visiting = set() if visiting is None else visiting
+            if id(tracked) in visiting:
+                raise ValueError(f"Cable run ({tracked.run.tag}) is part of a supply loop.")
+            visiting.add(id(tracked))
+            depth = max((self._depth(upstream, visiting) + 1 for upstream in self._upstream(tracked)), default=0)
+            visiting.discard(id(tracked))
+            self._depths[id(tracked)] = depth
+        return depth
+
+    def add(self, run: cable.CableRun, spec: cable.CableSpec):
+        """
+        Add a run, or change the specification of a run already held. The run is sized by the next resize().
+        """
+        tracked = self._tracked.get(id(run))
+        if tracked is None:
+            tracked = self._tracked[id(run)] = _Tracked(run, spec)
+            self._index(tracked)
+        tracked.spec = spec
+        self._dirty[id(run)] = tracked
+
+    def remove(self, run: cable.CableRun):
+        """
+        Remove a run. The runs downstream of it are sized again by the next resize().
+        """
+        tracked = self._get(run)
+        del self._tracked[id(run)]
+        self._dirty.pop(id(run), None)
+        self._index(tracked, add=False)
+        for downstream in self._downstream(tracked.nodes[1]):
+            self._dirty[id(downstream.run)] = downstream
+
+    def mark_dirty(self, run: cable.CableRun):
+        """
+        Report that a run has been edited. It is sized again by the next resize() if its inputs have changed.
+        """
+        self._dirty[id(run)] = self._get(run)
+
+    def mark_spec_dirty(self, spec: cable.CableSpec):
+        """
+        Report that a specification has been edited. Every run using it is sized again by the next resize().
+        """
+        self._frontiers.forget(spec)
+        for key, tracked in self._tracked.items():
+            if tracked.spec is spec:
+                self._dirty[key] = tracked
+
+    def refresh(self) -> List[cable.CableRun]:
+        """
+        Find every run whose inputs, or specification, have changed since it was sized, and size them again. Use
+        mark_dirty() instead where the edited runs are known, since every run is checked.
+        :return: The runs whose selections have changed, see resize().
+        """
+        if self.catalogue.generation == self._generation:
+            fingerprints: Dict[int, tuple] = {}
+            for key, tracked in self._tracked.items():
+                fingerprint = fingerprints.get(id(tracked.spec))
+                if fingerprint is None:
+                    fingerprint = fingerprints[id(tracked.spec)] = spec_fingerprint(tracked.spec)
+                    if fingerprint != tracked.fingerprint:
+                        self._frontiers.forget(tracked.spec)
+                if fingerprint != tracked.fingerprint or _run_inputs(tracked.run) != tracked.inputs:
+                    self._dirty[key] = tracked
+        return self.resize()
+
+    def resize(self) -> List[cable.CableRun]:
+        """
+        Size the runs that have been added or marked dirty, and the runs downstream of any whose voltage drop has
+        changed. A change of the catalogue's generation sizes every run again. If the runs form a supply loop a
+        ValueError is raised, and the runs not yet sized are sized by the next resize() once the loop is removed.
+        :return: The runs whose selections have changed, in the order they were sized.
+        """
+        if self.catalogue.generation != self._generation:
+            self._generation = self.catalogue.generation
+            self._frontiers = _Frontiers(self.catalogue, self.install_method)
+            for tracked in self._tracked.values():
+                tracked.fingerprint = None
+            self._dirty.update(self._tracked)
+        for tracked in list(self._dirty.values()):
+            nodes = (tracked.run.supply, tracked.run.load)
+            if nodes != tracked.nodes:
+                for load in self._move(tracked, nodes):
+                    for downstream in self._downstream(load):
+                        self._dirty[id(downstream.run)] = downstream
+        heap = [(self._depth(tracked), count, tracked) for count, tracked in enumerate(self._dirty.values())]
+        heapq.heapify(heap)
+        self._dirty.clear()
+        queued = {id(tracked) for _, _, tracked in heap}
+        count = len(heap)
+        changed = []
+        tracked, loads = None, ()
+        try:
+            while heap:
+                _, _, tracked = heapq.heappop(heap)
+                loads = ()
+                queued.discard(id(tracked))
+                selection, drop, loads = tracked.selection, tracked.drop, self._update(tracked)
+                if tracked.selection != selection:
+                    changed.append(tracked.run)
+                if not self.cumulative_vd or (tracked.drop == drop and not loads):
+                    continue
+                for load in loads or tracked.nodes[1:]:
+                    for downstream in self._downstream(load):
+                        if id(downstream) not in queued:
+                            queued.add(id(downstream))
+                            heapq.heappush(heap, (self._depth(downstream), count, downstream))
+                            count += 1
+        except BaseException:
+            # E.g. an edit has made a supply loop. The runs not yet sized are left dirty, with the run being sized and
+            # the runs it supplies, so that the next resize() sizes them once the runs have been fixed.
+            pending = [entry[2] for entry in heap]
+            if tracked is not None:
+                pending.append(tracked)
+                for load in {tracked.nodes[1], tracked.inputs[6] if tracked.inputs else "", *loads}:
+                    pending.extend(self._downstream(load))
+            for each in pending:
+                self._dirty[id(each.run)] = each
+            raise
+        return changed
+
+    def _move(self, tracked: _Tracked, nodes: Tuple[str, str]) -> Tuple[str, str]:
+        """
+        Move a run to a new supply and load.
+        :return: The run's previous and new loads.
+        """
+        moved = (tracked.nodes[1], nodes[1])
+        self._index(tracked, add=False)
+        tracked.nodes = nodes
+        self._index(tracked)
+        return moved
+
+    def _update(self, tracked: _Tracked) -> tuple:
+        """
+        Size a run if its inputs have changed. The run's required_ccc is used as it is, as by
+        select_cable_from_database(), and the run is never modified.
+        :return: The run's previous and new loads if its place in a supply chain has changed, otherwise ().
+        """
+        run, spec, old = tracked.run, tracked.spec, tracked.inputs
+        inputs = _run_inputs(run)
+        moved = self._move(tracked, inputs[5:]) if inputs[5:] != tracked.nodes else ()
+        fingerprint = spec_fingerprint(spec)
+        if fingerprint != tracked.fingerprint and tracked.fingerprint is not None:
+            self._frontiers.forget(spec)
+        upstream = max((other.drop for other in self._upstream(tracked)), default=0.0) if self.cumulative_vd else 0.0
+        if inputs != old or fingerprint != tracked.fingerprint or upstream != tracked.upstream:
+            vd_max = spec.vd_max - upstream if spec.vd_max else 0.0
+            if spec.vd_max and vd_max <= 0:
+                tracked.selection = NO_SELECTION
+            else:
+                tracked.selection = self._select(self._frontiers, spec, self._frontiers.column(run), run.required_ccc,
+                                                 _drop_factor(_load_current(run), run.length), vd_max)
+            tracked.inputs, tracked.fingerprint, tracked.upstream = inputs, fingerprint, upstream
+        tracked.drop = upstream + tracked.selection.vd
+        return moved
+
+    def selection(self, run: cable.CableRun) -> Selection:
+        """
+        The run's selection, as of the last resize().
+        """
+        return self._get(run).selection
+
+    def voltage_drop(self, run: cable.CableRun) -> float:
+        """
+        The voltage drop in volts from the start of the run's supply chain to its load, as of the last resize().
+        """
+        return self._get(run).drop
+
+    def selections(self) -> List[Selection]:
+        """
+        The selection of every run, in the order the runs were added.
+        """
+        return [tracked.selection for tracked in self._tracked.values()]
@@ -0,0 +1,645 @@
+"""
+A columnar store for manufacturer cable catalogues. Each column listed in importcables.HEADERS is held as a typed array
+rather than as attributes spread across a tree of Cable objects. Cable objects are only built when a row is requested.
+Columns with few distinct values are dictionary encoded, see enumerations.
+"""
+import hashlib
+import itertools
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+import CableSizer.cable as cable
+import CableSizer.csa as csa
+import CableSizer.importcables as importcables
+import CableSizer.indexes as indexes
+import CableSizer.installmethods as installmethods
+import CableSizer.schema as schema
+
+"""The unit applied to the impedance columns. The catalogue headers define the resistance, reactance and impedance in
+ohms per kilometre."""
+IMPEDANCE_UNIT = "OHM/KM"
+
+"""The source of catalogue generations. Each number is only used once in a process, see CableCatalogue.generation."""
+_GENERATIONS = itertools.count(1)
+
+STRING = schema.STRING
+ENUM = schema.ENUM
+COLUMNS = schema.COLUMNS
+TABLES = schema.TABLES
+
+"""The Cable() keyword argument populated from each catalogue column."""
+CABLE_FIELDS: Dict[str, str] = {
+    "conductorMaterial": "conductor_material",
+    "cableCoreArrangement": "core_arrangement",
+    "cableType": "cable_type",
+    "circuitType": "circuit_type",
+    "description": "description",
+    "activeCores_size": "active_size",
+    "activeCores_sizeUnit": "active_unit",
+    "activeCores_number": "active_number",
+    "neutralCores_size": "neutral_size",
+    "neutralCores_sizeUnit": "neutral_unit",
+    "neutralCores_number": "neutral_number",
+    "earthCores_size": "earth_size",
+    "earthCores_sizeUnit": "earth_unit",
+    "earthCores_number": "earth_number",
+    "insulation_name": "insulation_material",
+    "insulation_code": "insulation_code",
+    "insulation_conductorTemperature": "cont_conductor_temp",
+    "insulation_maxTemperature": "max_conductor_temp",
+    "sheath": "cable_sheath",
+    "cableScreen_name": "cable_screen_type",
+    "cableScreen_faultWithstand": "cable_screen_withstand",
+    "armoured": "armour",
+    "coreScreen_type": "core_screen_type",
+    "voltRating": "volt_rating",
+    "isFlex": "flexible",
+    "impedance_MVAM": "mvam",
+    "impedance_rOhmsPerKM": "r",
+    "impedance_xOhmsPerKM": "x",
+    "impedance_zOhmsPerKM": "z",
+    "rev_number": "rev_number",
+    "rev_date": "rev_date",
+}
+
+"""The catalogue columns holding the current carrying capacity, installation temperature and cable arrangement of each
+installation method. The values are passed to Cable() as its installations argument."""
+INSTALLATION_COLUMNS: Tuple[Tuple[int, str, str, str], ...] = tuple(
+    (method.id, f"{method.column}_current", f"{method.column}_installTemp", f"{method.column}_cableArrangement")
+    for method in installmethods.CATALOGUE_METHODS)
+
+_PLAIN_FIELDS = tuple((name, field) for name, field in CABLE_FIELDS.items() if name not in TABLES)
+_ENCODED_FIELDS = tuple((name, field, TABLES[name]) for name, field in CABLE_FIELDS.items() if name in TABLES)
+_INSTALLATION_FIELDS = tuple((method_id, ccc, temp, arrangement, TABLES[arrangement])
+                             for method_id, ccc, temp, arrangement in INSTALLATION_COLUMNS)
+
+
+def _empty_column(typecode: str) -> Union[array, list]:
+    if typecode == STRING:
+        return []
+    return array(typecode)
+
+
+def _convert_row(row: dict) -> dict:
+    """
+    Convert a dictionary keyed by catalogue header to the values stored in each catalogue column.
+    """
+    for alias, name in importcables.ALIASES.items():
+        if alias in row and not row.get(name):
+            row = dict(row)
+            row[name] = row[alias]
+    return {name: converter(row.get(name)) for name, converter in schema.CONVERTERS.items()}
+
+
+class CableCatalogue:
+    """
+    A column orientated store of catalogue cables. Each column in COLUMNS is held as a typed array with one entry per
+    cable. Dictionary encoded columns hold the code of each value in the column's table in TABLES. Cable objects are
+    only created when requested via get_cable() or get_cables().
+    """
+    def __init__(self, rows: Iterable[dict] = None):
+        """
+        :param rows: An optional iterable of dictionaries, keyed by catalogue header, used to populate the catalogue.
+        """
+        self._columns: Dict[str, Union[array, list]] = {name: _empty_column(code) for name, code in COLUMNS.items()}
+        self._length: int = 0
+        self._read_only: bool = False
+        self._bitmap_index = None
+        self._ampacity_index = None
+        self._part_rows = None
+        self._csa_matrix = None
+        self._generation: int = next(_GENERATIONS)
+        self._digest: Tuple[int, str] = (0, "")
+        if rows is not None:
+            self.extend(rows)
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Union[array, list]], length: int):
+        """
+        Create a catalogue that uses existing column storage without copying it, e.g. when loading a compiled
+        catalogue.
+        :param columns: The column storage keyed by catalogue column. Every column must be present. The catalogue is
+        read only if any column is not an array or list, e.g. a memoryview of a mapped file.
+        :param length: The number of cables in the catalogue.
+        :return: CableCatalogue
+        """
+        for name in COLUMNS:
+            if len(columns[name]) != length:
+                raise ValueError(f"Column ({name}) does not contain {length} values.")
+        cable_catalogue = cls()
+        cable_catalogue._columns = {name: columns[name] for name in COLUMNS}
+        cable_catalogue._length = length
+        cable_catalogue._read_only = not all(isinstance(values, (array, list)) for values in columns.values())
+        return cable_catalogue
+
+    def attach_indexes(self, bitmap_index: indexes.BitmapIndex = None, ampacity_index: indexes.AmpacityIndex = None):
+        """
+        Attach previously built indexes to the catalogue so they are not rebuilt on first use.
+        :param bitmap_index: The bitmap index built over this catalogue.
+        :param ampacity_index: The ampacity index built over this catalogue.
+        """
+        if bitmap_index is not None:
+            self._bitmap_index = bitmap_index
+        if ampacity_index is not None:
+            self._ampacity_index = ampacity_index
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def columns(self) -> tuple:
+        return tuple(self._columns)
+
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+    def _check_writable(self):
+        if self._read_only:
+            raise ValueError(f"The catalogue is read only.")
+
+    @property
+    def generation(self) -> int:
+        """
+        A number identifying the catalogue's contents. It is unique within the process and changes whenever cables are
+        added or changed, so results calculated from the catalogue can be keyed by it, see sizingcache.
+        """
+        return self._generation
+
+    @property
+    def digest(self) -> str:
+        """
+        A hex digest of the catalogue's contents which, unlike generation, is the same in every process and on every
+        machine that holds the same cables in the same order. Encoded columns are hashed by value rather than by code.
+        The digest is calculated on first use after the catalogue changes.
+        """
+        generation, digest = self._digest
+        if generation != self._generation:
+            digest = self._calculate_digest()
+            self._digest = (self._generation, digest)
+        return digest
+
+    def _calculate_digest(self) -> str:
+        digest = hashlib.sha256(f"schema:{schema.SCHEMA_VERSION};rows:{self._length}".encode())
+        for name, values in self._columns.items():
+            digest.update(f"\0{name}\0".encode())
+            if name in TABLES:
+                digest.update("\0".join(TABLES[name].decode_many(values)).encode())
+            elif COLUMNS[name] == STRING:
+                digest.update("\0".join(values).encode())
+            else:
+                data = array(COLUMNS[name], values)
+                if sys.byteorder == "big":
+                    data.byteswap()
+                digest.update(data.tobytes())
+        return digest.hexdigest()
+
+    @property
+    def bitmap_index(self) -> indexes.BitmapIndex:
+        """
+        The bitmap index over the catalogue's categorical columns. The index is built on first use, rebuilt after
+        cables are added and patched after cables are reloaded.
+        """
+        if self._bitmap_index is None:
+            self._bitmap_index = indexes.BitmapIndex(self)
+        return self._bitmap_index
+
+    @property
+    def ampacity_index(self) -> indexes.AmpacityIndex:
+        """
+        The index of rows ordered by current carrying capacity for each installation method. The index is built on
+        first use, rebuilt after cables are added and patched after cables are reloaded.
+        """
+        if self._ampacity_index is None:
+            self._ampacity_index = indexes.AmpacityIndex(self)
+        return self._ampacity_index
+
+    @property
+    def csa_matrix(self) -> csa.CSAMatrix:
+        """
+        The conductor size of each role in every row, normalised to mm². The matrix is built on first use, rebuilt
+        after cables are added and patched after cables are reloaded.
+        """
+        if self._csa_matrix is None:
+            self._csa_matrix = csa.CSAMatrix(self)
+        return self._csa_matrix
+
+    def column(self, name: str) -> Union[array, list]:
+        """
+        Return the storage for a single column. The returned array is the catalogue's own storage and must not be
+        modified by the caller. Dictionary encoded columns hold codes, see values().
+        :param name: The column header. Aliased headers are accepted.
+        :return: The column's array, or a list for string columns.
+        """
+        return self._columns[importcables.ALIASES.get(name, name)]
+
+    def values(self, name: str) -> list:
+        """
+        Return the values held in a single column. Dictionary encoded columns are decoded to their strings.
+        :param name: The column header. Aliased headers are accepted.
+        :return: list
+        """
+        name = importcables.ALIASES.get(name, name)
+        if name in TABLES:
+            return TABLES[name].decode_many(self._columns[name])
+        return list(self._columns[name])
+
+    def append(self, row: dict):
+        """
+        Add a single cable to the catalogue.
+        :param row: A dictionary keyed by catalogue header. Missing columns are stored as zero or "".
+        """
+        self._check_writable()
+        for name, value in _convert_row(row).items():
+            self._columns[name].append(value)
+        self._length += 1
+        self._reset_indexes()
+
+    def extend(self, rows: Iterable[dict]):
+        """
+        Add a number of cables to the catalogue.
+        :param rows: An iterable of dictionaries keyed by catalogue header.
+        """
+        for row in rows:
+            self.append(row)
+
+    def extend_columns(self, columns: Dict[str, Sequence], length: int):
+        """
+        Add a chunk of cables held as columns, e.g. as returned by schema.CompiledHeader.convert(). The values must
+        already be converted to the column's type.
+        :param columns: A dictionary of column values keyed by catalogue column. Every column must be present.
+        :param length: The number of cables in the chunk.
+        """
+        self._check_writable()
+        for name in self._columns:
+            if len(columns[name]) != length:
+                raise ValueError(f"Column ({name}) does not contain {length} values.")
+        for name, values in self._columns.items():
+            values.extend(columns[name])
+        self._length += length
+        self._reset_indexes()
+
+    def _reset_indexes(self):
+        self._bitmap_index = None
+        self._ampacity_index = None
+        self._part_rows = None
+        self._csa_matrix = None
+        self._generation = next(_GENERATIONS)
+
+    @property
+    def part_rows(self) -> Dict[str, int]:
+        """
+        The row number of each manufacturer part number. Rows without a part number are not included. Where a part
+        number is repeated the last row is used.
+        """
+        if self._part_rows is None:
+            self._part_rows = {part: row for row, part in enumerate(self._columns["manufacturer_partNumber"]) if part}
+        return self._part_rows
+
+    def update_columns(self, columns: Dict[str, Sequence], length: int) -> Dict[str, int]:
+        """
+        Merge a chunk of cables, held as columns, into the catalogue by manufacturer part number. A cable whose part
+        number is already in the catalogue replaces that row in place if its revision number or revision date differs.
+        Otherwise the cable is added. Built indexes are patched rather than rebuilt. Cables without a part number are
+        skipped.
+        :param columns: A dictionary of converted column values keyed by catalogue column.
+        :param length: The number of cables in the chunk.
+        :return: The number of cables added, updated, unchanged and skipped.
+        """
+        self._check_writable()
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+        parts = self.part_rows
+        storage = self._columns
+        rev_number, rev_date = storage["rev_number"], storage["rev_date"]
+        for position in range(length):
+            part = columns["manufacturer_partNumber"][position]
+            if not part:
+                counts["skipped"] += 1
+                continue
+            index = parts.get(part)
+            if index is not None and rev_number[index] == columns["rev_number"][position] \
+                    and rev_date[index] == columns["rev_date"][position]:
+                counts["unchanged"] += 1
+                continue
+            values = {name: columns[name][position] for name in storage}
+            if index is None:
+                old = None
+                index = parts[part] = self._length
+                for name, value in values.items():
+                    storage[name].append(value)
+                self._length += 1
+                counts["added"] += 1
+            else:
+                old = self._stored_row(index)
+                for name, value in values.items():
+                    storage[name][index] = value
+                counts["updated"] += 1
+            if self._bitmap_index is not None:
+                self._bitmap_index.set_row(index, values, old)
+            if self._ampacity_index is not None:
+                self._ampacity_index.set_row(index, values, old)
+            if self._csa_matrix is not None:
+                self._csa_matrix.set_row(index, values, old)
+        if counts["added"] or counts["updated"]:
+            self._generation = next(_GENERATIONS)
+        return counts
+
+    def reload(self, rows: Iterable[dict]) -> Dict[str, int]:
+        """
+        Merge updated cables into the catalogue by manufacturer part number and revision, see update_columns().
+        :param rows: An iterable of dictionaries keyed by catalogue header.
+        :return: The number of cables added, updated, unchanged and skipped.
+        """
+        converted = [_convert_row(row) for row in rows]
+        columns = {name: [row[name] for row in converted] for name in COLUMNS}
+        return self.update_columns(columns, len(converted))
+
+    def _same_row(self, index: int, other, position: int) -> bool:
+        return all(values[index] == other.column(name)[position] for name, values in self._columns.items())
+
+    def merge(self, other, on_conflict: str = "raise") -> List[str]:
+        """
+        Add the cables of another catalogue, detecting conflicting manufacturer part numbers. Cables repeating an
+        existing part number with identical values are dropped. Cables repeating a part number with different values
+        are conflicts and are handled as set by on_conflict:
+            "raise": raise a ValueError listing the conflicting part numbers. The catalogue is not changed.
+            "first": keep the cable already in the catalogue.
+            "last": replace the cable already in the catalogue.
+        The columns are copied as whole arrays, without building a dictionary for each cable.
+        :param other: The CableCatalogue to merge.
+        :param on_conflict: How conflicting part numbers are handled.
+        :return: The conflicting part numbers.
+        """
+        self._check_writable()
+        if on_conflict not in ("raise", "first", "last"):
+            raise ValueError(f"on_conflict ({on_conflict}) must be 'raise', 'first' or 'last'.")
+        parts = self.part_rows
+        keep: List[int] = []
+        pending: Dict[str, int] = {}
+        replace: List[Tuple[int, int]] = []
+        conflicts: List[str] = []
+        for position, part in enumerate(other.column("manufacturer_partNumber")):
+            if not part:
+                keep.append(position)
+                continue
+            if part in pending:
+                slot = pending[part]
+                if other._same_row(keep[slot], other, position):
+                    continue
+                conflicts.append(part)
+                if on_conflict == "last":
+                    keep[slot] = position
+            elif part in parts:
+                index = parts[part]
+                if self._same_row(index, other, position):
+                    continue
+                conflicts.append(part)
+                if on_conflict == "last":
+                    replace.append((index, position))
+            else:
+                pending[part] = len(keep)
+                keep.append(position)
+        if conflicts and on_conflict == "raise":
+            raise ValueError(f"Conflicting part numbers: {', '.join(sorted(set(conflicts)))}.")
+        for name, values in self._columns.items():
+            source = other.column(name)
+            for index, position in replace:
+                values[index] = source[position]
+            if len(keep) == len(other):
+                values.extend(source)
+            else:
+                values.extend([source[position] for position in keep])
+        self._length += len(keep)
+        self._reset_indexes()
+        return conflicts
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"Catalogue index ({index}) out of range.")
+        return index
+
+    def _stored_row(self, index: int) -> dict:
+        return {name: values[index] for name, values in self._columns.items()}
+
+    def get_row(self, index: int) -> dict:
+        """
+        Return a single catalogue row as a dictionary keyed by header. Dictionary encoded columns are decoded.
+        :param index: The row number.
+        :return: dict
+        """
+        index = self._check_index(index)
+        return {name: schema.decode(name, values[index]) for name, values in self._columns.items()}
+
+    def export_row(self, index: int) -> dict:
+        """
+        Return a single catalogue row as a dictionary that can be written to JSON, see schema.export(). The row can be
+        added back to a catalogue with append().
+        :param index: The row number.
+        :return: dict
+        """
+        index = self._check_index(index)
+        return {name: schema.export(name, values[index]) for name, values in self._columns.items()}
+
+    def get_cable(self, index: int, lazy: bool = False) -> cable.Cable:
+        """
+        Build a Cable object from a single catalogue row.
+        :param index: The row number.
+        :param lazy: Return a LazyCable, which reads each attribute from the row when it is first accessed.
+        :return: Cable
+        """
+        index = self._check_index(index)
+        if lazy:
+            return LazyCable(self, index)
+        columns = self._columns
+        kwargs = {field: columns[name][index] for name, field in _PLAIN_FIELDS}
+        for name, field, table in _ENCODED_FIELDS:
+            kwargs[field] = table.decode(columns[name][index])
+        kwargs["flexible"] = bool(kwargs["flexible"])
+        kwargs["rev_date"] = schema.from_date(kwargs["rev_date"])
+        kwargs["r_unit"] = kwargs["x_unit"] = kwargs["z_unit"] = IMPEDANCE_UNIT
+        kwargs["installations"] = {method_id: (columns[ccc][index], columns[temp][index],
+                                               table.decode(columns[arrangement][index]))
+                                   for method_id, ccc, temp, arrangement, table in _INSTALLATION_FIELDS}
+        return cable.Cable(**kwargs)
+
+    def get_cables(self, indices: Iterable[int] = None, lazy: bool = False) -> Iterator[cable.Cable]:
+        """
+        Build Cable objects for a selection of rows.
+        :param indices: The row numbers to build. All rows are built if None.
+        :param lazy: Build LazyCable objects, see get_cable().
+        :return: An iterator of Cable objects.
+        """
+        if indices is None:
+            indices = range(self._length)
+        for index in indices:
+            yield self.get_cable(index, lazy)
+
+    def select(self, spec, lazy: bool = False) -> Iterator[cable.Cable]:
+        """
+        Build Cable objects for the rows matching the categorical criteria of a cable specification. Rows that do not
+        match are never materialised.
+        :param spec: The CableSpec containing the selection criteria.
+        :param lazy: Build LazyCable objects, see get_cable().
+        :return: An iterator of Cable objects.
+        """
+        return self.get_cables(indexes.iter_rows(self.bitmap_index.query(spec)), lazy)
+
+    def nbytes(self) -> int:
+        """
+        The approximate private memory, in bytes, used by the catalogue's column storage. Interned strings shared
+        between rows are only counted once. Memory mapped columns and the shared tables of the encoded columns are not
+        counted.
+        :return: int
+        """
+        total = 0
+        seen = set()
+        for values in self._columns.values():
+            total += sys.getsizeof(values)
+            if isinstance(values, list):
+                for value in values:
+                    if id(value) not in seen:
+                        seen.add(id(value))
+                        total += sys.getsizeof(value)
+        return total
+
+
+class LazyCable(cable.Cable):
+    """
+    A Cable backed by a catalogue row. Each attribute is read from the row the first time it is accessed, so a cable
+    that is only partly read, e.g. while selecting cables by size and current carrying capacity, never builds the
+    sub-objects that are not used. The values read are identical to those of CableCatalogue.get_cable().
+
+    Attributes that have not been read reflect the row as it is when they are first accessed. Call hydrate() before
+    modifying the catalogue to keep the values as they are now.
+    """
+    __slots__ = ("_catalogue", "_index")
+
+    def __init__(self, cable_catalogue: CableCatalogue, index: int):
+        """
+        :param cable_catalogue: The catalogue holding the row.
+        :param index: The row number.
+        """
+        self._catalogue = cable_catalogue
+        self._index = index
+
+    def __getattr__(self, name: str):
+        # Only called for attributes that have not been set, i.e. those not yet read from the row.
+        loader = _LAZY_LOADERS.get(name)
+        if loader is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        loader(self, self._catalogue._columns, self._index)
+        return object.__getattribute__(self, name)
+
+    @property
+    def index(self) -> int:
+        """
+        The catalogue row backing the cable.
+        """
+        return self._index
+
+    def hydrate(self) -> "LazyCable":
+        """
+        Read every attribute that has not been read yet.
+        :return: The cable.
+        """
+        for name in _LAZY_LOADERS:
+            getattr(self, name)
+        return self
+
+
+"""The catalogue column read for each Cable() keyword argument."""
+_FIELD_COLUMNS = {field: name for name, field in CABLE_FIELDS.items()}
+
+
+def _field(columns: dict, index: int, field: str, default=None):
+    name = _FIELD_COLUMNS.get(field)
+    if name is None:
+        return default
+    value = columns[name][index]
+    table = TABLES.get(name)
+    return value if table is None else table.decode(value)
+
+
+def _load_value(attribute: str, field: str = None, default=""):
+    def load(lazy, columns, index):
+        setattr(lazy, attribute, _field(columns, index, field, default))
+    return load
+
+
+def _load_flexible(lazy, columns, index):
+    lazy.flexible = bool(_field(columns, index, "flexible"))
+
+
+def _load_cores(attribute: str, role: str):
+    def load(lazy, columns, index):
+        setattr(lazy, attribute, cable.flyweight(cable.CoreDetails, _field(columns, index, f"{role}_size", 0.0),
+                                                 _field(columns, index, f"{role}_unit", ""),
+                                                 _field(columns, index, f"{role}_number", 0), ""))
+    return load
+
+
+def _load_impedance(lazy, columns, index):
+    lazy._impedance = cable.flyweight(cable.Impedance, _field(columns, index, "mvam"), _field(columns, index, "r"),
+                                      IMPEDANCE_UNIT, _field(columns, index, "x"), IMPEDANCE_UNIT,
+                                      _field(columns, index, "z"), IMPEDANCE_UNIT)
+
+
+def _load_screen(attribute: str, role: str):
+    def load(lazy, columns, index):
+        setattr(lazy, attribute, cable.flyweight(cable.Screen, _field(columns, index, f"{role}_screen_type", ""),
+                                                 _field(columns, index, f"{role}_screen_withstand", 0)))
+    return load
+
+
+def _load_insulation(lazy, columns, index):
+    lazy._insulation = cable.flyweight(cable.Insulation, _field(columns, index, "insulation_material"),
+                                       _field(columns, index, "insulation_code"),
+                                       _field(columns, index, "cont_conductor_temp"),
+                                       _field(columns, index, "max_conductor_temp"))
+
+
+def _load_revision(lazy, columns, index):
+    lazy._revision = cable.flyweight(cable.RevisionDetail, _field(columns, index, "rev_number"),
+                                     schema.from_date(_field(columns, index, "rev_date")))
+
+
+def _load_installations(lazy, columns, index):
+    ccc = [0] * installmethods.COUNT
+    conditions = [(0, "")] * installmethods.COUNT
+    for method_id, current, temp, arrangement, table in _INSTALLATION_FIELDS:
+        ccc[method_id] = columns[current][index]
+        conditions[method_id] = (columns[temp][index], table.decode(columns[arrangement][index]))
+    lazy._ccc = array("d", ccc)
+    lazy._conditions = cable.shared_conditions(tuple(conditions))
+
+
+"""The function reading each Cable slot from a catalogue row. A function may set more than one slot."""
+_LAZY_LOADERS = {
+    "_cable_type": _load_value("cable_type", "cable_type"),
+    "_activeCores": _load_cores("_activeCores", "active"),
+    "_neutralCores": _load_cores("_neutralCores", "neutral"),
+    "_earthCores": _load_cores("_earthCores", "earth"),
+    "_controlCores": _load_cores("_controlCores", "control"),
+    "_instrumentCores": _load_cores("_instrumentCores", "instrument"),
+    "_communicationCores": _load_cores("_communicationCores", "communication"),
+    "_dataCores": _load_cores("_dataCores", "data"),
+    "_impedance": _load_impedance,
+    "_cableScreen": _load_screen("_cableScreen", "cable"),
+    "_coreScreen": _load_screen("_coreScreen", "core"),
+    "_insulation": _load_insulation,
+    "_ccc": _load_installations,
+    "_conditions": _load_installations,
+    "_sheath": _load_value("sheath", "cable_sheath"),
+    "voltage_rating": _load_value("voltage_rating", "volt_rating"),
+    "flexible": _load_flexible,
+    "armour": _load_value("armour", "armour", None),
+    "_revision": _load_revision,
+    "description": _load_value("description", "description"),
+    "_circuit_type": _load_value("circuit_type", "circuit_type"),
+    "_c_material": _load_value("conductor_material", "conductor_material"),
+    "_c_arrangement": _load_value("core_arrangement", "core_arrangement"),
+    "_shape": _load_value("shape"),
+}
@@ -0,0 +1,319 @@
+"""
+Compiled catalogues. A compiled catalogue is a binary file holding the typed columns and indexes of a CableCatalogue.
+It is written next to the source .csv files and keyed by a hash of their contents and the schema version, so later
+loads read the compiled file instead of parsing the .csv files again.
+
+File layout:
+    preamble: MAGIC, format version (uint32) and header length (uint32), little endian.
+    header: JSON describing the catalogue, the values of each dictionary encoding table and the offset of each data
+    block.
+    data: the column and index blocks, each aligned to 8 bytes.
+
+The codes of the dictionary encoded columns are only valid for the table values written with them. When a compiled
+catalogue is loaded its table values are added to this process's tables and the codes are translated if they differ.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
+
+import CableSizer.catalogue as catalogue
+import CableSizer.csvimporter as csvimporter
+import CableSizer.enumerations as enumerations
+import CableSizer.indexes as indexes
+import CableSizer.schema as schema
+
+MAGIC = b"CABLECAT"
+FORMAT_VERSION = 3
+SUFFIX = ".cablecat"
+
+_ALIGN = 8
+_PREAMBLE = struct.Struct("<8sII")
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def source_key(fps: Sequence[Union[str, Path]]) -> str:
+    """
+    Calculate the key of a compiled catalogue: a hash of the source files' contents, the schema version and the file
+    format version.
+    :param fps: The source .csv files, in the order they are loaded.
+    :return: The hex digest.
+    """
+    digest = hashlib.sha256(f"schema:{schema.SCHEMA_VERSION};format:{FORMAT_VERSION}".encode())
+    for fp in fps:
+        digest.update(b"\0file\0")
+        with open(fp, "rb") as source:
+            for block in iter(lambda: source.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def compiled_path(fps: Sequence[Union[str, Path]]) -> Path:
+    """
+    The path of the compiled catalogue for a number of source files. The file is stored next to the first source file.
+    """
+    return Path(fps[0]).with_suffix(SUFFIX)
+
+
+class _BlockWriter:
+    """
+    Collects the data blocks of a compiled catalogue and records their offsets.
+    """
+    def __init__(self):
+        self.blocks: List[bytes] = []
+        self.offset: int = 0
+
+    def add(self, data: bytes) -> List[int]:
+        location = [self.offset, len(data)]
+        padding = _align(len(data)) - len(data)
+        self.blocks.append(data + b"\0" * padding)
+        self.offset += len(data) + padding
+        return location
+
+
+def to_bytes(cable_catalogue: catalogue.CableCatalogue, key: str = "", include_indexes: bool = True) -> bytes:
+    """
+    Encode a catalogue in the compiled catalogue format.
+    :param cable_catalogue: The catalogue to encode.
+    :param key: The catalogue key, see source_key().
+    :param include_indexes: Build, if required, and include the catalogue's indexes.
+    :return: The compiled catalogue.
+    """
+    length = len(cable_catalogue)
+    writer = _BlockWriter()
+    header = {"key": key, "schema_version": schema.SCHEMA_VERSION, "byteorder": sys.byteorder, "length": length,
+              "columns": {}, "strings": {}, "tables": {}, "bitmaps": None, "ampacity": None}
+    for name, typecode in catalogue.COLUMNS.items():
+        values = cable_catalogue.column(name)
+        if typecode == catalogue.STRING:
+            header["strings"][name] = list(values)
+        else:
+            header["columns"][name] = {"typecode": typecode, "itemsize": values.itemsize,
+                                       "block": writer.add(bytes(values))}
+        if name in catalogue.TABLES:
+            table = catalogue.TABLES[name]
+            header["columns"][name]["table"] = table.name
+            header["tables"][table.name] = list(table.values)
+    if include_indexes:
+        bitmap_index = cable_catalogue.bitmap_index
+        nbytes = (length + 7) // 8
+        header["bitmaps"] = {column: [[value, writer.add(bitmap_index.bitmap(column, value).to_bytes(nbytes, "little"))]
+                                      for value in bitmap_index.values(column)]
+                             for column in bitmap_index.columns}
+        ampacity_index = cable_catalogue.ampacity_index
+        header["ampacity"] = {}
+        for method in ampacity_index.methods:
+            rows = ampacity_index.rows(method)
+            header["ampacity"][method] = {"itemsize": rows.itemsize, "rows": writer.add(bytes(rows)),
+                                          "ccc": writer.add(bytes(ampacity_index.capacities(method)))}
+    header_bytes = json.dumps(header).encode("utf-8")
+    padding = _align(_PREAMBLE.size + len(header_bytes)) - _PREAMBLE.size - len(header_bytes)
+    return b"".join([_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)), header_bytes, b"\0" * padding]
+                    + writer.blocks)
+
+
+def dump(cable_catalogue: catalogue.CableCatalogue, fp: Union[str, Path], key: str = ""):
+    """
+    Write a compiled catalogue. The catalogue's indexes are built if required and written with the columns. The file is
+    written to a temporary file and then moved into place, so readers never see a partially written file.
+    :param cable_catalogue: The catalogue to write.
+    :param fp: The path of the compiled catalogue.
+    :param key: The catalogue key, see source_key().
+    """
+    data = to_bytes(cable_catalogue, key)
+    fp = Path(fp)
+    handle, temp_fp = tempfile.mkstemp(prefix=fp.name, suffix=".tmp", dir=fp.parent)
+    try:
+        with os.fdopen(handle, "wb") as compiled:
+            compiled.write(data)
+        os.replace(temp_fp, fp)
+    except BaseException:
+        os.unlink(temp_fp)
+        raise
+
+
+def read_header(data: bytes) -> Tuple[dict, int]:
+    """
+    Read and check the header of a compiled catalogue.
+    :param data: The start of the compiled catalogue. At least the preamble and header must be present.
+    :return: The header and the offset of the data blocks.
+    """
+    if len(data) < _PREAMBLE.size:
+        raise ValueError(f"File is not a compiled catalogue.")
+    magic, version, header_length = _PREAMBLE.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"File is not a compiled catalogue.")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Compiled catalogue format ({version}) is not supported.")
+    header = json.loads(bytes(data[_PREAMBLE.size:_PREAMBLE.size + header_length]).decode("utf-8"))
+    if header["schema_version"] != schema.SCHEMA_VERSION:
+        raise ValueError(f"Compiled catalogue schema ({header['schema_version']}) is out of date.")
+    if header["byteorder"] != sys.byteorder:
+        raise ValueError(f"Compiled catalogue byte order ({header['byteorder']}) does not match this machine.")
+    return header, _align(_PREAMBLE.size + header_length)
+
+
+def _column(data, start: int, typecode: str, location: List[int], itemsize: int):
+    values = array(typecode)
+    if values.itemsize != itemsize:
+        raise ValueError(f"Compiled catalogue item size ({itemsize}) does not match this machine.")
+    offset, nbytes = location
+    values.frombytes(data[start + offset:start + offset + nbytes])
+    return values
+
+
+def _mapped_column(data: memoryview, start: int, typecode: str, location: List[int], itemsize: int) -> memoryview:
+    if struct.calcsize(typecode) != itemsize:
+        raise ValueError(f"Compiled catalogue item size ({itemsize}) does not match this machine.")
+    offset, nbytes = location
+    return data[start + offset:start + offset + nbytes].cast(typecode)
+
+
+def _encoded_column(values, codes: List[int]):
+    if all(code == position for position, code in enumerate(codes)):
+        return values
+    return array(catalogue.ENUM, [codes[code] for code in values])
+
+
+def from_buffer(data, key: str = None, column=_column) -> catalogue.CableCatalogue:
+    """
+    Build a catalogue from the contents of a compiled catalogue. Encoded columns are used without translation, and so
+    without copying when mapped, if the file's codes match this process's tables.
+    :param data: The compiled catalogue contents, e.g. bytes or a memory map.
+    :param key: The expected catalogue key. The key is not checked if None.
+    :param column: The function used to build each column from its data block.
+    :return: CableCatalogue
+    """
+    header, start = read_header(data)
+    if key is not None and header["key"] != key:
+        raise ValueError(f"Compiled catalogue is out of date.")
+    length = header["length"]
+    codes = {name: enumerations.TABLES[name].remap(values) for name, values in header["tables"].items()}
+    columns: Dict[str, Union[array, list]] = {}
+    for name, typecode in catalogue.COLUMNS.items():
+        if typecode == catalogue.STRING:
+            columns[name] = [sys.intern(value) for value in header["strings"][name]]
+        else:
+            details = header["columns"][name]
+            columns[name] = column(data, start, typecode, details["block"], details["itemsize"])
+            if "table" in details:
+                columns[name] = _encoded_column(columns[name], codes[details["table"]])
+    cable_catalogue = catalogue.CableCatalogue.from_columns(columns, length)
+    if header["bitmaps"] is None or header["ampacity"] is None:
+        return cable_catalogue
+    bitmaps = {}
+    for name, values in header["bitmaps"].items():
+        encode = catalogue.TABLES[name].encode if name in catalogue.TABLES else None
+        bitmaps[name] = {value if encode is None else encode(value):
+                         int.from_bytes(data[start + offset:start + offset + nbytes], "little")
+                         for value, (offset, nbytes) in values}
+    rows, ccc = {}, {}
+    for method, details in header["ampacity"].items():
+        rows[method] = column(data, start, "l", details["rows"], details["itemsize"])
+        ccc[method] = column(data, start, "d", details["ccc"], array("d").itemsize)
+    cable_catalogue.attach_indexes(indexes.BitmapIndex.from_bitmaps(length, bitmaps),
+                                   indexes.AmpacityIndex.from_arrays(cable_catalogue, rows, ccc))
+    return cable_catalogue
+
+
+def load(fp: Union[str, Path], key: str = None) -> catalogue.CableCatalogue:
+    """
+    Read a compiled catalogue.
+    :param fp: The path of the compiled catalogue.
+    :param key: The expected catalogue key. The key is not checked if None.
+    :return: CableCatalogue
+    """
+    with open(fp, "rb") as compiled:
+        return from_buffer(compiled.read(), key)
+
+
+def map_catalogue(fp: Union[str, Path], key: str = None) -> catalogue.CableCatalogue:
+    """
+    Memory map a compiled catalogue. The numeric columns and the ampacity index are read only views of the mapped file,
+    so processes mapping the same file share its pages rather than each holding a private copy. The catalogue is read
+    only.
+    :param fp: The path of the compiled catalogue.
+    :param key: The expected catalogue key. The key is not checked if None.
+    :return: CableCatalogue
+    """
+    with open(fp, "rb") as compiled:
+        mapped = mmap.mmap(compiled.fileno(), 0, access=mmap.ACCESS_READ)
+    return from_buffer(memoryview(mapped), key, _mapped_column)
+
+
+def _parse(fps: Sequence[Union[str, Path]]) -> catalogue.CableCatalogue:
+    cable_catalogue = catalogue.CableCatalogue()
+    for fp in fps:
+        csvimporter.CSVImporter(fp).load(cable_catalogue)
+    return cable_catalogue
+
+
+def compile_catalogue(fps: Sequence[Union[str, Path]], output: Union[str, Path] = None) -> Path:
+    """
+    Compile a number of catalogue .csv files. Nothing is written if the compiled catalogue is already up to date.
+    :param fps: The source .csv files.
+    :param output: The path of the compiled catalogue. Defaults to compiled_path(fps).
+    :return: The path of the compiled catalogue.
+    """
+    output = compiled_path(fps) if output is None else Path(output)
+    key = source_key(fps)
+    try:
+        with open(output, "rb") as compiled:
+            data = compiled.read(_PREAMBLE.size)
+            _, _, header_length = _PREAMBLE.unpack_from(data)
+            header, _ = read_header(data + compiled.read(header_length))
+        if header["key"] == key:
+            return output
+    except (OSError, ValueError, struct.error):
+        pass
+    dump(_parse(fps), output, key)
+    return output
+
+
+def load_catalogue(fps: Sequence[Union[str, Path]], output: Union[str, Path] = None,
+                   mapped: bool = False) -> catalogue.CableCatalogue:
+    """
+    Load a number of catalogue .csv files, using the compiled catalogue when it is up to date. The compiled catalogue
+    is written if it is missing or out of date.
+    :param fps: The source .csv files.
+    :param output: The path of the compiled catalogue. Defaults to compiled_path(fps).
+    :param mapped: Memory map the compiled catalogue rather than reading it, see map_catalogue().
+    :return: CableCatalogue
+    """
+    output = compiled_path(fps) if output is None else Path(output)
+    key = source_key(fps)
+    reader = map_catalogue if mapped else load
+    try:
+        return reader(output, key)
+    except (OSError, ValueError, struct.error):
+        pass
+    cable_catalogue = _parse(fps)
+    dump(cable_catalogue, output, key)
+    if mapped:
+        return map_catalogue(output, key)
+    return cable_catalogue
+
+
+def main(argv: Sequence[str] = None):
+    """
+    Compile the catalogue .csv files given on the command line.
+    """
+    fps = sys.argv[1:] if argv is None else argv
+    if not fps:
+        print(f"usage: python -m CableSizer.cataloguecache catalogue.csv [catalogue.csv ...]")
+        return 2
+    print(compile_catalogue(fps))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Conductor cross-sectional areas by core role. A cable's conductors are grouped into roles, e.g. the POWER (active)
+cores or the EARTH cores, and each role has a single conductor size. Sizes are given in mm², AWG or kcmil, so they are
+normalised to mm² before sizes are compared.
+
+CSAMatrix holds the normalised size of every role for every row of a CableCatalogue, one array per role, so that
+filters such as 'neutral at least half the active size' are answered as bitsets over the whole catalogue, see indexes.
+"""
+import bisect
+import math
+from array import array
+from typing import Dict, Sequence, Tuple, Union
+
+import CableSizer.enumerations as enumerations
+import CableSizer.indexes as indexes
+
+"""The conductor roles, in the order of Cable.csa and of a CSAMatrix row."""
+ROLES = ("POWER", "NEUTRAL", "EARTH", "CONTROL", "INSTRUMENT", "DATA", "COMMUNICATION")
+
+"""The prefix of the catalogue columns holding each role's size. Roles without columns are held as zero."""
+ROLE_COLUMNS = {
+    "POWER": "activeCores",
+    "NEUTRAL": "neutralCores",
+    "EARTH": "earthCores",
+}
+
+"""The unit every size is normalised to."""
+UNIT = "MM2"
+
+"""The area in mm² of one kcmil, i.e. one thousand circular mils."""
+MM2_PER_KCMIL = 0.506707479
+
+
+def _gauge(size: Union[str, float]) -> int:
+    """
+    The gauge number of an AWG size. The aught sizes, '0', '00', '000' and '0000' or '1/0' to '4/0', are 0 to -3. A
+    negative number is an aught size as stored in a catalogue, i.e. the negated number of noughts, see schema.to_size().
+    """
+    if isinstance(size, str):
+        text = size.strip()
+        if text.endswith("/0"):
+            return 1 - int(text[:-2])
+        if text and set(text) == {"0"}:
+            return 1 - len(text)
+        size = float(text)
+    gauge = int(size)
+    if gauge != size:
+        raise ValueError(f"AWG size ({size}) is not a whole gauge number.")
+    if gauge < 0:
+        return gauge + 1
+    return gauge
+
+
+def awg_to_mm2(size: Union[str, float]) -> float:
+    """
+    The area of an AWG conductor, calculated from the gauge's diameter of 0.127 mm x 92^((36 - n) / 39).
+    :param size: The gauge, e.g. 4, '2' or '4/0'.
+    :return: The area in mm².
+    """
+    diameter = 0.127 * 92 ** ((36 - _gauge(size)) / 39)
+    return math.pi / 4 * diameter ** 2
+
+
+def to_mm2(size: Union[str, float], unit: str = UNIT) -> float:
+    """
+    Normalise a conductor size to mm².
+    :param size: The size. A blank or zero size is returned as 0. AWG aught sizes are given as strings, e.g. '4/0', or
+        as the negated number of noughts, e.g. -4.
+    :param unit: The unit of the size, i.e. 'MM2', 'AWG' or 'KCMIL'. A blank unit is taken to be mm².
+    :return: The area in mm².
+    """
+    unit = enumerations.canonical(unit)
+    if unit in ("", "MM2"):
+        return float(size or 0)
+    if unit == "AWG":
+        if not size:
+            return 0.0
+        return awg_to_mm2(size)
+    if unit == "KCMIL":
+        return float(size or 0) * MM2_PER_KCMIL
+    raise ValueError(f"Unknown conductor size unit ({unit}).")
+
+
+def _role(role: str) -> str:
+    name = role.upper()
+    if name not in ROLES:
+        raise ValueError(f"Unknown conductor role ({role}).")
+    return name
+
+
+def _normalise(sizes: Sequence[float], units: Sequence[int]) -> array:
+    """
+    Normalise a catalogue size column to mm². Rows in mm² are copied as they are and the other units are converted
+    once for each distinct (unit, size).
+    """
+    table = enumerations.TABLES["size_unit"]
+    mm2 = {code for code, unit in enumerate(table.values) if unit in ("", UNIT)}
+    result = array("d", sizes)
+    converted: Dict[Tuple[int, float], float] = {}
+    for row, code in enumerate(units):
+        if code not in mm2:
+            key = (code, sizes[row])
+            size = converted.get(key)
+            if size is None:
+                size = converted[key] = to_mm2(sizes[row], table.decode(code))
+            result[row] = size
+    return result
+
+
+class CSAMatrix:
+    """
+    The conductor sizes of every catalogue row, in mm², held as one array per role. Filters return bitsets of rows,
+    which are combined with the bitsets of the catalogue's BitmapIndex using & and |.
+    """
+    def __init__(self, catalogue):
+        """
+        :param catalogue: The CableCatalogue.
+        """
+        self._length: int = len(catalogue)
+        self._sizes: Dict[str, array] = {}
+        for role in ROLES:
+            prefix = ROLE_COLUMNS.get(role)
+            if prefix is None:
+                self._sizes[role] = array("d", bytes(8 * self._length))
+            else:
+                self._sizes[role] = _normalise(catalogue.column(f"{prefix}_size"),
+                                               catalogue.column(f"{prefix}_sizeUnit"))
+        self._order: Dict[str, Tuple[array, array]] = {}
+
+    def __len__(self) -> int:
+        return self._length
+
+    def column(self, role: str) -> array:
+        """
+        The size of a role in every row. The returned array is the matrix's own storage and must not be modified.
+        :param role: The conductor role, e.g. 'NEUTRAL'.
+        :return: The sizes in mm², in row order.
+        """
+        return self._sizes[_role(role)]
+
+    def row(self, index: int) -> Tuple[float, ...]:
+        """
+        The size of every role in a single row, in ROLES order.
+        """
+        return tuple(self._sizes[role][index] for role in ROLES)
+
+    def set_row(self, row: int, values: dict, old: dict = None):
+        """
+        Patch the matrix after a catalogue row is added or changed.
+        :param row: The row number.
+        :param values: The row's new stored values keyed by catalogue column.
+        :param old: The row's previous stored values, or None if the row has been added.
+        """
+        table = enumerations.TABLES["size_unit"]
+        for role, sizes in self._sizes.items():
+            prefix = ROLE_COLUMNS.get(role)
+            size = 0.0 if prefix is None else \
+                to_mm2(values[f"{prefix}_size"], table.decode(values[f"{prefix}_sizeUnit"]))
+            if old is None:
+                sizes.append(size)
+            else:
+                sizes[row] = size
+        self._length = max(self._length, row + 1)
+        self._order.clear()
+
+    def _sorted(self, role: str) -> Tuple[array, array]:
+        """
+        The rows in ascending order of a role's size, and their sizes, built on first use.
+        """
+        order = self._order.get(role)
+        if order is None:
+            sizes = self._sizes[role]
+            rows = array("l", sorted(range(self._length), key=sizes.__getitem__))
+            order = self._order[role] = (rows, array("d", (sizes[row] for row in rows)))
+        return order
+
+    def at_least(self, role: str, minimum: float, bitset: int = None) -> int:
+        """
+        The rows where a role's size is at least a minimum.
+        :param role: The conductor role.
+        :param minimum: The minimum size in mm².
+        :param bitset: An optional bitset the result is restricted to.
+        :return: The bitset.
+        """
+        rows, sizes = self._sorted(_role(role))
+        result = indexes.build_bitset(rows[bisect.bisect_left(sizes, minimum):], self._length)
+        return result if bitset is None else result & bitset
+
+    def compare(self, role: str, other: str, ratio: float = 1.0, bitset: int = None) -> int:
+        """
+        The rows where a role's size is at least a ratio of another role's size, e.g. compare('NEUTRAL', 'POWER', 0.5)
+        for a neutral of at least half the active size.
+        :param role: The conductor role that is checked.
+        :param other: The conductor role it is compared to.
+        :param ratio: The ratio of the other role's size that is required.
+        :param bitset: An optional bitset the result is restricted to.
+        :return: The bitset.
+        """
+        sizes, others = self._sizes[_role(role)], self._sizes[_role(other)]
+        rows = range(self._length) if bitset is None else indexes.iter_rows(bitset)
+        return indexes.build_bitset((row for row in rows if sizes[row] >= ratio * others[row]), self._length)
+
+    def at_least_table(self, role: str, table: Sequence[Tuple[float, float]], reference: str = "POWER",
+                       bitset: int = None) -> int:
+        """
+        The rows where a role's size is at least the minimum listed in a table against another role's size, e.g. the
+        minimum earth conductor for each active conductor size. Rows whose reference size is below the first entry
+        have no minimum.
+        :param role: The conductor role that is checked, e.g. 'EARTH'.
+        :param table: The (reference size, minimum size) pairs in mm², in ascending order of reference size. A row
+        uses the last pair whose reference size is not above its own.
+        :param reference: The conductor role the table is looked up by.
+        :param bitset: An optional bitset the result is restricted to.
+        :return: The bitset.
+        """
+        sizes, references = self._sizes[_role(role)], self._sizes[_role(reference)]
+        keys = [size for size, _ in table]
+        minimums = [0.0] + [minimum for _, minimum in table]
+        rows = range(self._length) if bitset is None else indexes.iter_rows(bitset)
+        return indexes.build_bitset(
+            (row for row in rows if sizes[row] >= minimums[bisect.bisect_right(keys, references[row])]), self._length)
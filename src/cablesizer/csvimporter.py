@@ -1,3 +1,104 @@
 import CableSizer.cable as cable
-import CableSizer.csvtojson as c2j
+import CableSizer.catalogue as catalogue
+import CableSizer.schema as schema
 
+import csv as csv
+import itertools as itertools
+import pathlib as path
+from typing import Dict, Iterator, List, Tuple
+
+
+class CSVImporter:
+    """
+    A class to import a manufacturer's cable catalogue .csv file. The file is read in chunks so that memory use does
+    not depend on the size of the file.
+    """
+    def __init__(self, fp: str, chunk_size: int = 1000):
+        """
+        Initialise the object.
+        :param fp: File path to the .csv file.
+        :param chunk_size: The number of rows read from the file at a time.
+        """
+        self._fp = path.Path(fp)
+        self.chunk_size = chunk_size
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, value: int):
+        if value < 1:
+            raise ValueError(f"chunk_size must be greater than 0.")
+        self._chunk_size = value
+
+    def iter_chunks(self) -> Iterator[List[dict]]:
+        """
+        Read the .csv file a chunk at a time.
+        :return: An iterator of lists of rows. Each row is a dictionary keyed by the column header.
+        """
+        with open(self._fp, newline='', encoding='utf-8-sig') as csvfile:
+            reader = csv.DictReader(csvfile)
+            while True:
+                chunk = list(itertools.islice(reader, self.chunk_size))
+                if not chunk:
+                    break
+                yield chunk
+
+    def iter_columns(self) -> Iterator[Tuple[Dict[str, list], int]]:
+        """
+        Read the .csv file a chunk at a time and convert each chunk to typed catalogue columns. The conversion plan is
+        compiled once from the file's header row and applied a column at a time.
+        :return: An iterator of (columns, length) tuples, where columns is keyed by catalogue column.
+        """
+        with open(self._fp, newline='', encoding='utf-8-sig') as csvfile:
+            reader = csv.reader(csvfile)
+            header = schema.CompiledHeader(next(reader, []))
+            while True:
+                chunk = list(itertools.islice(reader, self.chunk_size))
+                if not chunk:
+                    break
+                yield header.convert(chunk), len(chunk)
+
+    def iter_rows(self) -> Iterator[dict]:
+        """
+        Read the .csv file a row at a time.
+        :return: An iterator of dictionaries keyed by the column header.
+        """
+        for chunk in self.iter_chunks():
+            yield from chunk
+
+    def iter_cables(self) -> Iterator[cable.Cable]:
+        """
+        Read the .csv file and build a Cable object for each row. Only a single chunk of rows is held at a time.
+        :return: An iterator of Cable objects.
+        """
+        for columns, length in self.iter_columns():
+            chunk = catalogue.CableCatalogue()
+            chunk.extend_columns(columns, length)
+            yield from chunk.get_cables()
+
+    def load(self, cable_catalogue: catalogue.CableCatalogue = None) -> catalogue.CableCatalogue:
+        """
+        Read the .csv file into a catalogue a chunk at a time.
+        :param cable_catalogue: The catalogue the rows are added to. A new catalogue is created if None.
+        :return: The catalogue.
+        """
+        if cable_catalogue is None:
+            cable_catalogue = catalogue.CableCatalogue()
+        for columns, length in self.iter_columns():
+            cable_catalogue.extend_columns(columns, length)
+        return cable_catalogue
+
+    def reload(self, cable_catalogue: catalogue.CableCatalogue) -> Dict[str, int]:
+        """
+        Merge an updated .csv file into a catalogue by manufacturer part number and revision. Only new and changed rows,
+        and their index entries, are written. See CableCatalogue.update_columns().
+        :param cable_catalogue: The catalogue to update.
+        :return: The number of cables added, updated, unchanged and skipped.
+        """
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+        for columns, length in self.iter_columns():
+            for key, count in cable_catalogue.update_columns(columns, length).items():
+                counts[key] += count
+        return counts
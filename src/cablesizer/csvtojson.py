@@ -2,6 +2,8 @@ import csv as csv
 import json as json
 import pathlib as path
 
+import CableSizer.jsonstream as jsonstream
+
 
 class CSVtoJSON:
     """
@@ -30,6 +32,27 @@ class CSVtoJSON:
             for row in reader:
                 self._csv.append(row)
 
+    def iter_rows(self):
+        """
+        Iterate over the csv rows. If the file has not been opened the rows are read from it one at a time rather than
+        being stored.
+        """
+        if self._csv:
+            yield from self._csv
+            return
+        with open(self._fp, newline='', encoding='utf-8-sig') as csvfile:
+            yield from csv.DictReader(csvfile)
+
+    def dump(self, file, chunk_size: int = jsonstream.CHUNK_SIZE) -> int:
+        """
+        Write the csv rows to a JSON array, a chunk at a time, see jsonstream.write_array(). Unlike dumps(), the JSON is
+        never held in memory as a whole.
+        :param file: The path of the JSON file, or a file-like object open for writing text.
+        :param chunk_size: The number of rows written at a time.
+        :return: The number of rows written.
+        """
+        return jsonstream.write_array(self.iter_rows(), file, chunk_size)
+
     def dumps(self):
         """
         Convert self._csv to JSON.
@@ -0,0 +1,193 @@
+"""
+Lookup tables for the dictionary encoded catalogue columns. Columns such as conductorMaterial or voltRating hold a
+handful of distinct values across many thousands of rows, so each value is stored once in a table and the catalogue
+column holds its integer code. Columns holding the same kind of value, e.g. the '*_cableArrangement' columns, share a
+table. The tables are seeded from the enumerations in Constants/cable.json so the common values have the same codes in
+every process.
+"""
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+"""The largest code that can be stored. Encoded columns are held as arrays of unsigned shorts."""
+MAX_CODE = 0xFFFF
+
+CONSTANTS_PATH = Path(__file__).resolve().parent.parent / "Constants" / "cable.json"
+
+"""The table used by each encoded column, and the paths in cable.json of the enumerations used to seed each table."""
+_COLUMN_TABLES = {
+    "conductorMaterial": "conductor_material",
+    "cableCoreArrangement": "core_arrangement",
+    "cableType": "cable_type",
+    "circuitType": "circuit_type",
+    "insulation_name": "insulation_material",
+    "insulation_code": "insulation_code",
+    "sheath": "sheath",
+    "cableScreen_name": "cable_screen",
+    "armoured": "armour",
+    "coreScreen_type": "core_screen",
+    "voltRating": "volt_rating",
+    "manufacturer_name": "manufacturer",
+    "rev_number": "revision",
+}
+_SUFFIX_TABLES = {
+    "_cableArrangement": "cable_arrangement",
+    "_sizeUnit": "size_unit",
+}
+_SEEDS = {
+    "conductor_material": [("cable", "conductor_material", "description")],
+    "core_arrangement": [("cable", "core_arrangement", "single_phase", "description"),
+                         ("cable", "core_arrangement", "multi_phase", "description"),
+                         ("cable", "core_arrangement", "control", "description"),
+                         ("cable", "core_arrangement", "instrument", "pair", "description"),
+                         ("cable", "core_arrangement", "instrument", "triple", "description")],
+    "cable_type": [("cable", "description")],
+    "circuit_type": [("circuit", "description")],
+    "insulation_material": [("cable", "insulation", "material", "description")],
+    "insulation_code": [("cable", "insulation", "code", "description")],
+    "sheath": [("cable", "sheath", "description")],
+    "cable_screen": [("cable", "screen", "cable", "description")],
+    "armour": [("cable", "armour", "description")],
+    "core_screen": [("cable", "screen", "core", "description")],
+    "volt_rating": [("cable", "volt_rating", "description")],
+    "cable_arrangement": [("install_method", "cable_arrangement", "description")],
+    "size_unit": [("cable", "sizes", "unit", "description")],
+    "manufacturer": [],
+    "revision": [],
+}
+
+
+def canonical(value) -> str:
+    """
+    Convert a value to the form stored in an encoded column: a stripped, upper case and interned string.
+    """
+    if value is None:
+        return ""
+    return sys.intern(str(value).strip().upper())
+
+
+class EnumTable:
+    """
+    A table of distinct values and their integer codes. Code 0 is always the blank value. Values are only ever added,
+    so a code remains valid for the life of the process.
+    """
+    def __init__(self, name: str, values: Sequence = ()):
+        """
+        :param name: The table name.
+        :param values: The values to add, in code order.
+        """
+        self.name: str = name
+        self._values: List[str] = [""]
+        self._codes: Dict[str, int] = {"": 0}
+        for value in values:
+            self.encode(canonical(value))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"EnumTable({self.name!r}, {len(self)} values)"
+
+    @property
+    def values(self) -> tuple:
+        """
+        The values held in the table, in code order.
+        """
+        return tuple(self._values)
+
+    def encode(self, value: str) -> int:
+        """
+        Return the code of a value, adding the value to the table if required.
+        :param value: The value, already in canonical form.
+        :return: int
+        """
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._values)
+            if code > MAX_CODE:
+                raise ValueError(f"Table ({self.name}) holds more than {MAX_CODE} values.")
+            value = sys.intern(value)
+            self._values.append(value)
+            self._codes[value] = code
+        return code
+
+    def convert(self, value) -> int:
+        """
+        Convert a raw catalogue value to its code, adding the value to the table if required.
+        """
+        return self.encode(canonical(value))
+
+    def code(self, value) -> Optional[int]:
+        """
+        Look up the code of a value without adding it to the table. The value is matched without regard to case.
+        :return: The code, or None if the value is not in the table.
+        """
+        return self._codes.get(canonical(value))
+
+    def decode(self, code: int) -> str:
+        return self._values[code]
+
+    def decode_many(self, codes: Sequence[int]) -> List[str]:
+        values = self._values
+        return [values[code] for code in codes]
+
+    def remap(self, values: Sequence[str]) -> List[int]:
+        """
+        Calculate the codes in this table of the values held in another table, e.g. a table written to a compiled
+        catalogue by another process. Values missing from this table are added.
+        :param values: The other table's values, in code order.
+        :return: This table's code for each of the other table's codes.
+        """
+        return [self.encode(value) for value in values]
+
+
+def load_constants(fp: Path = CONSTANTS_PATH) -> dict:
+    """
+    Read Constants/cable.json. An empty dictionary is returned if the file is missing or invalid.
+    """
+    try:
+        with open(fp) as constants:
+            return json.load(constants)
+    except (OSError, ValueError):
+        return {}
+
+
+def seed_values(constants: dict, paths: Sequence[Sequence[str]]) -> List[str]:
+    """
+    Collect the values of the enumerations at a number of paths in cable.json. The '-' placeholder is skipped.
+    :param constants: The contents of cable.json, see load_constants().
+    :param paths: The keys leading to each enumeration.
+    :return: The values, in the order listed.
+    """
+    values = []
+    for keys in paths:
+        node = constants
+        for key in keys:
+            node = node.get(key, {}) if isinstance(node, dict) else {}
+        if isinstance(node, list):
+            values.extend(value for value in node if isinstance(value, str) and value != "-")
+    return values
+
+
+def table_name(header: str) -> Optional[str]:
+    """
+    The name of the table used by a catalogue column.
+    :param header: The column header as listed in importcables.HEADERS.
+    :return: The table name, or None if the column is not encoded.
+    """
+    if header in _COLUMN_TABLES:
+        return _COLUMN_TABLES[header]
+    for suffix, name in _SUFFIX_TABLES.items():
+        if header.endswith(suffix):
+            return name
+    return None
+
+
+def _build_tables() -> Dict[str, EnumTable]:
+    constants = load_constants()
+    return {name: EnumTable(name, seed_values(constants, paths)) for name, paths in _SEEDS.items()}
+
+
+"""The shared lookup tables, keyed by table name."""
+TABLES: Dict[str, EnumTable] = _build_tables()
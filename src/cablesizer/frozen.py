@@ -0,0 +1,127 @@
+"""
+Immutable, hashable variants of Cable and CableSpec. A frozen object has the same read API as the class it is frozen
+from, but every attempt to modify it raises an AttributeError. Its content hash is calculated once, when it is frozen,
+so frozen specifications and cables can be used as dictionary keys and in memo caches, e.g. to memoise sizing results
+keyed on the specification.
+
+Two frozen objects are equal if their contents, see serializers.to_key(), are equal. The digest property is a content
+hash that is stable between processes, for keys that are written to disk.
+"""
+import hashlib
+from typing import Union
+
+import CableSizer.cable as cable
+import CableSizer.serializers as serializers
+
+
+def _shared(instance):
+    """
+    The read only, shared equivalent of a sub-object, see cable.flyweight().
+    """
+    if cable.is_shared(instance):
+        return instance
+    return cable.flyweight(type(instance), *serializers.to_dict(instance).values())
+
+
+def _frozen(self, *args):
+    raise AttributeError(f"{type(self).__name__} is immutable. Call thaw() for a modifiable copy.")
+
+
+class _Frozen:
+    """
+    The hash and equality of the frozen classes. The content key is set by the subclass when the object is frozen.
+    """
+    __slots__ = ()
+
+    __setattr__ = _frozen
+    __delattr__ = _frozen
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, _Frozen):
+            return NotImplemented
+        return self._hash == other._hash and type(self) is type(other) and self._key == other._key
+
+    def _seal(self):
+        key = serializers.to_key(self)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_hash", hash(key))
+
+    @property
+    def digest(self) -> str:
+        """
+        A hex digest of the contents which, unlike hash(), is the same in every process.
+        """
+        return hashlib.blake2b(repr(self._key).encode(), digest_size=16).hexdigest()
+
+
+class FrozenCableSpec(_Frozen, cable.CableSpec):
+    """
+    An immutable CableSpec. The insulation details are held as a shared, read only Insulation.
+    """
+    def __init__(self, spec: cable.CableSpec):
+        """
+        :param spec: The specification to copy.
+        """
+        state = dict(spec.__dict__)
+        state["insulation"] = _shared(spec.insulation)
+        object.__setattr__(self, "__dict__", state)
+        self._seal()
+
+    def __repr__(self) -> str:
+        return f"FrozenCableSpec({self.type!r}, digest={self.digest!r})"
+
+
+class FrozenCable(_Frozen, cable.Cable):
+    """
+    An immutable Cable. Every sub-object is a shared, read only instance, see cable.flyweight(), and the current
+    carrying capacities are held in a tuple rather than an array.
+    """
+    __slots__ = ("_key", "_hash")
+
+    def __init__(self, source: cable.Cable):
+        """
+        :param source: The cable to copy. Lazy cables are read in full.
+        """
+        sub_objects = {f"_{attribute}" for attribute in cable.Cable.SUB_OBJECTS}
+        for slot in cable.Cable.__slots__:
+            value = getattr(source, slot)
+            if slot in sub_objects:
+                value = _shared(value)
+            elif slot == "_ccc":
+                value = tuple(value)
+            object.__setattr__(self, slot, value)
+        self._seal()
+
+    def __repr__(self) -> str:
+        return f"FrozenCable({self.description!r}, digest={self.digest!r})"
+
+    _set_ccc = _frozen
+    _set_condition = _frozen
+
+
+def freeze(instance: Union[cable.Cable, cable.CableSpec]) -> Union[FrozenCable, FrozenCableSpec]:
+    """
+    Create an immutable, hashable copy of a cable or cable specification. Frozen objects are returned unchanged.
+    :param instance: The Cable or CableSpec.
+    :return: FrozenCable or FrozenCableSpec
+    """
+    if isinstance(instance, _Frozen):
+        return instance
+    if isinstance(instance, cable.Cable):
+        return FrozenCable(instance)
+    if isinstance(instance, cable.CableSpec):
+        return FrozenCableSpec(instance)
+    raise ValueError(f"{type(instance).__name__} cannot be frozen.")
+
+
+def thaw(instance: Union[FrozenCable, FrozenCableSpec]) -> Union[cable.Cable, cable.CableSpec]:
+    """
+    Create a modifiable copy of a frozen cable or cable specification.
+    :param instance: The FrozenCable or FrozenCableSpec.
+    :return: Cable or CableSpec
+    """
+    cls = cable.Cable if isinstance(instance, cable.Cable) else cable.CableSpec
+    return serializers.from_dict(cls, serializers.to_dict(instance))
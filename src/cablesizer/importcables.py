@@ -1,72 +1,86 @@
-conductorMaterial
-cableCoreArrangement
-cableType
-circuitType
-description
-unenclosed_spaced_current
-unenclosed_spaced_installTemp
-unenclosed_spaced_cableArrangement
-unenclosed_surface_current
-unenclosed_surface_installTemp
-unenclosed_surface_cableArrangement
-unenclosed_touching_current
-unenclosed_touching_installTemp
-unenclosed_touching_cableArrangement
-enclosed_conduit_current
-enclosed_conduit_installTemp
-enclosed_conduit_cableArrangement
-enclosed_partial_current
-enclosed_partial_installTemp
-enclosed_partial_cableArrangement
-enclosed_complete_current
-enclosed_complete_installTemp
-enclosed_complete_cableArrangement
-buried_direct_current
-buried_direct_installTemp
-buried_direct_cableArrangement
-ducts_single_current
-ducts_single_installTemp
-ducts_single_cableArrangement
-ducts_per_cable_current
-ducts_per_cable_installTemp
-ducts_per_cable_cableArrangement	
-activeCores_size
-activeCores_sizeUnit
-activeCores_number
-neutralCores_size
-neutralCores_sizeUnit
-neutralCores_number
-earthCores_size
-earthCores_sizeUnit
-earthCores_number
-insulation_name
-insulation_code
-insulation_conductorTemperature
-insulation_maxTemperature
-sheath
-cableScreen_name
-cableScreen_faultWithstand
-armoured
-coreScreen_type
-voltRating
-isFlex
-impedance_MVAM
-impedance_rOhmsPerKM
-impedance_xOhmsPerKM
-impedance_zOhmsPerKM
-manufacturer_name
-manufacturer_partNumber
-rev_number
-rev_date
-unenclosed_partial_current
-unenclosed_partial_installTemp
-unenclosed_partial_cableArrangement
-unenclosed_complete_current
-unenclosed_complete_installTemp
-unenclosed_complete_cableArrangement
-underground_ducts_current
-underground_ducts_installTemp
-underground_ducts_cableArrangement
-CableScreen_name
-CableScreen_faultWithstand
-CoreScreen_type
\ No newline at end of file
+"""
+The column headers used by the manufacturer cable catalogue .csv files. Each row of a catalogue file describes a single
+cable and the columns are listed in the order they appear in the file.
+"""
+
+HEADERS = (
+    "conductorMaterial",
+    "cableCoreArrangement",
+    "cableType",
+    "circuitType",
+    "description",
+    "unenclosed_spaced_current",
+    "unenclosed_spaced_installTemp",
+    "unenclosed_spaced_cableArrangement",
+    "unenclosed_surface_current",
+    "unenclosed_surface_installTemp",
+    "unenclosed_surface_cableArrangement",
+    "unenclosed_touching_current",
+    "unenclosed_touching_installTemp",
+    "unenclosed_touching_cableArrangement",
+    "enclosed_conduit_current",
+    "enclosed_conduit_installTemp",
+    "enclosed_conduit_cableArrangement",
+    "enclosed_partial_current",
+    "enclosed_partial_installTemp",
+    "enclosed_partial_cableArrangement",
+    "enclosed_complete_current",
+    "enclosed_complete_installTemp",
+    "enclosed_complete_cableArrangement",
+    "buried_direct_current",
+    "buried_direct_installTemp",
+    "buried_direct_cableArrangement",
+    "ducts_single_current",
+    "ducts_single_installTemp",
+    "ducts_single_cableArrangement",
+    "ducts_per_cable_current",
+    "ducts_per_cable_installTemp",
+    "ducts_per_cable_cableArrangement",
+    "activeCores_size",
+    "activeCores_sizeUnit",
+    "activeCores_number",
+    "neutralCores_size",
+    "neutralCores_sizeUnit",
+    "neutralCores_number",
+    "earthCores_size",
+    "earthCores_sizeUnit",
+    "earthCores_number",
+    "insulation_name",
+    "insulation_code",
+    "insulation_conductorTemperature",
+    "insulation_maxTemperature",
+    "sheath",
+    "cableScreen_name",
+    "cableScreen_faultWithstand",
+    "armoured",
+    "coreScreen_type",
+    "voltRating",
+    "isFlex",
+    "impedance_MVAM",
+    "impedance_rOhmsPerKM",
+    "impedance_xOhmsPerKM",
+    "impedance_zOhmsPerKM",
+    "manufacturer_name",
+    "manufacturer_partNumber",
+    "rev_number",
+    "rev_date",
+    "unenclosed_partial_current",
+    "unenclosed_partial_installTemp",
+    "unenclosed_partial_cableArrangement",
+    "unenclosed_complete_current",
+    "unenclosed_complete_installTemp",
+    "unenclosed_complete_cableArrangement",
+    "underground_ducts_current",
+    "underground_ducts_installTemp",
+    "underground_ducts_cableArrangement",
+    "CableScreen_name",
+    "CableScreen_faultWithstand",
+    "CoreScreen_type",
+)
+
+"""Headers that duplicate an earlier column with different capitalisation. The values are the canonical column name."""
+ALIASES = {
+    "CableScreen_name": "cableScreen_name",
+    "CableScreen_faultWithstand": "cableScreen_faultWithstand",
+    "CoreScreen_type": "coreScreen_type",
+}
@@ -0,0 +1,359 @@
+"""
+Indexes built over a CableCatalogue to speed up cable selection. Bitsets are stored as python ints, where bit n is set
+when catalogue row n matches.
+"""
+import bisect
+from array import array
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+import CableSizer.installmethods as installmethods
+import CableSizer.schema as schema
+
+"""The categorical catalogue columns held in the bitmap index."""
+CATEGORICAL_COLUMNS = (
+    "conductorMaterial",
+    "cableCoreArrangement",
+    "cableType",
+    "circuitType",
+    "activeCores_sizeUnit",
+    "insulation_name",
+    "insulation_code",
+    "sheath",
+    "cableScreen_name",
+    "armoured",
+    "coreScreen_type",
+    "voltRating",
+    "isFlex",
+    "manufacturer_name",
+)
+
+"""The catalogue column used to filter each categorical CableSpec attribute."""
+SPEC_COLUMNS = {
+    "type": "cableType",
+    "conductor_material": "conductorMaterial",
+    "core_arrangement": "cableCoreArrangement",
+    "sheath": "sheath",
+    "insulation_material": "insulation_name",
+    "insulation_code": "insulation_code",
+    "armour": "armoured",
+    "screen_cable": "cableScreen_name",
+    "screen_core": "coreScreen_type",
+    "volt_rating": "voltRating",
+}
+
+"""The installation methods listed in the catalogue headers. Each method has a matching '<method>_current' column."""
+INSTALL_METHODS = tuple(method.column for method in installmethods.CATALOGUE_METHODS)
+
+"""The bit positions set in each byte value, used to iterate over the rows in a bitset."""
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+
+
+def normalise_install_method(install_method: str) -> str:
+    """
+    Convert an installation method name to the catalogue's column prefix. The name is matched without regard to case
+    or underscores, e.g. 'UNENCLOSED_SPACED' and 'unenclosedSpaced' both return 'unenclosed_spaced'.
+    :param install_method: The installation method name.
+    :return: The catalogue column prefix.
+    """
+    method = installmethods.get(install_method)
+    if method.column is None:
+        raise ValueError(f"Installation method ({install_method}) has no catalogue columns.")
+    return method.column
+
+
+def iter_rows(bitset: int) -> Iterator[int]:
+    """
+    Iterate over the row numbers set in a bitset, in ascending order.
+    :param bitset: The bitset.
+    :return: An iterator of row numbers.
+    """
+    data = bitset.to_bytes((bitset.bit_length() + 7) // 8, "little")
+    for offset, byte in enumerate(data):
+        if byte:
+            base = offset * 8
+            for bit in _BYTE_BITS[byte]:
+                yield base + bit
+
+
+def count_rows(bitset: int) -> int:
+    """
+    The number of rows set in a bitset.
+    """
+    return bin(bitset).count("1")
+
+
+def build_bitset(rows: Iterable[int], length: int) -> int:
+    """
+    Build a bitset from a number of row numbers.
+    :param rows: The row numbers to set.
+    :param length: The number of rows in the catalogue.
+    :return: The bitset.
+    """
+    data = bytearray((length + 7) // 8)
+    for row in rows:
+        data[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(data, "little")
+
+
+class BitmapIndex:
+    """
+    A bitmap index over the categorical columns of a CableCatalogue. A bitset is held for every (column, value) pair so
+    that a query is reduced to a handful of bitwise ANDs. The bitsets of dictionary encoded columns are keyed by code.
+    """
+    def __init__(self, catalogue, columns: Iterable[str] = CATEGORICAL_COLUMNS):
+        """
+        :param catalogue: The CableCatalogue to index.
+        :param columns: The catalogue columns to index.
+        """
+        self._length: int = len(catalogue)
+        self._bitmaps: Dict[str, Dict[Union[str, int], int]] = {}
+        for column in columns:
+            self._bitmaps[column] = self._index_column(catalogue.column(column))
+
+    @classmethod
+    def from_bitmaps(cls, length: int, bitmaps: Dict[str, Dict[Union[str, int], int]]):
+        """
+        Restore an index from previously built bitsets, e.g. when loading a compiled catalogue.
+        :param length: The number of rows in the catalogue.
+        :param bitmaps: The bitsets keyed by column and then by stored value, i.e. by code for encoded columns.
+        :return: BitmapIndex
+        """
+        index = cls.__new__(cls)
+        index._length = length
+        index._bitmaps = bitmaps
+        return index
+
+    def _index_column(self, values) -> Dict[Union[str, int], int]:
+        nbytes = (self._length + 7) // 8
+        bits: Dict[Union[str, int], bytearray] = {}
+        for row, value in enumerate(values):
+            data = bits.get(value)
+            if data is None:
+                data = bits[value] = bytearray(nbytes)
+            data[row >> 3] |= 1 << (row & 7)
+        return {value: int.from_bytes(data, "little") for value, data in bits.items()}
+
+    def __len__(self) -> int:
+        return self._length
+
+    def set_row(self, row: int, values: dict, old: dict = None):
+        """
+        Patch the index after a catalogue row is added or changed.
+        :param row: The row number.
+        :param values: The row's new stored values keyed by catalogue column.
+        :param old: The row's previous stored values, or None if the row has been added.
+        """
+        bit = 1 << row
+        for column, bitmaps in self._bitmaps.items():
+            value = values[column]
+            if old is not None:
+                if old[column] == value:
+                    continue
+                remaining = bitmaps.get(old[column], 0) & ~bit
+                if remaining:
+                    bitmaps[old[column]] = remaining
+                else:
+                    bitmaps.pop(old[column], None)
+            bitmaps[value] = bitmaps.get(value, 0) | bit
+        self._length = max(self._length, row + 1)
+
+    @property
+    def all_rows(self) -> int:
+        return (1 << self._length) - 1
+
+    @property
+    def columns(self) -> tuple:
+        return tuple(self._bitmaps)
+
+    def values(self, column: str) -> tuple:
+        """
+        The distinct values held in an indexed column. Dictionary encoded columns are decoded.
+        """
+        table = schema.TABLES.get(column)
+        if table is None:
+            return tuple(self._bitmaps[column])
+        return tuple(table.decode(code) for code in self._bitmaps[column])
+
+    def bitmap(self, column: str, value: Union[str, int, bool]) -> int:
+        """
+        Return the bitset of rows where column equals value. Rows are not matched if the value is not in the column.
+        :param column: The catalogue column.
+        :param value: The value to match. String values are matched without regard to case.
+        :return: The bitset.
+        """
+        table = schema.TABLES.get(column)
+        if table is not None and isinstance(value, str):
+            value = table.code(value)
+            if value is None:
+                return 0
+        elif isinstance(value, str):
+            value = value.upper()
+        elif isinstance(value, bool):
+            value = int(value)
+        return self._bitmaps[column].get(value, 0)
+
+    def match(self, bitset: int = None, **criteria) -> int:
+        """
+        Return the bitset of rows matching all of the criteria. Each criterion is a column name and either a single
+        value or a list of values, any of which may match.
+        :param bitset: An optional bitset the result is restricted to.
+        :param criteria: Column names and the values to match.
+        :return: The bitset.
+        """
+        result = self.all_rows if bitset is None else bitset
+        for column, value in criteria.items():
+            if isinstance(value, (list, tuple, set)):
+                mask = 0
+                for each in value:
+                    mask |= self.bitmap(column, each)
+            else:
+                mask = self.bitmap(column, value)
+            result &= mask
+            if not result:
+                break
+        return result
+
+    def query(self, spec) -> int:
+        """
+        Return the bitset of rows matching the categorical criteria of a CableSpec. Empty criteria match all rows. The
+        flexible criterion only restricts the result to flexible cables when it is True.
+        :param spec: The CableSpec.
+        :return: The bitset.
+        """
+        criteria = {}
+        for attribute, column in SPEC_COLUMNS.items():
+            value = getattr(spec, attribute)
+            if value:
+                criteria[column] = value
+        if spec.flexible:
+            criteria["isFlex"] = 1
+        return self.match(**criteria)
+
+
+class AmpacityIndex:
+    """
+    An index of catalogue rows ordered by current carrying capacity for each installation method. Rows within a method
+    are sorted by capacity and then by active conductor size, so the smallest cable meeting a required capacity is
+    found with a bisect. Rows without a rating for a method are not included in that method's index.
+    """
+    def __init__(self, catalogue, methods: Iterable[str] = INSTALL_METHODS):
+        """
+        :param catalogue: The CableCatalogue to index.
+        :param methods: The installation methods to index.
+        """
+        self._length: int = len(catalogue)
+        self._size = catalogue.column("activeCores_size")
+        self._rows: Dict[str, array] = {}
+        self._ccc: Dict[str, array] = {}
+        for method in methods:
+            ccc = catalogue.column(f"{method}_current")
+            size = self._size
+            rows = sorted((row for row in range(self._length) if ccc[row] > 0), key=lambda row: (ccc[row], size[row]))
+            self._rows[method] = array("l", rows)
+            self._ccc[method] = array("d", (ccc[row] for row in rows))
+
+    @classmethod
+    def from_arrays(cls, catalogue, rows: Dict[str, array], ccc: Dict[str, array]):
+        """
+        Restore an index from previously sorted rows and capacities, e.g. when loading a compiled catalogue.
+        :param catalogue: The CableCatalogue the index was built from.
+        :param rows: The sorted rows keyed by installation method.
+        :param ccc: The sorted capacities keyed by installation method.
+        :return: AmpacityIndex
+        """
+        index = cls.__new__(cls)
+        index._length = len(catalogue)
+        index._size = catalogue.column("activeCores_size")
+        index._rows = rows
+        index._ccc = ccc
+        return index
+
+    @property
+    def methods(self) -> tuple:
+        return tuple(self._rows)
+
+    def _position(self, method: str, ccc: float, row: int) -> int:
+        """
+        The position of a row, or the position it is inserted at, in a method's ordering of (ccc, size, row).
+        """
+        rows, size = self._rows[method], self._size
+        position = bisect.bisect_left(self._ccc[method], ccc)
+        end = bisect.bisect_right(self._ccc[method], ccc, position)
+        key = (size[row], row)
+        while position < end and (size[rows[position]], rows[position]) < key:
+            position += 1
+        return position
+
+    def set_row(self, row: int, values: dict, old: dict = None):
+        """
+        Patch the index after a catalogue row is added or changed. The catalogue must already hold the row's new values.
+        :param row: The row number.
+        :param values: The row's new values keyed by catalogue column.
+        :param old: The row's previous values, or None if the row has been added.
+        """
+        for method, rows in self._rows.items():
+            column = f"{method}_current"
+            ccc = self._ccc[method]
+            if old is not None:
+                if old[column] == values[column] and old["activeCores_size"] == values["activeCores_size"]:
+                    continue
+                if old[column] > 0:
+                    position = bisect.bisect_left(ccc, old[column])
+                    while rows[position] != row:
+                        position += 1
+                    del rows[position]
+                    del ccc[position]
+            if values[column] > 0:
+                position = self._position(method, values[column], row)
+                rows.insert(position, row)
+                ccc.insert(position, values[column])
+        self._length = max(self._length, row + 1)
+
+    def rows(self, install_method: str) -> array:
+        """
+        The rows rated for an installation method, in ascending order of current carrying capacity.
+        """
+        return self._rows[normalise_install_method(install_method)]
+
+    def capacities(self, install_method: str) -> array:
+        """
+        The current carrying capacities matching rows(), in ascending order.
+        """
+        return self._ccc[normalise_install_method(install_method)]
+
+    def candidates(self, install_method: str, required_ccc: float, bitset: int = None,
+                   min_size: float = 0.0) -> Iterator[int]:
+        """
+        Iterate over the rows with a current carrying capacity of at least required_ccc, smallest capacity first.
+        :param install_method: The installation method.
+        :param required_ccc: The required current carrying capacity.
+        :param bitset: An optional bitset of the rows that may be returned, e.g. from BitmapIndex.query().
+        :param min_size: The minimum active conductor size, in the units of the activeCores_size column. Use
+        CSAMatrix.at_least() for a minimum in mm².
+        :return: An iterator of row numbers.
+        """
+        method = normalise_install_method(install_method)
+        rows = self._rows[method]
+        start = bisect.bisect_left(self._ccc[method], required_ccc)
+        size = self._size
+        allowed = None if bitset is None else bitset.to_bytes((self._length + 7) // 8, "little")
+        for position in range(start, len(rows)):
+            row = rows[position]
+            if allowed is not None and not allowed[row >> 3] >> (row & 7) & 1:
+                continue
+            if size[row] < min_size:
+                continue
+            yield row
+
+    def smallest(self, install_method: str, required_ccc: float, bitset: int = None,
+                 min_size: float = 0.0) -> Optional[int]:
+        """
+        Find the row with the smallest current carrying capacity of at least required_ccc.
+        :param install_method: The installation method.
+        :param required_ccc: The required current carrying capacity.
+        :param bitset: An optional bitset of the rows that may be returned, e.g. from BitmapIndex.query().
+        :param min_size: The minimum active conductor size, in the units of the activeCores_size column. Use
+        CSAMatrix.at_least() for a minimum in mm².
+        :return: The row number, or None if no row is suitable.
+        """
+        return next(self.candidates(install_method, required_ccc, bitset, min_size), None)
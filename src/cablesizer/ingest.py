@@ -0,0 +1,54 @@
+"""
+Parallel ingestion of manufacturer catalogue .csv files. Each file is parsed in a worker process and returned to the
+parent in the compact compiled catalogue format, so the parent only ever handles typed columns.
+"""
+import concurrent.futures as futures
+from pathlib import Path
+from typing import Sequence, Union
+
+import CableSizer.catalogue as catalogue
+import CableSizer.cataloguecache as cataloguecache
+import CableSizer.csvimporter as csvimporter
+
+
+def parse_file(fp: Union[str, Path], chunk_size: int = 5000) -> bytes:
+    """
+    Parse a single catalogue .csv file. This is the work done in each worker process.
+    :param fp: The .csv file.
+    :param chunk_size: The number of rows read from the file at a time.
+    :return: The parsed catalogue in the compiled catalogue format, without indexes.
+    """
+    cable_catalogue = csvimporter.CSVImporter(fp, chunk_size).load()
+    return cataloguecache.to_bytes(cable_catalogue, include_indexes=False)
+
+
+def ingest_files(fps: Sequence[Union[str, Path]], jobs: int = None, on_conflict: str = "raise",
+                 chunk_size: int = 5000) -> catalogue.CableCatalogue:
+    """
+    Parse a number of catalogue .csv files in a process pool and merge them into a single catalogue. The files are
+    merged in the order given, so the result does not depend on which worker finishes first.
+    :param fps: The .csv files.
+    :param jobs: The number of worker processes. Defaults to the number of processors. The files are parsed in this
+    process if jobs is 1.
+    :param on_conflict: How conflicting part numbers are handled, see CableCatalogue.merge().
+    :param chunk_size: The number of rows read from each file at a time.
+    :return: CableCatalogue
+    """
+    cable_catalogue = catalogue.CableCatalogue()
+    fps = [str(fp) for fp in fps]
+    if jobs == 1 or len(fps) < 2:
+        payloads = (parse_file(fp, chunk_size) for fp in fps)
+        _merge(cable_catalogue, fps, payloads, on_conflict)
+        return cable_catalogue
+    with futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        payloads = pool.map(parse_file, fps, [chunk_size] * len(fps))
+        _merge(cable_catalogue, fps, payloads, on_conflict)
+    return cable_catalogue
+
+
+def _merge(cable_catalogue: catalogue.CableCatalogue, fps: Sequence[str], payloads, on_conflict: str):
+    for fp, payload in zip(fps, payloads):
+        try:
+            cable_catalogue.merge(cataloguecache.from_buffer(payload), on_conflict)
+        except ValueError as error:
+            raise ValueError(f"{fp}: {error}") from error
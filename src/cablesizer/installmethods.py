@@ -0,0 +1,113 @@
+"""
+The registry of cable installation methods. Each method is given an integer id when the module is imported, and a
+cable's current carrying capacities are stored in a single array indexed by the id, see Cable.installation_ccc_many().
+
+The methods are defined as data: the methods with a '<method>_current' column in importcables.HEADERS, followed by the
+physical installations listed in Constants/cable.json that have no column. A new method is added by adding its columns
+to the headers or its name to cable.json. Names are matched without regard to case or underscores, so
+'UNENCLOSED_SPACED', 'unenclosed_spaced' and 'unenclosedSpaced' all refer to the same method.
+"""
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple, Union
+
+import CableSizer.enumerations as enumerations
+import CableSizer.importcables as importcables
+
+"""The path in cable.json of the physical installation names."""
+_CONSTANTS_PATH = ("install_method", "physical_installation", "description")
+
+
+class InstallMethod(NamedTuple):
+    """
+    A registered installation method.
+    id: The method's index in a cable's capacity array.
+    name: The method name in lower case, e.g. 'unenclosed_spaced'. The method's key in Cable.to_dict().
+    attribute: The Cable attribute giving access to the method's details, e.g. 'unenclosedSpaced'.
+    column: The prefix of the method's catalogue columns, or None if the catalogue has no columns for the method.
+    """
+    id: int
+    name: str
+    attribute: str
+    column: Optional[str]
+
+
+def key(name: str) -> str:
+    """
+    The normalised form of a method name used to match names, i.e. upper case with the underscores removed.
+    """
+    return name.upper().replace("_", "")
+
+
+def _attribute(name: str) -> str:
+    first, *rest = name.split("_")
+    return first + "".join(word.capitalize() for word in rest)
+
+
+def _method_names() -> Tuple[Tuple[str, Optional[str]], ...]:
+    names = [(header[:-len("_current")], header[:-len("_current")]) for header in importcables.HEADERS
+             if header.endswith("_current")]
+    seen = {key(name) for name, _ in names}
+    constants = enumerations.load_constants()
+    for name in enumerations.seed_values(constants, [_CONSTANTS_PATH]):
+        if key(name) not in seen:
+            seen.add(key(name))
+            names.append((name.lower(), None))
+    return tuple(names)
+
+
+"""The registered methods, in id order."""
+METHODS: Tuple[InstallMethod, ...] = tuple(InstallMethod(index, name, _attribute(name), column)
+                                           for index, (name, column) in enumerate(_method_names()))
+
+"""The methods with catalogue columns, in column order."""
+CATALOGUE_METHODS: Tuple[InstallMethod, ...] = tuple(method for method in METHODS if method.column is not None)
+
+COUNT = len(METHODS)
+
+_IDS: Dict[str, int] = {key(method.name): method.id for method in METHODS}
+
+"""The id of each name already looked up, so a name is only normalised the first time it is seen."""
+_LOOKUP: Dict[str, int] = {}
+
+
+def find(method: Union[str, int]) -> Optional[int]:
+    """
+    Look up the id of an installation method.
+    :param method: The method name, or its id.
+    :return: The method id, or None if the method is not registered.
+    """
+    if isinstance(method, int):
+        return method if 0 <= method < COUNT else None
+    result = _LOOKUP.get(method)
+    if result is None:
+        result = _IDS.get(key(method))
+        if result is not None:
+            _LOOKUP[method] = result
+    return result
+
+
+def method_id(method: Union[str, int]) -> int:
+    """
+    Look up the id of an installation method.
+    :param method: The method name, or its id.
+    :return: The method id.
+    """
+    result = find(method)
+    if result is None:
+        raise ValueError(f"Unknown installation method ({method}).")
+    return result
+
+
+def method_ids(methods: Iterable[Union[str, int]]) -> Tuple[int, ...]:
+    """
+    Look up the ids of a number of installation methods, e.g. for Cable.installation_ccc_many().
+    """
+    return tuple(method_id(method) for method in methods)
+
+
+def get(method: Union[str, int]) -> InstallMethod:
+    """
+    The details of an installation method.
+    :param method: The method name, or its id.
+    :return: InstallMethod
+    """
+    return METHODS[method_id(method)]
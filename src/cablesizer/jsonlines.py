@@ -0,0 +1,196 @@
+"""
+JSON Lines files for catalogues and cable schedules, i.e. one JSON record per line. Catalogue rows are written in the
+shape returned by CableCatalogue.export_row() and cable runs in the shape returned by CableRun.to_dict(), so files
+written by other tools only need to follow the same shapes.
+
+Records can be appended to an existing file. A large file is read in parallel by splitting it into byte ranges that
+start and end on line boundaries, and parsing each range in a worker process.
+"""
+import concurrent.futures as futures
+import json
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple, Union
+
+import CableSizer.cable as cable
+import CableSizer.catalogue as catalogue
+import CableSizer.cataloguecache as cataloguecache
+import CableSizer.serializers as serializers
+
+"""The number of records encoded before they are written to the file."""
+CHUNK_SIZE = 1000
+
+"""The smallest byte range parsed by a worker process. Files smaller than two ranges are read in this process."""
+MIN_RANGE = 1 << 20
+
+
+def write_lines(records: Iterable, fp: Union[str, Path], append: bool = False, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Write records to a JSON Lines file, a chunk at a time.
+    :param records: The records. Generators are consumed as they are written.
+    :param fp: The file.
+    :param append: Add the records to the end of an existing file rather than replacing it.
+    :param chunk_size: The number of records written at a time.
+    :return: The number of records written.
+    """
+    encode = json.JSONEncoder(default=serializers.json_default, separators=(",", ":")).encode
+    count = 0
+    pending = []
+    with open(fp, "a" if append else "w", encoding="utf-8", newline="\n") as output:
+        for record in records:
+            pending.append(encode(record) + "\n")
+            count += 1
+            if len(pending) >= chunk_size:
+                output.write("".join(pending))
+                pending.clear()
+        output.write("".join(pending))
+    return count
+
+
+def _parse(data: bytes, fp, offset: int) -> list:
+    records = []
+    for line in data.split(b"\n"):
+        if line.strip():
+            try:
+                records.append(json.loads(line))
+            except ValueError as error:
+                raise ValueError(f"{fp}: The line at byte {offset} is not valid JSON ({error}).") from error
+        offset += len(line) + 1
+    return records
+
+
+def iter_lines(fp: Union[str, Path]) -> Iterator:
+    """
+    Read the records of a JSON Lines file one at a time. Blank lines are skipped.
+    """
+    offset = 0
+    with open(fp, "rb") as source:
+        for line in source:
+            yield from _parse(line.rstrip(b"\n"), fp, offset)
+            offset += len(line)
+
+
+def byte_ranges(fp: Union[str, Path], parts: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into byte ranges of about the same size. Each range starts at the beginning of a line and ends after
+    a line break, or at the end of the file.
+    :param fp: The file.
+    :param parts: The number of ranges wanted. Fewer ranges are returned if the file has too few lines.
+    :return: The (start, end) of each range.
+    """
+    size = os.path.getsize(fp)
+    boundaries = [0]
+    with open(fp, "rb") as source:
+        for part in range(1, parts):
+            position = size * part // parts
+            if position <= boundaries[-1]:
+                continue
+            source.seek(position - 1)
+            source.readline()
+            boundary = min(source.tell(), size)
+            if boundaries[-1] < boundary < size:
+                boundaries.append(boundary)
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def read_range(fp: Union[str, Path], start: int, end: int) -> list:
+    """
+    Parse the records in a byte range of a JSON Lines file. This is the work done in each worker process.
+    :param fp: The file.
+    :param start: The first byte of the range. Must be the start of a line.
+    :param end: The byte after the range. Must follow a line break, or be the end of the file.
+    :return: The records, in file order.
+    """
+    with open(fp, "rb") as source:
+        source.seek(start)
+        data = source.read(end - start)
+    return _parse(data, fp, start)
+
+
+def _ranges(fp: Union[str, Path], jobs: Union[int, None], min_range: int) -> List[Tuple[int, int]]:
+    parts = min(jobs or os.cpu_count() or 1, os.path.getsize(fp) // min_range)
+    return byte_ranges(fp, max(parts, 1))
+
+
+def _map(function, fp: Union[str, Path], ranges: List[Tuple[int, int]], jobs: Union[int, None]):
+    """
+    Apply a function to each byte range, in a process pool when there is more than one range. The results are
+    returned in file order.
+    """
+    fp = str(fp)
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    if len(ranges) < 2:
+        yield from map(function, [fp] * len(ranges), starts, ends)
+        return
+    with futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(function, [fp] * len(ranges), starts, ends)
+
+
+def read_lines(fp: Union[str, Path], jobs: int = None, min_range: int = MIN_RANGE) -> list:
+    """
+    Read every record of a JSON Lines file, parsing byte ranges of the file in a process pool.
+    :param fp: The file.
+    :param jobs: The number of worker processes. Defaults to the number of processors. The file is read in this
+    process if jobs is 1.
+    :param min_range: The smallest byte range parsed by a worker.
+    :return: The records, in file order.
+    """
+    records = []
+    for chunk in _map(read_range, fp, _ranges(fp, jobs, min_range), jobs):
+        records.extend(chunk)
+    return records
+
+
+def dump_catalogue(cable_catalogue: catalogue.CableCatalogue, fp: Union[str, Path], append: bool = False) -> int:
+    """
+    Write the rows of a catalogue to a JSON Lines file, see CableCatalogue.export_row().
+    :return: The number of rows written.
+    """
+    return write_lines((cable_catalogue.export_row(index) for index in range(len(cable_catalogue))), fp, append)
+
+
+def parse_catalogue_range(fp: Union[str, Path], start: int, end: int) -> bytes:
+    """
+    Parse the catalogue rows in a byte range of a JSON Lines file. This is the work done in each worker process.
+    :return: The rows in the compiled catalogue format, without indexes.
+    """
+    return cataloguecache.to_bytes(catalogue.CableCatalogue(read_range(fp, start, end)), include_indexes=False)
+
+
+def load_catalogue(fp: Union[str, Path], jobs: int = None, min_range: int = MIN_RANGE) -> catalogue.CableCatalogue:
+    """
+    Read a catalogue from a JSON Lines file of rows, parsing byte ranges of the file in a process pool. Each worker
+    returns its rows as typed columns, see ingest.
+    :param fp: The file.
+    :param jobs: The number of worker processes, see read_lines().
+    :param min_range: The smallest byte range parsed by a worker.
+    :return: CableCatalogue, with the rows in file order.
+    """
+    cable_catalogue = catalogue.CableCatalogue()
+    for payload in _map(parse_catalogue_range, fp, _ranges(fp, jobs, min_range), jobs):
+        chunk = cataloguecache.from_buffer(payload)
+        cable_catalogue.extend_columns({name: chunk.column(name) for name in chunk.columns}, len(chunk))
+    return cable_catalogue
+
+
+def dump_runs(runs: Iterable[cable.CableRun], fp: Union[str, Path], append: bool = False) -> int:
+    """
+    Write cable runs to a JSON Lines file, see CableRun.to_dict().
+    :param runs: The runs. Generators are consumed as they are written.
+    :return: The number of runs written.
+    """
+    return write_lines((serializers.to_dict(run) for run in runs), fp, append)
+
+
+def load_runs(fp: Union[str, Path], jobs: int = None, min_range: int = MIN_RANGE) -> List[cable.CableRun]:
+    """
+    Read cable runs from a JSON Lines file, parsing byte ranges of the file in a process pool. The runs are built in
+    this process so that their cables share sub-objects, see cable.flyweight().
+    :param fp: The file.
+    :param jobs: The number of worker processes, see read_lines().
+    :param min_range: The smallest byte range parsed by a worker.
+    :return: The runs, in file order.
+    """
+    return serializers.load_many(cable.CableRun, read_lines(fp, jobs, min_range))
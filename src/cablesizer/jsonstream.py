@@ -0,0 +1,241 @@
+"""
+Streaming JSON for catalogues and cable schedules. Records are written to, and read from, a JSON array one at a time,
+so exporting a full project only holds a single chunk of encoded records in memory, and records can be read while the
+file is still arriving, e.g. from a pipe or a socket.
+
+The files are ordinary JSON arrays: files written here can be read with json.load(), and iter_array() reads any JSON
+array. Catalogue rows are written with export_row() and cable runs with serializers.to_dict().
+"""
+import codecs
+import contextlib
+import json
+from pathlib import Path
+from typing import IO, Iterable, Iterator, List, Union
+
+import CableSizer.cable as cable
+import CableSizer.catalogue as catalogue
+import CableSizer.serializers as serializers
+
+"""The number of records encoded before they are written to the file and the file is flushed."""
+CHUNK_SIZE = 1000
+
+"""The number of characters, or bytes, read from a file at a time."""
+BLOCK_SIZE = 1 << 16
+
+_WHITESPACE = frozenset(" \t\n\r")
+
+
+@contextlib.contextmanager
+def _opened(file: Union[str, Path, IO], mode: str):
+    """
+    Open a path, or use a file-like object that is already open.
+    """
+    if isinstance(file, (str, Path)):
+        with open(file, mode, encoding="utf-8") as opened:
+            yield opened
+    else:
+        yield file
+
+
+class ArrayWriter:
+    """
+    Write records to a JSON array in a file-like object. Records are encoded as they are written and the encoded text
+    is written to the file, and the file flushed, every chunk_size records. The closing bracket is written by close(),
+    or when the writer is used as a context manager and the block exits without an exception.
+    """
+    def __init__(self, file: IO[str], chunk_size: int = CHUNK_SIZE):
+        """
+        :param file: A file-like object open for writing text.
+        :param chunk_size: The number of records written to the file at a time.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"The chunk size ({chunk_size}) must be at least 1.")
+        self._file = file
+        self._chunk_size = chunk_size
+        self._encode = json.JSONEncoder(default=serializers.json_default, separators=(",", ":")).encode
+        self._pending: List[str] = []
+        self.count: int = 0
+        self._file.write("[")
+
+    def __enter__(self) -> "ArrayWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+    def write(self, record):
+        """
+        Add a record to the array.
+        :param record: A JSON compatible value. Dates are written as ISO 8601 strings.
+        """
+        text = self._encode(record)
+        self._pending.append("," + text if self.count else text)
+        self.count += 1
+        if len(self._pending) >= self._chunk_size:
+            self.flush()
+
+    def write_many(self, records: Iterable):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        """
+        Write the pending records to the file and flush it.
+        """
+        if self._pending:
+            self._file.write("".join(self._pending))
+            self._pending.clear()
+        if hasattr(self._file, "flush"):
+            self._file.flush()
+
+    def close(self):
+        """
+        Write the pending records and the closing bracket. The file itself is not closed.
+        """
+        self._pending.append("]")
+        self.flush()
+
+
+class _Buffer:
+    """
+    The unread text of a file, read a block at a time. Consumed text is discarded once a block has been consumed, so
+    only the records being decoded are held in memory.
+    """
+    def __init__(self, file: IO, block_size: int):
+        self._read = file.read
+        self._block_size = block_size
+        self._decoder = None
+        self.text = ""
+        self.position = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """
+        Read the next block of the file.
+        :return: False if the end of the file had already been reached.
+        """
+        if self.eof:
+            return False
+        block = self._read(self._block_size)
+        if not block:
+            self.eof = True
+            block = self._decoder.decode(b"", final=True) if self._decoder else ""
+        elif isinstance(block, bytes):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            block = self._decoder.decode(block)
+        if self.position > self._block_size:
+            self.text = self.text[self.position:]
+            self.position = 0
+        self.text += block
+        return True
+
+    def next_char(self) -> str:
+        """
+        Skip whitespace and return the next character without consuming it.
+        :return: The character, or "" at the end of the file.
+        """
+        while True:
+            text = self.text
+            while self.position < len(text) and text[self.position] in _WHITESPACE:
+                self.position += 1
+            if self.position < len(text):
+                return text[self.position]
+            if not self.fill():
+                return ""
+
+    def decode(self, raw_decode):
+        """
+        Decode the value starting at the current position, reading more of the file until the value is complete.
+        """
+        while True:
+            try:
+                value, end = raw_decode(self.text, self.position)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number or literal ending at the end of the text may continue in the next block.
+            if end == len(self.text) and self.fill():
+                continue
+            self.position = end
+            return value
+
+
+def iter_array(file: Union[str, Path, IO], block_size: int = BLOCK_SIZE) -> Iterator:
+    """
+    Read the records of a JSON array one at a time. The file is read a block at a time, so records are returned as
+    soon as they have arrived and the whole file is never held in memory.
+    :param file: The path of the file, or a file-like object open for reading text or bytes.
+    :param block_size: The number of characters, or bytes, read at a time.
+    :return: An iterator of the records.
+    """
+    raw_decode = json.JSONDecoder().raw_decode
+    with _opened(file, "r") as opened:
+        buffer = _Buffer(opened, block_size)
+        if buffer.next_char() != "[":
+            raise ValueError("The file does not contain a JSON array.")
+        buffer.position += 1
+        if buffer.next_char() == "]":
+            return
+        while True:
+            buffer.next_char()
+            yield buffer.decode(raw_decode)
+            char = buffer.next_char()
+            buffer.position += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' but found ({char or 'the end of the file'}).")
+
+
+def write_array(records: Iterable, file: Union[str, Path, IO], chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Write records to a JSON array, a chunk at a time.
+    :param records: The records. Generators are consumed as they are written.
+    :param file: The path of the file, or a file-like object open for writing text.
+    :param chunk_size: The number of records written to the file at a time.
+    :return: The number of records written.
+    """
+    with _opened(file, "w") as opened:
+        with ArrayWriter(opened, chunk_size) as writer:
+            writer.write_many(records)
+    return writer.count
+
+
+def dump_catalogue(cable_catalogue: catalogue.CableCatalogue, file: Union[str, Path, IO],
+                   chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Write the rows of a catalogue to a JSON array of dictionaries keyed by catalogue header.
+    :return: The number of rows written.
+    """
+    return write_array((cable_catalogue.export_row(index) for index in range(len(cable_catalogue))), file,
+                       chunk_size)
+
+
+def load_catalogue(file: Union[str, Path, IO], block_size: int = BLOCK_SIZE) -> catalogue.CableCatalogue:
+    """
+    Read a catalogue from a JSON array of rows, e.g. as written by dump_catalogue(). Each row is added to the catalogue
+    as it is read.
+    """
+    cable_catalogue = catalogue.CableCatalogue()
+    cable_catalogue.extend(iter_array(file, block_size))
+    return cable_catalogue
+
+
+def dump_runs(runs: Iterable[cable.CableRun], file: Union[str, Path, IO], chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Write cable runs to a JSON array of the runs' dictionaries, see CableRun.to_dict().
+    :param runs: The runs. Generators are consumed as they are written.
+    :return: The number of runs written.
+    """
+    return write_array((serializers.to_dict(run) for run in runs), file, chunk_size)
+
+
+def iter_runs(file: Union[str, Path, IO], block_size: int = BLOCK_SIZE) -> Iterator[cable.CableRun]:
+    """
+    Read cable runs one at a time from a JSON array written by dump_runs() or serializers.save().
+    """
+    for details in iter_array(file, block_size):
+        yield serializers.from_dict(cable.CableRun, details)
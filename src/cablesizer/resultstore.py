@@ -0,0 +1,227 @@
+"""
+A persistent store of cable selections held in an SQLite file. Selections are keyed by the digest of the catalogue they
+were selected from, see CableCatalogue.digest, the digest of the sizing inputs shared by a group of runs, see
+group_key(), and the run's own required_ccc, load current and length. A later sizing job, in this or another process or
+on another machine sharing the file, reuses the selections of unchanged runs and only sizes the runs that are new or
+have changed.
+
+A file shared between machines, e.g. on a network filesystem, must use the rollback journal, which is the default.
+SQLite's write-ahead log, journal_mode='WAL', lets readers continue while a job writes, but needs shared memory on a
+single host and must only be used when every process using the file runs on the same machine.
+
+Every selection records when it was last used. vacuum() deletes the selections that have not been used for a given
+time, or that were selected from other catalogues, and compacts the file:
+
+    python -m CableSizer.resultstore results.sqlite [max_age_days]
+"""
+import contextlib
+import hashlib
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+"""The version of the store's tables. A file written with another version is emptied when it is opened."""
+STORE_VERSION = 2
+
+"""The journal modes a store may be opened with: the rollback journal, and the write-ahead log for a single host."""
+JOURNAL_MODES = ("DELETE", "WAL")
+
+"""The time, in seconds, after which a selection's last use is updated when it is used again. Updating every use would
+rewrite most of the store on every job."""
+TOUCH_INTERVAL = 3600.0
+
+_SCHEMA = (
+    """CREATE TABLE selections (
+        catalogue TEXT NOT NULL,
+        inputs TEXT NOT NULL,
+        required_ccc REAL NOT NULL,
+        load_current REAL NOT NULL,
+        length REAL NOT NULL,
+        row INTEGER,
+        parallel INTEGER NOT NULL,
+        ccc REAL NOT NULL,
+        vd REAL NOT NULL,
+        used REAL NOT NULL,
+        PRIMARY KEY (catalogue, inputs, required_ccc, load_current, length)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX selections_used ON selections (used)",
+)
+
+"""The keys looked up by a batch, written to a temporary table that is joined with the stored selections."""
+_WANTED = """CREATE TEMP TABLE wanted (
+    position INTEGER PRIMARY KEY,
+    inputs TEXT NOT NULL,
+    required_ccc REAL NOT NULL,
+    load_current REAL NOT NULL,
+    length REAL NOT NULL
+)"""
+
+_LOOKUP = """SELECT wanted.position, selections.row, selections.parallel, selections.ccc, selections.vd, selections.used
+    FROM temp.wanted AS wanted CROSS JOIN selections
+    WHERE selections.catalogue = ? AND selections.inputs = wanted.inputs
+    AND selections.required_ccc = wanted.required_ccc AND selections.load_current = wanted.load_current
+    AND selections.length = wanted.length"""
+
+"""A stored selection: the catalogue row, or None, the number of parallel cables, the ccc and the voltage drop."""
+Stored = Tuple[Optional[int], int, float, float]
+
+"""The key of a run's selection: its group_key(), required_ccc, load current and length."""
+Key = Tuple[str, float, float, float]
+
+
+def group_key(inputs: tuple) -> str:
+    """
+    The key of the sizing inputs shared by a group of runs, e.g. their specification and installation method: a hex
+    digest of their repr, which is the same in every process.
+    :param inputs: A tuple of strings, numbers, booleans and tuples of them.
+    :return: str
+    """
+    return hashlib.blake2b(repr(inputs).encode(), digest_size=16).hexdigest()
+
+
+class ResultStore:
+    """
+    Selections held in an SQLite file. The file may be shared by a number of processes: writes are made in short
+    transactions, and with the write-ahead log readers are not blocked by a writer.
+    """
+    def __init__(self, fp: Union[str, Path], timeout: float = 30.0, touch_interval: float = TOUCH_INTERVAL,
+                 journal_mode: str = "DELETE"):
+        """
+        :param fp: The path of the SQLite file. The file is created if it does not exist.
+        :param timeout: The time, in seconds, to wait for another process's write to finish.
+        :param touch_interval: The time, in seconds, after which a selection's last use is updated.
+        :param journal_mode: 'DELETE' for the rollback journal, which works on a file shared between machines, or
+        'WAL' for the write-ahead log, which only works when every process is on the same machine.
+        """
+        journal_mode = journal_mode.upper()
+        if journal_mode not in JOURNAL_MODES:
+            raise ValueError(f"Unknown journal mode ({journal_mode}).")
+        self.fp = Path(fp)
+        self.touch_interval: float = touch_interval
+        self._connection = sqlite3.connect(str(self.fp), timeout=timeout, isolation_level=None)
+        self._connection.execute(f"PRAGMA journal_mode={journal_mode}")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != STORE_VERSION:
+            with self._transaction():
+                self._connection.execute("DROP TABLE IF EXISTS selections")
+                for statement in _SCHEMA:
+                    self._connection.execute(statement)
+                self._connection.execute(f"PRAGMA user_version={STORE_VERSION}")
+        self._connection.execute("PRAGMA temp_store=MEMORY")
+        self._connection.execute(_WANTED)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM selections").fetchone()[0]
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """
+        An immediate transaction, so that concurrent writers wait for each other rather than failing part way through.
+        """
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def close(self):
+        self._connection.close()
+
+    def get_many(self, catalogue: str, keys: Sequence[Key]) -> List[Optional[Stored]]:
+        """
+        Look up a number of selections and mark them as used. The keys are joined with the stored selections in a
+        single query. A selection's last use is only updated if it was last marked more than touch_interval ago, and
+        then in a write transaction of its own after the read.
+        :param catalogue: The digest of the catalogue the selections were made from.
+        :param keys: The keys of the selections, see Key. Keys must not be repeated.
+        :return: The stored selection for each key, in the order of keys, or None where no selection is stored.
+        """
+        found: List[Optional[Stored]] = [None] * len(keys)
+        stale = []
+        oldest = time.time() - self.touch_interval
+        connection = self._connection
+        connection.execute("BEGIN")
+        try:
+            connection.execute("DELETE FROM temp.wanted")
+            connection.executemany("INSERT INTO temp.wanted VALUES (?, ?, ?, ?, ?)",
+                                   ((position, *key) for position, key in enumerate(keys)))
+            for position, row, parallel, ccc, vd, used in connection.execute(_LOOKUP, (catalogue,)):
+                found[position] = (row, parallel, ccc, vd)
+                if used <= oldest:
+                    stale.append(position)
+        finally:
+            connection.execute("COMMIT")
+        if stale:
+            now = time.time()
+            with self._transaction():
+                connection.executemany(
+                    "UPDATE selections SET used = ? WHERE catalogue = ? AND inputs = ? AND required_ccc = ? "
+                    "AND load_current = ? AND length = ?", ((now, catalogue, *keys[position]) for position in stale))
+        hits = len(keys) - found.count(None)
+        self.hits += hits
+        self.misses += len(keys) - hits
+        return found
+
+    def put_many(self, catalogue: str, selections: Iterable[Tuple[Key, Stored]]):
+        """
+        Store a number of selections, replacing any stored under the same keys.
+        :param catalogue: The digest of the catalogue the selections were made from.
+        :param selections: The (key, selection) pairs.
+        """
+        now = time.time()
+        with self._transaction():
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO selections (catalogue, inputs, required_ccc, load_current, length, row, "
+                "parallel, ccc, vd, used) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ((catalogue, *key, *selection, now) for key, selection in selections))
+
+    def vacuum(self, max_age: float = None, catalogues: Sequence[str] = None) -> int:
+        """
+        Delete old selections and compact the file.
+        :param max_age: Delete the selections that have not been used for this number of seconds.
+        :param catalogues: Delete the selections made from any other catalogue, e.g. superseded catalogue versions.
+        :return: The number of selections deleted.
+        """
+        deleted = 0
+        with self._transaction():
+            if max_age is not None:
+                deleted += self._connection.execute("DELETE FROM selections WHERE used < ?",
+                                                    (time.time() - max_age,)).rowcount
+            if catalogues is not None:
+                deleted += self._connection.execute(
+                    f"DELETE FROM selections WHERE catalogue NOT IN ({','.join('?' * len(catalogues))})",
+                    list(catalogues)).rowcount
+        self._connection.execute("VACUUM")
+        return deleted
+
+
+def main(argv: Sequence[str] = None):
+    """
+    Vacuum the store given on the command line, deleting the selections that have not been used for max_age_days.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) not in (1, 2):
+        print(f"usage: python -m CableSizer.resultstore results.sqlite [max_age_days]")
+        return 2
+    max_age = float(args[1]) * 86400 if len(args) == 2 else None
+    with ResultStore(args[0]) as store:
+        deleted = store.vacuum(max_age)
+        print(f"{args[0]}: {deleted} selections deleted, {len(store)} kept")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
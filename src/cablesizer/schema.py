@@ -0,0 +1,278 @@
+"""
+The catalogue schema. The schema is compiled once from importcables.HEADERS and maps every catalogue column to the
+array typecode it is stored as and the converter used to parse it.
+"""
+import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import CableSizer.enumerations as enumerations
+import CableSizer.importcables as importcables
+
+"""The schema version. This must be incremented whenever the columns, their typecodes or their converters change."""
+SCHEMA_VERSION = 3
+
+"""The typecode used to store string columns. String columns are held in a list rather than an array."""
+STRING = "U"
+
+"""The typecode used to store dictionary encoded columns. Each value is the value's code in the column's table."""
+ENUM = "H"
+
+_INT_SUFFIXES = ("Cores_number", "_installTemp", "_faultWithstand", "Temperature")
+_FLOAT_SUFFIXES = ("_size", "_current")
+_SIZE_SUFFIX = "_size"
+_BOOL_COLUMNS = ("isFlex",)
+_DATE_COLUMNS = ("rev_date",)
+_TEXT_COLUMNS = ("description",)
+_TRUE_VALUES = frozenset(("TRUE", "T", "YES", "Y", "1"))
+_DATE_FORMATS = ("%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d")
+
+
+def column_typecode(header: str) -> str:
+    """
+    Determine the array typecode used to store a catalogue column. Dates are stored as proleptic Gregorian ordinals,
+    with 0 representing no date.
+    :param header: The column header as listed in importcables.HEADERS.
+    :return: An array typecode, ENUM for dictionary encoded columns or STRING for text columns.
+    """
+    if enumerations.table_name(header) is not None:
+        return ENUM
+    if header in _BOOL_COLUMNS:
+        return "b"
+    if header in _DATE_COLUMNS:
+        return "l"
+    if header.startswith("impedance_") or header.endswith(_FLOAT_SUFFIXES):
+        return "d"
+    if header.endswith(_INT_SUFFIXES):
+        return "l"
+    return STRING
+
+
+def to_float(value) -> float:
+    """
+    Convert a catalogue value to a float. Blank values are converted to 0.0.
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        if value is None or not str(value).strip():
+            return 0.0
+        raise
+
+
+def to_size(value) -> float:
+    """
+    Convert a conductor size to a float. The AWG aught sizes, '1/0' to '4/0' or '00' to '0000', are stored as the
+    negated number of noughts, e.g. '4/0' as -4.0, which csa.to_mm2() reads back. A lone '0' is a blank size, so 1/0
+    must be given as '1/0'. Blank values are converted to 0.0.
+    """
+    if isinstance(value, str):
+        text = value.strip()
+        if text.endswith("/0"):
+            noughts = int(text[:-2])
+            if not 1 <= noughts <= 4:
+                raise ValueError(f"Unable to convert ({value}) to an aught size.")
+            return -float(noughts)
+        if len(text) > 1 and set(text) == {"0"}:
+            return -float(len(text))
+    return to_float(value)
+
+
+def to_int(value) -> int:
+    """
+    Convert a catalogue value to an int. Blank values are converted to 0.
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return int(to_float(value))
+
+
+def to_bool(value) -> int:
+    """
+    Convert a catalogue value to 1 (True) or 0 (False).
+    """
+    if isinstance(value, str):
+        return int(value.strip().upper() in _TRUE_VALUES)
+    return int(bool(value))
+
+
+def to_enum(value) -> str:
+    """
+    Convert a catalogue value to an upper case, interned string so that repeated values share a single object.
+    """
+    return enumerations.canonical(value)
+
+
+def to_text(value) -> str:
+    """
+    Convert a catalogue value to a string, retaining its case.
+    """
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def to_date(value) -> int:
+    """
+    Convert a catalogue date to its ordinal. ISO 8601 and day/month/year dates are accepted. Blank values are converted
+    to 0.
+    """
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.toordinal()
+    if not value:
+        return 0
+    value = value.strip()
+    if not value:
+        return 0
+    try:
+        return datetime.date.fromisoformat(value).toordinal()
+    except ValueError:
+        pass
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, date_format).toordinal()
+        except ValueError:
+            pass
+    raise ValueError(f"Unable to convert ({value}) to a date.")
+
+
+def from_date(value: int):
+    """
+    Convert a stored date ordinal back to a date.
+    :return: datetime.date, or None if no date is stored.
+    """
+    if not value:
+        return None
+    return datetime.date.fromordinal(value)
+
+
+def column_converter(header: str) -> Callable:
+    """
+    Select the converter used to parse a catalogue column.
+    """
+    if header in _DATE_COLUMNS:
+        return to_date
+    if header in TABLES:
+        return TABLES[header].convert
+    typecode = column_typecode(header)
+    if typecode == "b":
+        return to_bool
+    if typecode == "d":
+        return to_size if header.endswith(_SIZE_SUFFIX) else to_float
+    if typecode == "l":
+        return to_int
+    if header in _TEXT_COLUMNS:
+        return to_text
+    return to_enum
+
+
+class MemoConverter(dict):
+    """
+    A converter that caches the result for each distinct raw value. Catalogue columns hold few distinct values, so each
+    value is only parsed once and the remaining cells are a dict lookup. The cache is cleared if it grows beyond
+    max_size, which bounds the memory used by columns with mostly unique values.
+    """
+    def __init__(self, converter: Callable, max_size: int = 4096):
+        super().__init__()
+        self.converter = converter
+        self.max_size = max_size
+
+    def __missing__(self, value):
+        if len(self) >= self.max_size:
+            self.clear()
+        result = self[value] = self.converter(value)
+        return result
+
+
+"""The lookup table used by each dictionary encoded column."""
+TABLES: Dict[str, enumerations.EnumTable] = {header: enumerations.TABLES[enumerations.table_name(header)]
+                                             for header in importcables.HEADERS
+                                             if enumerations.table_name(header) is not None}
+
+"""The unique catalogue columns, in file order, and the typecode used to store each of them."""
+COLUMNS: Dict[str, str] = {header: column_typecode(header) for header in importcables.HEADERS
+                           if header not in importcables.ALIASES}
+
+"""The converter used to parse each catalogue column."""
+CONVERTERS: Dict[str, Callable] = {header: column_converter(header) for header in COLUMNS}
+
+"""The value stored when a column is missing from a file. The blank value of an encoded column has code 0."""
+DEFAULTS: Dict[str, object] = {header: ("" if typecode == STRING else 0) for header, typecode in COLUMNS.items()}
+
+
+def decode(header: str, value):
+    """
+    Convert a stored column value back to the catalogue value, e.g. a code to its string.
+    """
+    table = TABLES.get(header)
+    if table is None:
+        return value
+    return table.decode(value)
+
+
+def export(header: str, value):
+    """
+    Convert a stored column value to a value that can be written to JSON and read back by the column's converter.
+    Codes are decoded and dates are written as ISO 8601 strings, or "" if no date is stored.
+    """
+    if header in _DATE_COLUMNS:
+        return from_date(value).isoformat() if value else ""
+    return decode(header, value)
+
+
+class CompiledHeader:
+    """
+    A plan for converting the rows of a single .csv file. The plan maps each catalogue column to its position in the
+    file's header row, so that a chunk of rows can be converted a column at a time. When a file has both a column and
+    its alias, see importcables.ALIASES, the alias is read in the rows where the column is blank.
+    """
+    def __init__(self, header_row: Sequence[str]):
+        """
+        :param header_row: The header row of the .csv file.
+        """
+        positions = {}
+        aliases = {}
+        for position, header in enumerate(header_row):
+            header = header.strip()
+            name = importcables.ALIASES.get(header, header)
+            if name in COLUMNS:
+                found = positions if header == name else aliases
+                found.setdefault(name, position)
+        self._plan: List[Tuple[str, int, Optional[int], Callable]] = []
+        for name in COLUMNS:
+            if name in positions:
+                self._plan.append((name, positions[name], aliases.get(name), self._compile(name)))
+            elif name in aliases:
+                self._plan.append((name, aliases[name], None, self._compile(name)))
+        self._missing: Tuple[str, ...] = tuple(name for name in COLUMNS
+                                               if name not in positions and name not in aliases)
+        self._width: int = len(header_row)
+
+    @staticmethod
+    def _compile(name: str) -> Callable:
+        if CONVERTERS[name] is to_text:
+            return to_text
+        return MemoConverter(CONVERTERS[name]).__getitem__
+
+    @property
+    def missing(self) -> tuple:
+        return self._missing
+
+    def convert(self, rows: List[List[str]]) -> Dict[str, list]:
+        """
+        Convert a chunk of rows read with csv.reader(). Short rows are padded with blank values.
+        :param rows: The rows to convert.
+        :return: A dictionary of converted column values, keyed by catalogue column.
+        """
+        width = self._width
+        rows = [row if len(row) >= width else row + [""] * (width - len(row)) for row in rows]
+        transposed = list(zip(*rows)) if rows else [()] * width
+        columns = {}
+        for name, position, alias, converter in self._plan:
+            values = transposed[position]
+            if alias is not None:
+                values = [value or fallback for value, fallback in zip(values, transposed[alias])]
+            columns[name] = list(map(converter, values))
+        for name in self._missing:
+            columns[name] = [DEFAULTS[name]] * len(rows)
+        return columns
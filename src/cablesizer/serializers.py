@@ -0,0 +1,367 @@
+"""
+Generated serialisers for the cable model. The fields of each class are listed once in FIELDS, and a to_dict() and
+from_dict() function is generated from the list for each class when the module is imported. The generated functions
+read and write the attributes behind each property directly, and nested objects are written as a single nested dict
+literal, so a Cable is converted without a property call or method call per field.
+
+The dictionaries match the classes' own to_dict() methods. Loaded values are normalised as the setters would, e.g. text
+is upper cased, but are not validated, so only data written by these functions, or the to_dict() methods, should be
+loaded. Loaded cables share their sub-objects as if built with Cable(), see cable.flyweight().
+"""
+import contextlib
+import datetime
+import gc
+import json
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Union
+
+import CableSizer.cable as cable
+import CableSizer.installmethods as installmethods
+
+VALUE = "value"
+TEXT = "text"
+OPTIONAL_TEXT = "optional_text"
+DATE = "date"
+
+
+class Nested:
+    """
+    A field holding a single nested object.
+    """
+    def __init__(self, cls, shared: bool = False):
+        """
+        :param cls: The nested object's class.
+        :param shared: The nested object is shared between instances, see cable.flyweight(). The class's constructor
+        arguments must be in the same order as its fields.
+        """
+        self.cls = cls
+        self.shared = shared
+
+
+class Many:
+    """
+    A field holding a list of nested objects.
+    """
+    def __init__(self, cls):
+        self.cls = cls
+
+
+class Installations:
+    """
+    The installation methods of a cable. One nested dict is written per registered method, keyed by the method name,
+    see installmethods. The key and attribute of the field are not used.
+    """
+
+
+"""The fields of each class: the dictionary key, the attribute holding the value and the kind of value."""
+FIELDS: Dict[type, tuple] = {
+    cable.CoreDetails: (("size", "_csa", VALUE), ("key", "_csa_unit", TEXT), ("number", "_number", VALUE),
+                        ("name", "_name", TEXT)),
+    cable.CableInstallationMethod: (("ccc", "_ccc", VALUE), ("install_temp", "_temp", VALUE),
+                                    ("arrangement", "_cable_arrangement", TEXT)),
+    cable.Impedance: (("mvam", "_mvam", VALUE), ("r", "_r._scalar", VALUE), ("r_unit", "_r._unit", TEXT),
+                      ("x", "_x._scalar", VALUE), ("x_unit", "_x._unit", TEXT), ("z", "_z._scalar", VALUE),
+                      ("z_unit", "_z._unit", TEXT)),
+    cable.Screen: (("name", "_name", TEXT), ("fault_withstand", "_fault_withstand", VALUE)),
+    cable.Insulation: (("material", "_material", TEXT), ("code", "_code", TEXT), ("op_temp", "_op_temp", VALUE),
+                       ("max_temp", "_max_temp", VALUE)),
+    cable.RevisionDetail: (("number", "_number", TEXT), ("date", "_date", DATE)),
+    cable.ConductorDetail: (("size", "_size", VALUE), ("key", "_size_unit", TEXT)),
+    cable.Contracts: (("supply", "_supply", TEXT), ("install", "_install", TEXT), ("connect", "_connect", TEXT)),
+    cable.Voltage: (("v", "_volts", VALUE), ("key", "_unit", TEXT), ("phases", "_phases", VALUE),
+                    ("neutral_required", "_neutral_req", VALUE)),
+    cable.Frequency: (("waveform", "_wf", TEXT), ("frequency", "_scalar", VALUE), ("key", "_unit", TEXT)),
+    cable.InstallationMethod: (("installation", "_physical_installation", OPTIONAL_TEXT),
+                               ("arrangement", "_cable_arrangement", OPTIONAL_TEXT)),
+    cable.Circuit: (("circuit_type", "_type", TEXT), ("voltage", "voltage", Nested(cable.Voltage)),
+                    ("frequency", "frequency", Nested(cable.Frequency)),
+                    ("installation_name", "installation", Nested(cable.InstallationMethod)),
+                    ("load_current", "_load_current", VALUE)),
+    cable.CableSpec: (("cable_type", "_type", TEXT), ("max_parallel", "_max_parallel", VALUE),
+                      ("allow_parallel_multicore", "_allow_parallel_multicore", VALUE), ("shape", "_shape", TEXT),
+                      ("conductor_material", "_conductor_material", TEXT), ("min_size", "_min_size", VALUE),
+                      ("core_arrangement", "_core_arrangement", TEXT), ("sheath", "_sheath", TEXT),
+                      ("insulation_material", "insulation._material", TEXT),
+                      ("insulation_code", "insulation._code", TEXT),
+                      ("operating_temp", "insulation._op_temp", VALUE),
+                      ("maximum_operating_temp", "insulation._max_temp", VALUE), ("armour", "_armour", TEXT),
+                      ("screen_cable", "_scn_cable", TEXT), ("screen_core", "_scn_core", TEXT),
+                      ("volt_rating", "_volt_rating", TEXT), ("flexible", "_flex", VALUE),
+                      ("vd_max", "_vd_max", VALUE), ("vd", "_vd", VALUE)),
+    cable.Cable: (("cable_type", "_cable_type", TEXT),
+                  ("active_cores", "_activeCores", Nested(cable.CoreDetails, shared=True)),
+                  ("neutral_cores", "_neutralCores", Nested(cable.CoreDetails, shared=True)),
+                  ("earth_cores", "_earthCores", Nested(cable.CoreDetails, shared=True)),
+                  ("instrument_cores", "_instrumentCores", Nested(cable.CoreDetails, shared=True)),
+                  ("control_cores", "_controlCores", Nested(cable.CoreDetails, shared=True)),
+                  ("communication_cores", "_communicationCores", Nested(cable.CoreDetails, shared=True)),
+                  ("data_cores", "_dataCores", Nested(cable.CoreDetails, shared=True)),
+                  ("", "", Installations()),
+                  ("impedance", "_impedance", Nested(cable.Impedance, shared=True)),
+                  ("cable_screen", "_cableScreen", Nested(cable.Screen, shared=True)),
+                  ("core_screen", "_coreScreen", Nested(cable.Screen, shared=True)),
+                  ("insulation", "_insulation", Nested(cable.Insulation, shared=True)),
+                  ("sheath", "_sheath", TEXT), ("volt_rating", "voltage_rating", VALUE),
+                  ("flexible", "flexible", VALUE), ("armour", "armour", VALUE),
+                  ("revision", "_revision", Nested(cable.RevisionDetail, shared=True)),
+                  ("description", "description", VALUE), ("circuit_type", "_circuit_type", TEXT),
+                  ("conductor_material", "_c_material", TEXT), ("core_arrangement", "_c_arrangement", TEXT),
+                  ("cable_shape", "_shape", TEXT)),
+    cable.CableRun: (("cables", "cables", Many(cable.Cable)), ("circuit_details", "circuit_details",
+                                                               Nested(cable.Circuit)),
+                     ("conductor", "conductor", Nested(cable.ConductorDetail)),
+                     ("impedance", "impedance", Nested(cable.Impedance)), ("tag", "tag", VALUE),
+                     ("length", "length", VALUE), ("description", "description", VALUE),
+                     ("supply", "supply", VALUE), ("load", "load", VALUE), ("notes", "notes", VALUE),
+                     ("contracts", "contracts", Nested(cable.Contracts)),
+                     ("revision", "revision", Nested(cable.RevisionDetail)), ("required_ccc", "_ccc", VALUE),
+                     ("derate_run", "_derate_run", VALUE)),
+}
+
+"""The attributes created before a class's fields are loaded, and the expression used to create them."""
+_MEMBERS: Dict[type, tuple] = {
+    cable.Impedance: (("_r", "_new(cable.Vector)"), ("_x", "_new(cable.Vector)"), ("_z", "_new(cable.Vector)")),
+    cable.CableSpec: (("insulation", "_new(cable.Insulation)"),),
+    cable.ConductorDetail: (("kwargs", "{}"),),
+}
+
+
+def _text(value: str) -> str:
+    return sys.intern(value.upper())
+
+
+def _optional_text(value: Union[str, None]) -> Union[str, None]:
+    if value is None:
+        return None
+    return sys.intern(value.upper())
+
+
+def _date(value):
+    """
+    Restore a date written to a JSON file as an ISO 8601 string.
+    """
+    if isinstance(value, str):
+        return datetime.date.fromisoformat(value) if len(value) <= 10 else datetime.datetime.fromisoformat(value)
+    return value
+
+
+def _installations(details: dict) -> tuple:
+    """
+    Read the capacity array and installation conditions of a cable. Methods missing from the dict, e.g. those
+    registered after the dict was written, are left blank.
+    """
+    ccc = [0] * installmethods.COUNT
+    conditions = [(0, "")] * installmethods.COUNT
+    for method in installmethods.METHODS:
+        installation = details.get(method.name)
+        if installation is not None:
+            ccc[method.id] = installation["ccc"]
+            conditions[method.id] = (installation["install_temp"], _text(installation["arrangement"]))
+    return array("d", ccc), cable.shared_conditions(tuple(conditions))
+
+
+_CONVERTERS = {VALUE: "", TEXT: "_text", OPTIONAL_TEXT: "_optional_text", DATE: "_date"}
+
+
+def _dump_expression(cls, source: str, keyed: bool = True) -> str:
+    """
+    The expression converting an instance to a dict literal or, when keyed is False, to a tuple of its values.
+    """
+    items = []
+    for key, attribute, kind in FIELDS[cls]:
+        if isinstance(kind, Installations):
+            for method in installmethods.METHODS:
+                ccc, conditions = f"{source}._ccc[{method.id}]", f"{source}._conditions[{method.id}]"
+                value = (f"{{'ccc': {ccc}, 'install_temp': {conditions}[0], 'arrangement': {conditions}[1]}}" if keyed
+                         else f"({ccc}, {conditions})")
+                items.append((method.name, value))
+            continue
+        value = f"{source}.{attribute}"
+        if isinstance(kind, Nested):
+            value = _dump_expression(kind.cls, value, keyed)
+        elif isinstance(kind, Many):
+            value = (f"[_dump_{kind.cls.__name__}(item) for item in {value}]" if keyed
+                     else f"tuple([_key_{kind.cls.__name__}(item) for item in {value}])")
+        items.append((key, value))
+    if keyed:
+        return "{" + ", ".join(f"{key!r}: {value}" for key, value in items) + "}"
+    return "(" + "".join(f"{value}, " for _, value in items) + ")"
+
+
+def _load_expression(kind, source: str) -> str:
+    if isinstance(kind, Many):
+        return f"[_load_{kind.cls.__name__}(item) for item in {source}]"
+    if isinstance(kind, Nested) and kind.shared:
+        args = [_load_expression(each if each == DATE else VALUE, f"{source}[{key!r}]")
+                for key, _, each in FIELDS[kind.cls]]
+        return f"_flyweight(cable.{kind.cls.__name__}, {', '.join(args)})"
+    if isinstance(kind, Nested):
+        return f"_load_{kind.cls.__name__}({source})"
+    return f"{_CONVERTERS[kind]}({source})"
+
+
+def _generate(cls) -> str:
+    name = cls.__name__
+    lines = [f"def _dump_{name}(o):", f"    return {_dump_expression(cls, 'o')}", "",
+             f"def _key_{name}(o):", f"    return {_dump_expression(cls, 'o', keyed=False)}", "",
+             f"def _load_{name}(d):", f"    o = _new(cable.{name})"]
+    for attribute, expression in _MEMBERS.get(cls, ()):
+        lines.append(f"    o.{attribute} = {expression}")
+    for key, attribute, kind in FIELDS[cls]:
+        if isinstance(kind, Installations):
+            lines.append("    o._ccc, o._conditions = _installations(d)")
+        else:
+            lines.append(f"    o.{attribute} = {_load_expression(kind, f'd[{key!r}]')}")
+    lines += ["    return o", ""]
+    return "\n".join(lines)
+
+
+def _new(cls):
+    return cls.__new__(cls)
+
+
+def _compile() -> tuple:
+    namespace = {"cable": cable, "_new": _new, "_flyweight": cable.flyweight, "_text": _text,
+                 "_optional_text": _optional_text, "_date": _date, "_installations": _installations}
+    source = "\n".join(_generate(cls) for cls in FIELDS)
+    exec(compile(source, "<serializers>", "exec"), namespace)
+    return ({cls: namespace[f"_dump_{cls.__name__}"] for cls in FIELDS},
+            {cls: namespace[f"_load_{cls.__name__}"] for cls in FIELDS},
+            {cls: namespace[f"_key_{cls.__name__}"] for cls in FIELDS})
+
+
+"""The generated functions of each class."""
+DUMPERS, LOADERS, KEYS = _compile()
+
+
+def _base(cls):
+    """
+    The class listed in FIELDS that a class is, or is derived from.
+    """
+    for base in cls.__mro__:
+        if base in FIELDS:
+            return base
+    raise ValueError(f"No serialiser is defined for {cls.__name__}.")
+
+
+def _dumper(cls):
+    dumper = DUMPERS.get(cls)
+    if dumper is None:
+        dumper = DUMPERS[cls] = DUMPERS[_base(cls)]
+    return dumper
+
+
+def _keyer(cls):
+    keyer = KEYS.get(cls)
+    if keyer is None:
+        keyer = KEYS[cls] = KEYS[_base(cls)]
+    return keyer
+
+
+def _loader(cls):
+    loader = LOADERS.get(cls)
+    if loader is None:
+        raise ValueError(f"No serialiser is defined for {cls.__name__}.")
+    return loader
+
+
+def to_dict(instance) -> dict:
+    """
+    Convert an instance of a class listed in FIELDS to a dictionary matching its to_dict() method.
+    """
+    return _dumper(type(instance))(instance)
+
+
+def to_key(instance) -> tuple:
+    """
+    Convert an instance of a class listed in FIELDS to nested tuples of its values, in the order of its fields. Two
+    instances have equal keys if their dictionaries are equal, so the key can be hashed and compared in place of the
+    instance.
+    """
+    return _keyer(type(instance))(instance)
+
+
+def from_dict(cls, details: dict):
+    """
+    Create an instance of a class listed in FIELDS from a dictionary written by to_dict().
+    """
+    return _loader(cls)(details)
+
+
+@contextlib.contextmanager
+def _gc_paused():
+    """
+    Pause the cyclic garbage collector. Bulk conversions create millions of containers that are all kept, so the
+    collector's passes over them find nothing to free.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def dump_many(instances: Iterable) -> List[dict]:
+    """
+    Convert a number of instances, e.g. the cables or runs of a project, to dictionaries.
+    :param instances: The instances to convert. The instances may be of different classes.
+    :return: A list of dictionaries.
+    """
+    dumpers = DUMPERS
+    result = []
+    append = result.append
+    with _gc_paused():
+        for instance in instances:
+            dumper = dumpers.get(type(instance)) or _dumper(type(instance))
+            append(dumper(instance))
+    return result
+
+
+def load_many(cls, details: Iterable[dict]) -> list:
+    """
+    Create a number of instances of a single class from dictionaries written by dump_many().
+    :param cls: The class to create, e.g. Cable or CableRun.
+    :param details: The dictionaries.
+    :return: A list of instances.
+    """
+    loader = _loader(cls)
+    with _gc_paused():
+        return [loader(each) for each in details]
+
+
+def json_default(value):
+    """
+    Convert the values json cannot encode. Dates are written as ISO 8601 strings.
+    """
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable.")
+
+
+def save(instances: Iterable, fp: Union[str, Path]):
+    """
+    Write a number of instances to a JSON file. Dates are written as ISO 8601 strings.
+    :param instances: The instances to write.
+    :param fp: The path of the JSON file.
+    """
+    data = json.dumps(dump_many(instances), default=json_default, separators=(",", ":"))
+    with open(fp, "w", encoding="utf-8") as output:
+        output.write(data)
+
+
+def load(cls, fp: Union[str, Path]) -> list:
+    """
+    Read a number of instances of a single class from a JSON file written by save().
+    :param cls: The class to create.
+    :param fp: The path of the JSON file.
+    :return: A list of instances.
+    """
+    with open(fp, encoding="utf-8") as source:
+        data = source.read()
+    with _gc_paused():
+        details = json.loads(data)
+    return load_many(cls, details)
@@ -0,0 +1,113 @@
+"""
+An in-process cache of cable selections. Large projects size the same combination of specification, installation
+method, current and length many times, e.g. identical motor feeders, so each selection is kept and reused for the
+following runs. The cache holds a bounded number of selections and evicts the least recently used.
+
+Currents and lengths are used in keys exactly as they are, so a cached selection is always the selection the run would
+be given without the cache. Steps may be given instead, see quantise(), so that runs that differ by a fraction of an
+amp or a metre share a selection. The selection is then sized for the step above the run's own value, which may be a
+larger cable than the run needs.
+"""
+import math
+from collections import OrderedDict
+from typing import Hashable
+
+"""The number of selections held by default."""
+DEFAULT_SIZE = 65536
+
+"""The default steps, in amps and metres, currents and lengths are rounded up to. A step of 0 uses the exact value."""
+CURRENT_STEP = 0.0
+LENGTH_STEP = 0.0
+
+
+def quantise(value: float, step: float) -> float:
+    """
+    Round a value up to a multiple of a step. Values already on a multiple, allowing for floating point error, are
+    unchanged.
+    :param value: The value.
+    :param step: The step. A step of 0 returns the value unchanged.
+    :return: float
+    """
+    if not step:
+        return value
+    return math.ceil(round(value / step, 9)) * step
+
+
+class SizingCache:
+    """
+    A bounded, least recently used cache of cable selections. The hits, misses and evictions are counted so the size
+    and steps can be tuned.
+    """
+    def __init__(self, maxsize: int = DEFAULT_SIZE, current_step: float = CURRENT_STEP,
+                 length_step: float = LENGTH_STEP):
+        """
+        :param maxsize: The number of selections held. A size of 0 disables the cache.
+        :param current_step: The step currents are rounded up to, in amps, e.g. 0.1. Currents are used exactly if 0.
+        :param length_step: The step lengths are rounded up to, in metres, e.g. 0.1. Lengths are used exactly if 0.
+        """
+        if maxsize < 0:
+            raise ValueError(f"The cache size ({maxsize}) must not be negative.")
+        self.maxsize: int = maxsize
+        self.current_step: float = current_step
+        self.length_step: float = length_step
+        self._entries: OrderedDict = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"SizingCache({len(self)}/{self.maxsize}, hits={self.hits}, misses={self.misses}, " \
+               f"evictions={self.evictions})"
+
+    def quantise_current(self, current: float) -> float:
+        return quantise(current, self.current_step)
+
+    def quantise_length(self, length: float) -> float:
+        return quantise(length, self.length_step)
+
+    def get(self, key: Hashable):
+        """
+        Look up a selection and mark it as the most recently used.
+        :param key: The selection's key.
+        :return: The selection, or None if it is not in the cache.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value):
+        """
+        Add a selection, evicting the least recently used selection if the cache is full.
+        :param key: The selection's key.
+        :param value: The selection. Must not be None.
+        """
+        if not self.maxsize:
+            return
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def info(self) -> dict:
+        """
+        The cache's counters, its size and hit ratio.
+        """
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self),
+                "maxsize": self.maxsize, "hit_ratio": self.hits / lookups if lookups else 0.0}
+
+    def clear(self):
+        """
+        Remove every selection and reset the counters.
+        """
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
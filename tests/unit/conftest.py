@@ -0,0 +1,24 @@
+import pytest
+
+
+def _make_row(size: float, ccc: float, mvam: float, part: str, material: str = "cu", armour: str = "nil",
+              flexible: str = "FALSE"):
+    return {"conductorMaterial": material, "cableCoreArrangement": "4c+e", "cableType": "power",
+            "circuitType": "multi_phase", "description": f"{size}mm2 4C+E",
+            "unenclosed_spaced_current": ccc, "unenclosed_spaced_installTemp": 40,
+            "enclosed_conduit_current": ccc * 0.8, "enclosed_conduit_installTemp": 40,
+            "activeCores_size": size, "activeCores_sizeUnit": "mm2", "activeCores_number": 3,
+            "neutralCores_size": size, "neutralCores_sizeUnit": "mm2", "neutralCores_number": 1,
+            "earthCores_size": size / 2, "earthCores_sizeUnit": "mm2", "earthCores_number": 1,
+            "insulation_name": "xlpe", "insulation_code": "x-90", "insulation_conductorTemperature": 90,
+            "insulation_maxTemperature": 250, "sheath": "pvc", "armoured": armour, "voltRating": "0.6/1kv",
+            "isFlex": flexible, "impedance_MVAM": mvam, "impedance_rOhmsPerKM": mvam / 2,
+            "manufacturer_name": "acme", "manufacturer_partNumber": part, "rev_number": "a", "rev_date": ""}
+
+
+@pytest.fixture
+def make_row():
+    """
+    A factory for catalogue rows keyed by the importcables headers.
+    """
+    return _make_row
@@ -0,0 +1,117 @@
+import asyncio
+import shutil
+import pytest
+import CableSizer.asyncsizer as asyncsizer
+import CableSizer.cable as cable
+import CableSizer.cablesizer as cablesizer
+import CableSizer.catalogue as catalogue
+import CableSizer.sizingcache as sizingcache
+from pathlib import Path
+
+
+path = Path("../test_resources/cable_catalogue_test.csv")
+
+
+@pytest.fixture
+def small_catalogue(make_row):
+    return catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4"), make_row(10.0, 63, 3.8, "p-10"),
+                                     make_row(16.0, 85, 2.4, "p-16")])
+
+
+def _runs(*currents: float, method: str = "unenclosed_spaced") -> list:
+    runs = []
+    for current in currents:
+        run = cable.CableRun(required_ccc=current)
+        run.circuit_details.installation.physical_installation = method
+        runs.append((run, cable.CableSpec()))
+    return runs
+
+
+def test_async_sizer_size(small_catalogue):
+    requests = [_runs(30.0, 60.0), _runs(80.0), _runs(200.0, 10.0, 50.0)]
+
+    async def size():
+        async with asyncsizer.AsyncSizer() as sizer:
+            results = await asyncio.gather(*(sizer.size(small_catalogue, runs) for runs in requests))
+            assert await sizer.size(small_catalogue, []) == []
+            return results, sizer.batches
+
+    results, batches = asyncio.run(size())
+    for runs, result in zip(requests, results):
+        assert result == cablesizer.select_cable_from_database(small_catalogue, runs,
+                                                               cache=sizingcache.SizingCache(0))
+    assert batches == 1
+
+
+def test_async_sizer_batch_size(small_catalogue):
+    async def size():
+        async with asyncsizer.AsyncSizer(batch_delay=10.0, batch_size=2) as sizer:
+            result = await asyncio.wait_for(sizer.size(small_catalogue, _runs(30.0, 60.0)), 5.0)
+            return [selection.row for selection in result]
+
+    assert asyncio.run(size()) == [0, 1]
+
+
+def test_async_sizer_timeout(small_catalogue):
+    async def size():
+        async with asyncsizer.AsyncSizer(batch_delay=0.2) as sizer:
+            waiting = asyncio.ensure_future(sizer.size(small_catalogue, _runs(30.0)))
+            with pytest.raises(asyncio.TimeoutError):
+                await sizer.size(small_catalogue, _runs(60.0), timeout=0.01)
+            cancelled = asyncio.ensure_future(sizer.size(small_catalogue, _runs(80.0)))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            result = await waiting
+            assert cancelled.cancelled()
+            return result, sizer.batches
+
+    result, batches = asyncio.run(size())
+    assert [selection.row for selection in result] == [0]
+    assert batches == 1
+
+
+def test_async_sizer_errors(small_catalogue):
+    async def size():
+        async with asyncsizer.AsyncSizer() as sizer:
+            return await asyncio.gather(sizer.size(small_catalogue, _runs(30.0)),
+                                        sizer.size(small_catalogue, _runs(30.0, method="")),
+                                        sizer.size(small_catalogue, _runs(30.0), minimise="cost"),
+                                        return_exceptions=True)
+
+    good, missing, unknown = asyncio.run(size())
+    assert [selection.row for selection in good] == [0]
+    assert isinstance(missing, ValueError) and isinstance(unknown, ValueError)
+
+
+def test_async_sizer_load_catalogue(tmp_path):
+    fp = tmp_path / "catalogue.csv"
+    shutil.copy(path.resolve(), fp)
+
+    async def load():
+        async with asyncsizer.AsyncSizer() as sizer:
+            first, second = await asyncio.gather(sizer.load_catalogue([fp]), sizer.load_catalogue([fp]))
+            assert not sizer._loading
+            return first, second
+
+    first, second = asyncio.run(load())
+    assert first is second
+    assert len(first) > 0
+
+
+def test_async_sizer_process_pool(small_catalogue, make_row):
+    requests = [_runs(30.0, 60.0), _runs(80.0, 10.0)]
+
+    async def size():
+        async with asyncsizer.AsyncSizer(jobs=2, batch_size=1, chunk_size=2) as sizer:
+            first = await sizer.size(small_catalogue, requests[0] * 3)
+            pool = sizer._pool
+            second = await sizer.size(small_catalogue, requests[1] * 3)
+            assert sizer._pool is pool and len(list(Path(sizer._directory.name).iterdir())) == 1
+            small_catalogue.append(make_row(50.0, 190, 0.8, "p-50"))
+            third = await sizer.size(small_catalogue, _runs(150.0))
+            assert len(list(Path(sizer._directory.name).iterdir())) == 1
+            return first, second, third
+
+    first, second, third = asyncio.run(size())
+    assert [selection.row for selection in first + second] == [0, 1] * 3 + [2, 0] * 3
+    assert third[0].row == 3
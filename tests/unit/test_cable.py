@@ -1,5 +1,6 @@
 import pytest
 import CableSizer.cable as cable
+import CableSizer.installmethods as installmethods
 import datetime as dt
 
 
@@ -219,6 +220,36 @@ def test_cls_cable_dict():
                     "install_temp": 0,
                     "arrangement": ""
                 },
+                "unenclosed_partial": {
+                    "ccc": 0,
+                    "install_temp": 0,
+                    "arrangement": ""
+                },
+                "unenclosed_complete": {
+                    "ccc": 0,
+                    "install_temp": 0,
+                    "arrangement": ""
+                },
+                "underground_ducts": {
+                    "ccc": 0,
+                    "install_temp": 0,
+                    "arrangement": ""
+                },
+                "unenclosed_buried": {
+                    "ccc": 0,
+                    "install_temp": 0,
+                    "arrangement": ""
+                },
+                "enclosed_buried": {
+                    "ccc": 0,
+                    "install_temp": 0,
+                    "arrangement": ""
+                },
+                "enclosed_buried_separate": {
+                    "ccc": 0,
+                    "install_temp": 0,
+                    "arrangement": ""
+                },
                 "impedance": {
                     "mvam": 0.0, "r": 0.0, "r_unit": "", "x": 0.0, "x_unit": "", "z": 0.0, "z_unit": ""
                 },
@@ -393,6 +424,14 @@ def test_cls_cable_csa():
                 "COMMUNICATION": 0.0,
                 }
     assert result == expected
+    result["POWER"] = 50.0
+    assert test_class.csa["POWER"] == 35.0
+
+
+def test_cls_cable_csa_mm2():
+    test_class = cable.Cable(active_size=2, active_unit="awg", earth_size=16.0, earth_unit="mm2")
+    result = test_class.csa_mm2
+    assert (round(result[0], 2), result[2], result[1]) == (33.63, 16.0, 0.0)
 
 
 @pytest.mark.parametrize("install_ccc_test, install_method, test_amp",
@@ -430,6 +469,73 @@ def test_cls_cable_mvam():
     assert result == expected
 
 
+def test_cls_cable_shared_sub_objects():
+    first = cable.Cable(active_size=35.0, insulation_material="xlpe", mvam=1.2)
+    second = cable.Cable(active_size=50.0, insulation_material="xlpe", mvam=1.2)
+    assert first._dataCores is second._dataCores
+    assert first._insulation is second._insulation
+    assert first._activeCores is not second._activeCores
+    assert cable.is_shared(first.impedance)
+    assert isinstance(first.impedance, cable.Impedance)
+    insulation = first.insulation
+    insulation.code = "x-90"
+    assert (insulation.code, first.insulation.code, second.insulation.code) == ("X-90", "X-90", "")
+    assert not cable.is_shared(first.insulation) and cable.is_shared(second.insulation)
+    with pytest.raises(AttributeError):
+        first._dataCores.size = 1.0
+    assert not hasattr(first, "__dict__")
+
+
+def test_cls_cable_flyweight_types():
+    first = cable.Cable(active_size=1, active_number=True)
+    second = cable.Cable(active_size=1.0, active_number=1)
+    assert first._activeCores is not second._activeCores
+    assert second.activeCores.to_dict()["size"] == 1.0 and type(second.activeCores.to_dict()["size"]) is float
+    assert type(second.activeCores.number) is int
+
+
+def test_cls_cable_installations():
+    test_class = cable.Cable(unenclosed_spaced_ccc=16, unenclosed_spaced_install_temp=40,
+                             installations={"underground_ducts": (120, 25, "trefoil"),
+                                            "ENCLOSED_BURIED_SEPARATE": (98, 20, "flat")})
+    ids = installmethods.method_ids(["underground_ducts", "unenclosedSpaced", "enclosedBuriedSeparate", "ductsSingle"])
+    assert list(test_class.installation_ccc_many(ids)) == [120, 16, 98, 0]
+    assert (test_class.undergroundDucts.install_temp, test_class.undergroundDucts.cable_arrangement) == (25, "TREFOIL")
+    assert test_class.installation("enclosed_buried_separate").to_dict() == {"ccc": 98, "install_temp": 20,
+                                                                             "arrangement": "FLAT"}
+    with pytest.raises(ValueError):
+        cable.Cable(installations={"on_a_cloud": (1, 2, "")})
+
+
+def test_cls_cable_set_installation():
+    first = cable.Cable(ducts_single_ccc=45, ducts_single_install_temp=25)
+    second = cable.Cable(ducts_single_ccc=45, ducts_single_install_temp=25)
+    first.ductsSingle.ccc = 50
+    first.ductsSingle.cable_arrangement = "flat"
+    first.set_installation("unenclosed_partial", 70, 40, "trefoil")
+    second.unenclosedComplete = cable.CableInstallationMethod(80, 30, "nil")
+    assert first.to_dict()["ducts_single"] == {"ccc": 50, "install_temp": 25, "arrangement": "FLAT"}
+    assert first.installation_ccc("unenclosedPartial") == 70
+    assert (second.ductsSingle.ccc, second.ductsSingle.cable_arrangement) == (45, "")
+    assert second.to_dict()["unenclosed_complete"] == {"ccc": 80, "install_temp": 30, "arrangement": "NIL"}
+    third, fourth = cable.Cable(ducts_single_install_temp=25), cable.Cable(ducts_single_install_temp=25)
+    assert third._conditions is fourth._conditions
+
+
+def test_cls_cable_unshare():
+    first = cable.Cable(mvam=1.2, r=0.5, r_unit="ohm/km")
+    second = cable.Cable(mvam=1.2, r=0.5, r_unit="ohm/km")
+    first.unshare()
+    first.impedance.r = 0.7
+    first.insulation.code = "x-90"
+    assert (first.impedance.r, first.impedance.r_unit, first.insulation.code) == (0.7, "OHM/KM", "X-90")
+    assert (second.impedance.r, second.insulation.code) == (0.5, "")
+    assert not cable.is_shared(first.insulation)
+    assert cable.is_shared(second.insulation)
+    second.mvam = 2.0
+    assert (first.mvam, second.mvam, cable.Cable(mvam=1.2).mvam) == (1.2, 2.0, 1.2)
+
+
 def test_cls_cable_installation_method():
     test_class = cable.CableInstallationMethod()
     test_class.ccc = 140
@@ -462,6 +568,17 @@ def test_cls_cable_run():
     assert result == expected
 
 
+def test_cls_cable_run_from_dict():
+    test_class = cable.CableRun(cable.Cable(active_size=4.0, mvam=9.5), tag="1234-PU-01", required_ccc=10,
+                                derating_run=0.8)
+    details = test_class.to_dict()
+    assert details["cables"][0]["active_cores"]["size"] == 4.0
+    result = cable.CableRun()
+    result.from_dict(details)
+    assert (result.tag, result.required_ccc, result.cables[0].mvam) == ("1234-PU-01", 10, 9.5)
+    assert result.to_dict() == details
+
+
 def test_cls_cable_screen():
     test_class = cable.Screen()
     test_class.name = "dwt"
@@ -0,0 +1,271 @@
+import pytest
+import CableSizer.cable as cable
+import CableSizer.cablesizer as cablesizer
+import CableSizer.catalogue as catalogue
+import CableSizer.frozen as frozen
+import CableSizer.resultstore as resultstore
+import CableSizer.sizingcache as sizingcache
+
+
+@pytest.fixture
+def sizing_catalogue(make_row):
+    rows = [make_row(4.0, 36, 9.5, "p-4"), make_row(6.0, 46, 6.4, "p-6"), make_row(10.0, 63, 3.8, "p-10"),
+            make_row(16.0, 85, 2.4, "p-16"), make_row(10.0, 70, 3.8, "p-10-al", material="al"),
+            make_row(50.0, 190, 0.8, "p-50-1c"), make_row(95.0, 300, 0.45, "p-95-1c")]
+    for row in rows[5:]:
+        row["cableCoreArrangement"] = "1c"
+    return catalogue.CableCatalogue(rows)
+
+
+def _run(required_ccc: float, length: float = 0.0, method: str = "unenclosed_spaced", load_current: float = 0.0):
+    run = cable.CableRun(required_ccc=required_ccc, length=length)
+    run.circuit_details.installation.physical_installation = method
+    run.circuit_details.load_current = load_current
+    return run
+
+
+def test_select_cable_from_database(sizing_catalogue):
+    spec = cable.CableSpec(conductor_material="cu")
+    runs = [(_run(40.0), spec), (_run(40.0, method="enclosed_conduit"), spec), (_run(0.0), spec),
+            (_run(400.0), spec), (_run(40.0), cable.CableSpec(min_size=10.0))]
+    result = cablesizer.select_cable_from_database(sizing_catalogue, runs)
+    assert [selection.row for selection in result] == [1, 2, 0, None, 4]
+    assert result[0] == cablesizer.Selection(1, 1, 46.0, 0.0)
+    assert result[3] == cablesizer.NO_SELECTION
+
+
+def test_select_cable_from_database_voltage_drop(sizing_catalogue):
+    spec = cable.CableSpec(vd_max=10.0)
+    run = _run(40.0, length=100.0, load_current=40.0)
+    result = cablesizer.select_cable_from_database(sizing_catalogue, [(run, spec)])
+    assert (result[0].row, round(result[0].vd, 2)) == (3, 9.6)
+    spec.vd_max = 0.0
+    assert cablesizer.select_cable_from_database(sizing_catalogue, [(run, spec)])[0].row == 1
+
+
+def test_select_cable_from_database_parallel(sizing_catalogue):
+    run = _run(500.0, length=10.0)
+    result = cablesizer.select_cable_from_database(sizing_catalogue, [(run, cable.CableSpec(max_parallel=4))])
+    assert (result[0].row, result[0].parallel, result[0].ccc) == (6, 2, 300.0)
+    multicore = cable.CableSpec(core_arrangement="4c+e", max_parallel=2)
+    single_core = cable.CableSpec(core_arrangement="4c+e", max_parallel=2, allow_parallel_multicore=False)
+    result = cablesizer.select_cable_from_database(sizing_catalogue, [(_run(160.0), multicore),
+                                                                     (_run(160.0), single_core)])
+    assert [(selection.row, selection.parallel) for selection in result] == [(3, 2), (None, 0)]
+
+
+def test_select_cable_from_database_install_method(sizing_catalogue):
+    run = cable.CableRun(required_ccc=40.0)
+    with pytest.raises(ValueError):
+        cablesizer.select_cable_from_database(sizing_catalogue, [(run, cable.CableSpec())])
+    result = cablesizer.select_cable_from_database(sizing_catalogue, [(run, cable.CableSpec())], "enclosedConduit")
+    assert (result[0].row, result[0].ccc) == (4, 56.0)
+    with pytest.raises(ValueError):
+        cablesizer.select_cable_from_database(sizing_catalogue, [(run, cable.CableSpec())], "enclosed_buried")
+
+
+@pytest.mark.parametrize("max_parallel, expected", [(1, (6, 1)), (2, (6, 1)), (3, (3, 3)), (4, (4, 4))])
+def test_select_cable_from_database_least_csa(sizing_catalogue, max_parallel, expected):
+    runs = [(_run(250.0), cable.CableSpec(max_parallel=max_parallel))]
+    result = cablesizer.select_cable_from_database(sizing_catalogue, runs, minimise="csa")
+    assert (result[0].row, result[0].parallel) == expected
+    assert cablesizer.select_cable_from_database(sizing_catalogue, runs)[0][:2] == (6, 1)
+
+
+def test_select_cable_from_database_least_csa_voltage_drop(sizing_catalogue):
+    run = _run(250.0, length=100.0, load_current=250.0)
+    spec = cable.CableSpec(max_parallel=4, vd_max=10.0, allow_parallel_multicore=False)
+    result = cablesizer.select_cable_from_database(sizing_catalogue, [(run, spec)], minimise="csa")
+    assert (result[0].row, result[0].parallel, round(result[0].vd, 3)) == (5, 2, 10.0)
+    with pytest.raises(ValueError):
+        cablesizer.select_cable_from_database(sizing_catalogue, [(run, spec)], minimise="cost")
+
+
+def test_select_cable_from_database_cache(sizing_catalogue, make_row):
+    cache = sizingcache.SizingCache(maxsize=8, current_step=1.0, length_step=10.0)
+    spec = cable.CableSpec(vd_max=10.0)
+    runs = [(_run(40.0, 95.0, load_current=40.0), spec), (_run(39.6, 100.0, load_current=39.6), spec),
+            (_run(40.0, 100.0, load_current=40.0), cable.CableSpec(vd_max=10.0))]
+    result = cablesizer.select_cable_from_database(sizing_catalogue, runs, cache=cache)
+    assert [selection.row for selection in result] == [3, 3, 3]
+    assert [round(selection.vd, 3) for selection in result] == [9.12, 9.504, 9.6]
+    assert (cache.hits, cache.misses, len(cache)) == (2, 1, 1)
+    uncached = cablesizer.select_cable_from_database(sizing_catalogue, runs, cache=sizingcache.SizingCache(0))
+    assert uncached == result
+    sizing_catalogue.append(make_row(25.0, 110, 1.5, "p-25"))
+    cablesizer.select_cable_from_database(sizing_catalogue, runs[:1], cache=cache)
+    assert (cache.misses, len(cache)) == (2, 2)
+    cablesizer.select_cable_from_database(sizing_catalogue, runs[:1], cache=cache, minimise="csa")
+    assert cache.misses == 3
+
+
+def test_select_cable_from_database_cache_exact(make_row):
+    cable_catalogue = catalogue.CableCatalogue([make_row(4.0, 28.75, 9.5, "p-4"), make_row(6.0, 40, 6.4, "p-6")])
+    runs = [(_run(28.71), cable.CableSpec())]
+    assert cablesizer.select_cable_from_database(cable_catalogue, runs)[0].row == 0
+    assert cablesizer.select_cable_from_database(cable_catalogue, runs, cache=sizingcache.SizingCache())[0].row == 0
+    stepped = sizingcache.SizingCache(current_step=0.1)
+    assert cablesizer.select_cable_from_database(cable_catalogue, runs, cache=stepped)[0].row == 1
+    assert cablesizer.size_project(cable_catalogue, runs, jobs=1)[0].row == 0
+
+
+def test_spec_fingerprint():
+    spec = cable.CableSpec(armour="swa", max_parallel=2)
+    assert cablesizer.spec_fingerprint(spec) == cablesizer.spec_fingerprint(cable.CableSpec(armour="SWA",
+                                                                                            max_parallel=2))
+    assert cablesizer.spec_fingerprint(spec) != cablesizer.spec_fingerprint(cable.CableSpec(armour="swa"))
+    assert cablesizer.spec_fingerprint(frozen.freeze(spec)) == cablesizer.spec_fingerprint(spec)
+
+
+def test_select_cable_from_database_store(sizing_catalogue, make_row, tmp_path):
+    fp = tmp_path / "results.sqlite"
+    spec = cable.CableSpec(vd_max=10.0)
+    runs = [(_run(40.0, 100.0, load_current=40.0), spec), (_run(40.0, 60.0, load_current=40.0), spec),
+            (_run(400.0), spec)]
+    with resultstore.ResultStore(fp) as store:
+        expected = cablesizer.select_cable_from_database(sizing_catalogue, runs, cache=sizingcache.SizingCache(0),
+                                                         store=store)
+        assert (store.hits, store.misses, len(store)) == (0, 3, 3)
+    assert [selection.row for selection in expected] == [3, 4, None]
+    copy = catalogue.CableCatalogue(sizing_catalogue.export_row(index) for index in range(len(sizing_catalogue)))
+    with resultstore.ResultStore(fp) as store:
+        result = cablesizer.select_cable_from_database(copy, runs, cache=sizingcache.SizingCache(0), store=store)
+        assert result == expected
+        assert (store.hits, store.misses) == (3, 0)
+        cache = sizingcache.SizingCache()
+        twin = [(run, cable.CableSpec(vd_max=10.0)) for run, _ in runs]
+        assert cablesizer.select_cable_from_database(copy, runs + twin, cache=cache, store=store) == expected * 2
+        assert (store.hits, len(cache)) == (6, 3)
+        assert cablesizer.select_cable_from_database(copy, runs, cache=cache, store=store) == expected
+        assert (store.hits, store.misses, cache.hits) == (6, 0, 3)
+        copy.append(make_row(25.0, 110, 1.5, "p-25"))
+        cablesizer.select_cable_from_database(copy, runs[:1], cache=sizingcache.SizingCache(0), store=store)
+        assert (store.misses, len(store)) == (1, 4)
+
+
+def test_incremental_sizer(sizing_catalogue):
+    spec = cable.CableSpec(vd_max=10.0)
+    runs = [(_run(40.0), spec), (_run(40.0, length=100.0, load_current=40.0), spec), (_run(500.0, length=10.0), spec),
+            (_run(40.0, method="enclosed_conduit"), cable.CableSpec(min_size=10.0))]
+    sizer = cablesizer.IncrementalSizer(sizing_catalogue, runs, cumulative_vd=False)
+    expected = cablesizer.select_cable_from_database(sizing_catalogue, runs, cache=sizingcache.SizingCache(0))
+    assert len(sizer) == 4 and runs[0][0] in sizer
+    assert sizer.selections() == expected
+    assert sizer.resize() == [] and sizer.refresh() == []
+    run = runs[1][0]
+    run.length = 200.0
+    sizer.mark_dirty(run)
+    assert sizer.resize() == [run]
+    assert (sizer.selection(run).row, round(sizer.selection(run).vd, 2)) == (5, 6.4)
+    run.circuit_details.load_current = 20.0
+    run.derate_run = 0.5
+    assert sizer.refresh() == [run]
+    assert (run.required_ccc, sizer.selection(run).row) == (40.0, 3)
+    spec.vd_max = 0.0
+    sizer.mark_spec_dirty(spec)
+    assert sizer.resize() == [run]
+    assert sizer.selection(run).row == 1
+    derated = _run(0.0, load_current=30.0)
+    derated.derate_run = 0.5
+    sizer.add(derated, spec)
+    assert sizer.resize() == [derated]
+    derated.circuit_details.load_current = 30.1
+    sizer.mark_dirty(derated)
+    sizer.resize()
+    assert (derated.required_ccc, sizer.selection(derated).row) == (0.0, 0)
+    with pytest.raises(ValueError):
+        sizer.mark_dirty(_run(40.0))
+    with pytest.raises(ValueError):
+        cablesizer.IncrementalSizer(sizing_catalogue, minimise="cost")
+
+
+def test_incremental_sizer_catalogue(sizing_catalogue, make_row):
+    run = _run(100.0)
+    sizer = cablesizer.IncrementalSizer(sizing_catalogue, [(run, cable.CableSpec())])
+    assert sizer.selection(run).row == 5
+    sizing_catalogue.append(make_row(25.0, 110, 1.5, "p-25"))
+    assert sizer.resize() == [run]
+    assert sizer.selection(run).row == 7
+
+
+def test_incremental_sizer_supply_chain(sizing_catalogue):
+    spec = cable.CableSpec(conductor_material="cu", vd_max=10.0)
+    feeder, motor, other = _run(40.0, 50.0, load_current=40.0), _run(20.0, 20.0, load_current=20.0), _run(20.0)
+    feeder.supply, feeder.load, motor.supply, motor.load = "MSB", "DB1", "DB1", "M1"
+    sizer = cablesizer.IncrementalSizer(sizing_catalogue, [(motor, spec), (feeder, spec), (other, spec)])
+    assert [selection.row for selection in sizer.selections()] == [2, 2, 0]
+    assert round(sizer.voltage_drop(motor), 2) == round(sizer.selection(feeder).vd + sizer.selection(motor).vd, 2)
+    feeder.length = 20.0
+    sizer.mark_dirty(feeder)
+    assert sizer.resize() == [feeder, motor]
+    assert [selection.row for selection in sizer.selections()] == [0, 1, 0]
+    feeder.load = "DB2"
+    sizer.mark_dirty(feeder)
+    assert sizer.resize() == []
+    assert sizer.voltage_drop(motor) == sizer.selection(motor).vd
+    other.supply, other.load = "M1", "DB1"
+    motor.load = "DB1"
+    sizer.mark_dirty(other)
+    sizer.mark_dirty(motor)
+    with pytest.raises(ValueError):
+        sizer.resize()
+    sizer.remove(other)
+    assert len(sizer) == 2
+
+
+def test_incremental_sizer_supply_loop_keeps_pending_runs(sizing_catalogue):
+    spec = cable.CableSpec(conductor_material="cu", vd_max=10.0)
+    feeder, sub, motor = _run(40.0, 10.0, load_current=40.0), _run(20.0, 10.0, load_current=20.0), _run(20.0)
+    feeder.supply, feeder.load, sub.supply, sub.load, motor.supply, motor.load = "MSB", "DB1", "DB1", "DB2", "DB2", "M1"
+    sizer = cablesizer.IncrementalSizer(sizing_catalogue, [(feeder, spec), (sub, spec), (motor, spec)])
+    assert sizer.selection(motor).row == 0
+    feeder.supply = "DB2"
+    motor.required_ccc = 60.0
+    sizer.mark_dirty(feeder)
+    sizer.mark_dirty(motor)
+    with pytest.raises(ValueError):
+        sizer.resize()
+    with pytest.raises(ValueError):
+        sizer.resize()
+    feeder.supply = "MSB"
+    sizer.mark_dirty(feeder)
+    assert motor in sizer.resize()
+    assert sizer.selection(motor).row == 2
+    chain = [_run(20.0) for _ in range(4)]
+    for index, run in enumerate(chain):
+        run.supply, run.load = f"A{index}", f"A{index + 1}"
+        sizer.add(run, spec)
+    sizer.resize()
+    sub.length = 200.0
+    motor.load = "DB1"
+    chain[-1].required_ccc = 60.0
+    sizer.mark_dirty(sub)
+    sizer.mark_dirty(chain[-1])
+    with pytest.raises(ValueError):
+        sizer.resize()
+    motor.load = "M1"
+    sizer.mark_dirty(motor)
+    sizer.resize()
+    assert sizer.selection(chain[-1]).row == 2
+    fresh = cablesizer.IncrementalSizer(sizing_catalogue, [(feeder, spec), (sub, spec), (motor, spec)] +
+                                        [(run, spec) for run in chain])
+    assert sizer.selections() == fresh.selections()
+    assert sizer.voltage_drop(motor) == fresh.voltage_drop(motor)
+
+
+@pytest.mark.parametrize("minimise", ["parallel", "csa"])
+def test_size_project(sizing_catalogue, minimise):
+    specs = [cable.CableSpec(), cable.CableSpec(conductor_material="cu", vd_max=10.0),
+             cable.CableSpec(min_size=10.0, max_parallel=4)]
+    methods = ["unenclosed_spaced", "enclosed_conduit"]
+    runs = [(_run(20.0 * (index % 25), 10.0 * (index % 7), methods[index % 2], 20.0 * (index % 25)), specs[index % 3])
+            for index in range(50)]
+    expected = cablesizer.select_cable_from_database(sizing_catalogue, runs, minimise=minimise,
+                                                     cache=sizingcache.SizingCache(0))
+    assert cablesizer.size_project(sizing_catalogue, runs, jobs=1, minimise=minimise) == expected
+    assert cablesizer.size_project(sizing_catalogue, runs, jobs=2, minimise=minimise, chunk_size=8) == expected
+    assert cablesizer.size_project(sizing_catalogue, []) == []
+    with pytest.raises(ValueError):
+        cablesizer.size_project(sizing_catalogue, [(cable.CableRun(required_ccc=40.0), specs[0])])
+    with pytest.raises(ValueError):
+        cablesizer.size_project(sizing_catalogue, runs, chunk_size=0)
@@ -0,0 +1,167 @@
+import pytest
+import CableSizer.catalogue as catalogue
+import CableSizer.cable as cable
+from array import array
+
+
+def test_cls_catalogue_columns(make_row):
+    test_class = catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4"), make_row(6.0, 46, 6.4, "p-6")])
+    assert len(test_class) == 2
+    assert isinstance(test_class.column("activeCores_size"), array)
+    assert list(test_class.column("activeCores_size")) == [4.0, 6.0]
+    assert list(test_class.column("unenclosed_spaced_current")) == [36.0, 46.0]
+    assert test_class.values("conductorMaterial") == ["CU", "CU"]
+    assert isinstance(test_class.column("conductorMaterial"), array)
+    assert test_class.column("description") == ["4.0mm2 4C+E", "6.0mm2 4C+E"]
+
+
+def test_cls_catalogue_columns_match_headers():
+    assert "CableScreen_name" not in catalogue.COLUMNS
+    assert catalogue.COLUMNS["activeCores_number"] == "l"
+    assert catalogue.COLUMNS["impedance_MVAM"] == "d"
+    assert catalogue.COLUMNS["isFlex"] == "b"
+    assert catalogue.COLUMNS["voltRating"] == catalogue.ENUM
+    assert catalogue.COLUMNS["manufacturer_partNumber"] == catalogue.STRING
+
+
+def test_cls_catalogue_alias():
+    test_class = catalogue.CableCatalogue([{"CableScreen_name": "dct"}])
+    assert test_class.values("cableScreen_name") == ["DCT"]
+    assert test_class.values("CableScreen_name") == ["DCT"]
+
+
+def test_cls_catalogue_get_row(make_row):
+    test_class = catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4")])
+    result = test_class.get_row(-1)
+    assert (result["manufacturer_partNumber"], result["isFlex"], result["earthCores_size"]) == ("P-4", 0, 2.0)
+    with pytest.raises(IndexError):
+        test_class.get_row(1)
+
+
+def test_cls_catalogue_get_cable(make_row):
+    test_class = catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4"), make_row(6.0, 46, 6.4, "p-6")])
+    result = test_class.get_cable(1)
+    assert isinstance(result, cable.Cable)
+    assert (result.activeCores.size, result.activeCores.unit, result.installation_ccc("unenclosed_spaced"),
+            result.mvam, result.impedance.r_unit, result.insulation.code, result.flexible,
+            result.revision.date) == (6.0, "MM2", 46.0, 6.4, "OHM/KM", "X-90", False, None)
+    assert [each.activeCores.size for each in test_class.get_cables()] == [4.0, 6.0]
+
+
+def test_cls_catalogue_get_cable_installations(make_row):
+    row = make_row(4.0, 36, 9.5, "p-4")
+    row.update({"underground_ducts_current": 41, "underground_ducts_installTemp": 25,
+                "underground_ducts_cableArrangement": "trefoil"})
+    result = catalogue.CableCatalogue([row]).get_cable(0)
+    assert (result.undergroundDucts.ccc, result.undergroundDucts.install_temp,
+            result.undergroundDucts.cable_arrangement) == (41.0, 25, "TREFOIL")
+    assert list(result.installation_ccc_many([0, 3, 11])) == [36.0, 28.8, 41.0]
+
+
+def test_cls_catalogue_get_cable_lazy(make_row):
+    test_class = catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4"), make_row(6.0, 46, 6.4, "p-6", armour="swa")])
+    result = test_class.get_cable(-1, lazy=True)
+    assert isinstance(result, cable.Cable)
+    assert (result.index, result.installation_ccc("unenclosed_spaced"), result.csa["POWER"]) == (1, 46.0, 6.0)
+    assert result.to_dict() == test_class.get_cable(1).to_dict()
+    assert result._impedance is test_class.get_cable(1)._impedance
+    assert [each.activeCores.size for each in test_class.get_cables(lazy=True)] == [4.0, 6.0]
+
+
+def test_cls_catalogue_lazy_cable_reads_on_access(make_row):
+    test_class = catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4")])
+    result = test_class.get_cable(0, lazy=True)
+    assert set(catalogue._LAZY_LOADERS) == set(cable.Cable.__slots__)
+    assert result.mvam == 9.5
+    with pytest.raises(AttributeError):
+        object.__getattribute__(result, "_revision")
+    result.description = "renamed"
+    assert result.hydrate().description == "renamed"
+    assert object.__getattribute__(result, "_revision").number == "A"
+    with pytest.raises(AttributeError):
+        result.on_a_cloud
+
+
+def test_cls_catalogue_nbytes(make_row):
+    rows = [make_row(float(size), size * 9, 40 / size, f"p-{size}") for size in range(1, 201)]
+    test_class = catalogue.CableCatalogue(rows)
+    assert test_class.nbytes() < 200 * 1000
+
+
+def test_cls_catalogue_part_rows(make_row):
+    test_class = catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4"), make_row(6.0, 46, 6.4, "")])
+    assert test_class.part_rows == {"P-4": 0}
+
+
+def test_cls_catalogue_reload(make_row):
+    test_class = catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4"), make_row(6.0, 46, 6.4, "p-6"),
+                                           make_row(10.0, 63, 3.8, "p-10")])
+    bitmap_index, ampacity_index = test_class.bitmap_index, test_class.ampacity_index
+    updated = make_row(6.0, 70, 6.0, "p-6", armour="swa")
+    updated["rev_number"] = "b"
+    unchanged = make_row(4.0, 99, 1.0, "p-4")
+    result = test_class.reload([updated, unchanged, make_row(2.5, 27, 15.0, "p-2.5"), make_row(1.5, 20, 25.0, "")])
+    assert result == {"added": 1, "updated": 1, "unchanged": 1, "skipped": 1}
+    assert len(test_class) == 4
+    assert test_class.bitmap_index is bitmap_index
+    assert test_class.ampacity_index is ampacity_index
+    assert (test_class.get_row(1)["rev_number"], test_class.get_row(1)["impedance_MVAM"]) == ("B", 6.0)
+    assert test_class.get_row(0)["unenclosed_spaced_current"] == 36.0
+    assert bitmap_index.bitmap("armoured", "swa") == 0b0010
+    assert bitmap_index.bitmap("armoured", "nil") == 0b1101
+    assert list(ampacity_index.rows("unenclosed_spaced")) == [3, 0, 2, 1]
+    assert list(ampacity_index.capacities("unenclosed_spaced")) == [27.0, 36.0, 63.0, 70.0]
+    rebuilt = catalogue.CableCatalogue([test_class.get_row(index) for index in range(len(test_class))])
+    assert list(rebuilt.ampacity_index.rows("enclosed_conduit")) == list(ampacity_index.rows("enclosed_conduit"))
+    for column in bitmap_index.columns:
+        for value in rebuilt.bitmap_index.values(column):
+            assert bitmap_index.bitmap(column, value) == rebuilt.bitmap_index.bitmap(column, value)
+
+
+def test_cls_catalogue_reload_value_removed(make_row):
+    test_class = catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4", armour="dwa")])
+    bitmap_index = test_class.bitmap_index
+    updated = make_row(4.0, 36, 9.5, "p-4")
+    updated["rev_date"] = "2021-01-01"
+    assert test_class.reload([updated])["updated"] == 1
+    assert "DWA" not in bitmap_index.values("armoured")
+
+
+def test_cls_catalogue_merge(make_row):
+    test_class = catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4"), make_row(6.0, 46, 6.4, "p-6")])
+    other = catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4"), make_row(10.0, 63, 3.8, "p-10"),
+                                      make_row(10.0, 63, 3.8, "p-10"), make_row(1.5, 20, 25.0, "")])
+    assert test_class.merge(other) == []
+    assert test_class.column("manufacturer_partNumber") == ["P-4", "P-6", "P-10", ""]
+    assert list(test_class.ampacity_index.rows("unenclosed_spaced")) == [3, 0, 1, 2]
+
+
+@pytest.mark.parametrize('on_conflict, expected', [("first", 36.0), ("last", 40.0)])
+def test_cls_catalogue_merge_conflict(make_row, on_conflict, expected):
+    test_class = catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4")])
+    other = catalogue.CableCatalogue([make_row(4.0, 40, 9.5, "p-4"), make_row(6.0, 46, 6.4, "p-6"),
+                                      make_row(6.0, 50, 6.4, "p-6")])
+    assert test_class.merge(other, on_conflict) == ["P-4", "P-6"]
+    assert len(test_class) == 2
+    assert test_class.get_row(0)["unenclosed_spaced_current"] == expected
+    assert test_class.get_row(1)["unenclosed_spaced_current"] == expected + 10
+
+
+def test_cls_catalogue_merge_exception(make_row):
+    test_class = catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4")])
+    other = catalogue.CableCatalogue([make_row(6.0, 46, 6.4, "p-6"), make_row(4.0, 40, 9.5, "p-4")])
+    with pytest.raises(ValueError):
+        test_class.merge(other)
+    assert len(test_class) == 1
+    with pytest.raises(ValueError):
+        test_class.merge(other, on_conflict="newest")
+
+
+def test_cls_catalogue_generation(make_row):
+    test_class = catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-4")])
+    generation = test_class.generation
+    assert generation != catalogue.CableCatalogue().generation
+    test_class.reload([make_row(4.0, 36, 9.5, "p-4")])
+    assert test_class.generation == generation
+    test_class.append(make_row(6.0, 46, 6.4, "p-6"))
+    assert test_class.generation > generation
@@ -0,0 +1,108 @@
+import pytest
+import CableSizer.cataloguecache as cataloguecache
+import CableSizer.cable as cable
+import shutil
+from array import array
+from pathlib import Path
+
+
+path = Path("../test_resources/cable_catalogue_test.csv")
+
+
+@pytest.fixture
+def source(tmp_path):
+    fp = tmp_path / "catalogue.csv"
+    shutil.copy(path.resolve(), fp)
+    return fp
+
+
+def test_source_key(source, tmp_path):
+    other = tmp_path / "other.csv"
+    shutil.copy(source, other)
+    assert cataloguecache.source_key([source]) == cataloguecache.source_key([other])
+    assert cataloguecache.source_key([source]) != cataloguecache.source_key([source, other])
+    with open(other, "a") as fp:
+        fp.write("\n")
+    assert cataloguecache.source_key([source]) != cataloguecache.source_key([other])
+
+
+def test_compile_catalogue(source):
+    result = cataloguecache.compile_catalogue([source])
+    assert result == source.with_suffix(".cablecat")
+    assert result.read_bytes().startswith(cataloguecache.MAGIC)
+    modified = result.stat().st_mtime_ns
+    assert cataloguecache.compile_catalogue([source]) == result
+    assert result.stat().st_mtime_ns == modified
+
+
+def test_load_catalogue_round_trip(source, monkeypatch):
+    expected = cataloguecache.load_catalogue([source])
+    monkeypatch.setattr(cataloguecache, "_parse", None)
+    result = cataloguecache.load_catalogue([source])
+    assert len(result) == len(expected) == 5
+    for name in expected.columns:
+        assert list(result.column(name)) == list(expected.column(name))
+    assert result.bitmap_index.bitmap("armoured", "SWA") == expected.bitmap_index.bitmap("armoured", "SWA")
+    assert list(result.ampacity_index.rows("unenclosed_spaced")) == [0, 1, 2, 3, 4]
+    assert result.get_cable(1).to_dict() == expected.get_cable(1).to_dict()
+    spec = cable.CableSpec(armour="swa")
+    assert result.ampacity_index.smallest("enclosed_conduit", 40, result.bitmap_index.query(spec)) == 3
+
+
+def test_load_catalogue_out_of_date(source):
+    cataloguecache.load_catalogue([source])
+    with open(source, "a", encoding="utf-8") as fp:
+        fp.write("CU,1C,POWER,,extra" + "," * 80 + "\n")
+    result = cataloguecache.load_catalogue([source])
+    assert len(result) == 6
+    assert len(cataloguecache.load(source.with_suffix(".cablecat"))) == 6
+
+
+@pytest.mark.parametrize('data', [b"", b"NOTACAT!\x01\x00\x00\x00\x00\x00\x00\x00"])
+def test_load_exception(tmp_path, data):
+    fp = tmp_path / "bad.cablecat"
+    fp.write_bytes(data)
+    with pytest.raises(ValueError):
+        cataloguecache.load(fp)
+
+
+def test_load_key_exception(source):
+    compiled = cataloguecache.compile_catalogue([source])
+    with pytest.raises(ValueError):
+        cataloguecache.load(compiled, key="stale")
+
+
+def test_map_catalogue(source):
+    expected = cataloguecache.load_catalogue([source])
+    result = cataloguecache.load_catalogue([source], mapped=True)
+    assert result.read_only
+    assert isinstance(result.column("activeCores_size"), memoryview)
+    for name in expected.columns:
+        assert list(result.column(name)) == list(expected.column(name))
+    assert list(result.ampacity_index.rows("unenclosed_spaced")) == [0, 1, 2, 3, 4]
+    assert result.get_cable(3).to_dict() == expected.get_cable(3).to_dict()
+
+
+def test_map_catalogue_read_only(source, make_row):
+    result = cataloguecache.map_catalogue(cataloguecache.compile_catalogue([source]))
+    with pytest.raises(ValueError):
+        result.append(make_row(4.0, 36, 9.5, "p-1"))
+
+
+def test_map_catalogue_select(source):
+    result = cataloguecache.map_catalogue(cataloguecache.compile_catalogue([source]))
+    cables = list(result.select(cable.CableSpec(armour="swa")))
+    assert [each.activeCores.size for each in cables] == [6.0, 16.0]
+
+
+def test_encoded_column():
+    values = array("H", [1, 2, 1])
+    assert cataloguecache._encoded_column(values, [0, 1, 2]) is values
+    assert list(cataloguecache._encoded_column(values, [0, 5, 4])) == [5, 4, 5]
+
+
+def test_from_buffer_encoded_columns(source):
+    expected = cataloguecache.load_catalogue([source])
+    result = cataloguecache.from_buffer(cataloguecache.to_bytes(expected))
+    assert result.values("armoured") == expected.values("armoured") == ["NIL", "SWA", "NIL", "SWA", "NIL"]
+    assert result.bitmap_index.bitmap("armoured", "swa") == 0b01010
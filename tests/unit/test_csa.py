@@ -0,0 +1,67 @@
+import pytest
+import CableSizer.catalogue as catalogue
+import CableSizer.csa as csa
+import CableSizer.indexes as indexes
+
+
+@pytest.mark.parametrize("size, unit, expected", [(16, "mm2", 16.0), (0, "awg", 0.0), (2, "AWG", 33.63),
+                                                  ("4/0", "awg", 107.22), ("0000", "awg", 107.22), ("0", "awg", 53.48),
+                                                  (-4, "awg", 107.22), (-1.0, "awg", 53.48),
+                                                  (250, "kcmil", 126.68), ("", "", 0.0)])
+def test_to_mm2(size, unit, expected):
+    assert round(csa.to_mm2(size, unit), 2) == expected
+
+
+def test_to_mm2_errors():
+    with pytest.raises(ValueError):
+        csa.to_mm2(4, "inch")
+    with pytest.raises(ValueError):
+        csa.to_mm2(2.5, "awg")
+
+
+@pytest.fixture
+def sized_catalogue(make_row):
+    rows = [make_row(4.0, 36, 9.5, "p-4"), make_row(16.0, 80, 2.5, "p-16"), make_row(50.0, 150, 0.9, "p-50")]
+    rows[1]["neutralCores_size"] = 6.0
+    rows[2].update({"activeCores_size": 1, "activeCores_sizeUnit": "awg", "neutralCores_size": 1,
+                    "neutralCores_sizeUnit": "awg", "earthCores_size": 16.0})
+    return catalogue.CableCatalogue(rows)
+
+
+def test_cls_csamatrix(sized_catalogue):
+    test_class = sized_catalogue.csa_matrix
+    assert test_class is sized_catalogue.csa_matrix
+    assert len(test_class) == 3
+    assert [round(size, 1) for size in test_class.column("power")] == [4.0, 16.0, 42.4]
+    assert list(test_class.column("CONTROL")) == [0.0, 0.0, 0.0]
+    assert test_class.row(0) == (4.0, 4.0, 2.0, 0.0, 0.0, 0.0, 0.0)
+    assert test_class.row(1) == sized_catalogue.get_cable(1).csa_mm2
+    with pytest.raises(ValueError):
+        test_class.column("signal")
+
+
+def test_cls_csamatrix_filters(sized_catalogue):
+    test_class = sized_catalogue.csa_matrix
+    assert list(indexes.iter_rows(test_class.at_least("power", 16.0))) == [1, 2]
+    assert list(indexes.iter_rows(test_class.at_least("power", 16.0, bitset=0b011))) == [1]
+    assert list(indexes.iter_rows(test_class.compare("neutral", "power", 0.5))) == [0, 2]
+    assert list(indexes.iter_rows(test_class.compare("neutral", "power", bitset=0b110))) == [2]
+    table = [(4.0, 2.5), (16.0, 6.0), (35.0, 16.0)]
+    assert list(indexes.iter_rows(test_class.at_least_table("earth", table))) == [1, 2]
+    assert test_class.at_least_table("earth", [(10.0, 10.0)]) == 0b101
+    armoured = sized_catalogue.bitmap_index.match(armoured="nil")
+    assert test_class.at_least("earth", 8.0) & armoured == 0b110
+
+
+def test_cls_csamatrix_reload(sized_catalogue, make_row):
+    test_class = sized_catalogue.csa_matrix
+    test_class.at_least("power", 1.0)
+    row = make_row(25.0, 101, 1.5, "p-25")
+    changed = make_row(10.0, 60, 3.9, "p-16")
+    changed["rev_number"] = "b"
+    sized_catalogue.reload([row, changed])
+    assert sized_catalogue.csa_matrix is test_class
+    assert [round(size, 1) for size in test_class.column("power")] == [4.0, 10.0, 42.4, 25.0]
+    assert list(indexes.iter_rows(test_class.at_least("power", 20.0))) == [2, 3]
+    sized_catalogue.append(make_row(35.0, 125, 1.1, "p-35"))
+    assert len(sized_catalogue.csa_matrix) == 5
@@ -0,0 +1,84 @@
+import pytest
+import CableSizer.csvimporter as csvimporter
+import CableSizer.catalogue as catalogue
+import CableSizer.cable as cable
+import datetime as dt
+from pathlib import Path
+
+
+path = Path("../test_resources/cable_catalogue_test.csv")
+
+
+@pytest.mark.parametrize('chunk_size,expected',
+                         [(1, [1, 1, 1, 1, 1]),
+                          (2, [2, 2, 1]),
+                          (10, [5])])
+def test_cls_csvimporter_iter_chunks(chunk_size, expected):
+    test_class = csvimporter.CSVImporter(path.resolve(), chunk_size)
+    result = [len(chunk) for chunk in test_class.iter_chunks()]
+    assert result == expected
+
+
+def test_cls_csvimporter_chunk_size_exception():
+    with pytest.raises(ValueError):
+        csvimporter.CSVImporter(path.resolve(), 0)
+
+
+def test_cls_csvimporter_iter_rows():
+    test_class = csvimporter.CSVImporter(path.resolve(), 2)
+    result = [row["manufacturer_partNumber"] for row in test_class.iter_rows()]
+    assert result == ["XL-4", "XL-6", "XL-10", "XL-16", "XL-25"]
+
+
+def test_cls_csvimporter_iter_cables():
+    test_class = csvimporter.CSVImporter(path.resolve(), 2)
+    result = list(test_class.iter_cables())
+    assert all(isinstance(each, cable.Cable) for each in result)
+    assert [each.activeCores.size for each in result] == [4.0, 6.0, 10.0, 16.0, 25.0]
+    assert [each.armour for each in result] == ["NIL", "SWA", "NIL", "SWA", "NIL"]
+
+
+def test_cls_csvimporter_load():
+    test_catalogue = catalogue.CableCatalogue()
+    test_class = csvimporter.CSVImporter(path.resolve(), 2)
+    result = test_class.load(test_catalogue)
+    assert result is test_catalogue
+    assert len(result) == 5
+    assert list(result.column("unenclosed_spaced_current")) == [36.0, 46.0, 63.0, 85.0, 110.0]
+
+
+def test_cls_csvimporter_iter_columns():
+    test_class = csvimporter.CSVImporter(path.resolve(), 3)
+    result = list(test_class.iter_columns())
+    assert [length for columns, length in result] == [3, 2]
+    assert result[0][0]["activeCores_number"] == [3, 3, 3]
+    assert result[1][0]["isFlex"] == [1, 0]
+
+
+def test_cls_csvimporter_rev_date():
+    test_class = csvimporter.CSVImporter(path.resolve())
+    result = [each.revision.date for each in test_class.iter_cables()]
+    assert result == [None, dt.date(2020, 3, 2), None, None, None]
+
+
+def test_cls_csvimporter_reload():
+    test_catalogue = csvimporter.CSVImporter(path.resolve()).load()
+    result = csvimporter.CSVImporter(path.resolve(), 2).reload(test_catalogue)
+    assert result == {"added": 0, "updated": 0, "unchanged": 5, "skipped": 0}
+    assert len(test_catalogue) == 5
+
+
+def test_cls_csvimporter_aught_sizes(tmp_path):
+    lines = path.resolve().read_text(encoding="utf-8-sig").splitlines(keepends=True)
+    headers = lines[0].rstrip("\n").split(",")
+    size, unit = headers.index("activeCores_size"), headers.index("activeCores_sizeUnit")
+    for number, value in ((1, "4/0"), (2, "00")):
+        fields = lines[number].split(",")
+        fields[size], fields[unit] = value, "AWG"
+        lines[number] = ",".join(fields)
+    source = tmp_path / "aught.csv"
+    source.write_text("".join(lines), encoding="utf-8")
+    result = csvimporter.CSVImporter(source).load()
+    assert list(result.column("activeCores_size"))[:3] == [-4.0, -2.0, 10.0]
+    assert [round(size, 2) for size in result.csa_matrix.column("power")][:3] == [107.22, 67.43, 10.0]
+    assert round(result.get_cable(0).csa_mm2[0], 2) == 107.22
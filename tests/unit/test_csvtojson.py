@@ -1,3 +1,5 @@
+import io
+import json
 import pytest
 import CableSizer.csvtojson as c2j
 from pathlib import Path
@@ -45,3 +47,13 @@ def test_class_csvtojson_csv(fp_input, csv_input, expected):
     expected = expected
     result = test_class._csv
     assert result == expected
+
+
+def test_class_csvtojson_dump():
+    expected = [{"A": "1", "B": "2", "C": "3", "D": "4", "E": "5", "F": "6"},
+                {"A": "11", "B": "12", "C": "13", "D": "14", "E": "15", "F": "16"}]
+    test_cls = c2j.CSVtoJSON(path.resolve())
+    output = io.StringIO()
+    assert test_cls.dump(output, chunk_size=1) == 2
+    assert test_cls._csv == []
+    assert json.loads(output.getvalue()) == expected
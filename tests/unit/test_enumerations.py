@@ -0,0 +1,41 @@
+import pytest
+import CableSizer.enumerations as enumerations
+
+
+def test_cls_enum_table_encode():
+    test_class = enumerations.EnumTable("test", ["swa", "NIL"])
+    assert test_class.values == ("", "SWA", "NIL")
+    assert test_class.convert(" nil ") == 2
+    assert test_class.convert("dwa") == 3
+    assert test_class.code("Dwa") == 3
+    assert test_class.code("os") is None
+    assert test_class.decode(1) == "SWA"
+    assert test_class.decode_many([3, 0, 1]) == ["DWA", "", "SWA"]
+
+
+def test_cls_enum_table_remap():
+    test_class = enumerations.EnumTable("test", ["swa", "nil"])
+    assert test_class.remap(["", "NIL", "DWA", "SWA"]) == [0, 2, 3, 1]
+
+
+def test_cls_enum_table_exception(monkeypatch):
+    monkeypatch.setattr(enumerations, "MAX_CODE", 2)
+    test_class = enumerations.EnumTable("test", ["a", "b"])
+    with pytest.raises(ValueError):
+        test_class.convert("c")
+
+
+@pytest.mark.parametrize('header,expected',
+                         [("armoured", "armour"),
+                          ("ducts_single_cableArrangement", "cable_arrangement"),
+                          ("earthCores_sizeUnit", "size_unit"),
+                          ("manufacturer_partNumber", None),
+                          ("description", None)])
+def test_table_name(header, expected):
+    assert enumerations.table_name(header) == expected
+
+
+def test_tables_seeded():
+    assert enumerations.TABLES["volt_rating"].code("0.6/1kV") is not None
+    assert enumerations.TABLES["core_arrangement"].code("4c+e") is not None
+    assert enumerations.TABLES["core_arrangement"].code("-") is None
@@ -0,0 +1,75 @@
+import pytest
+import CableSizer.cable as cable
+import CableSizer.frozen as frozen
+
+
+def _spec(**kwargs):
+    return cable.CableSpec(run_type="power", conductor_material="cu", insulation_code="x-90", vd_max=2.5, **kwargs)
+
+
+def test_freeze_spec():
+    spec = _spec()
+    result = frozen.freeze(spec)
+    assert isinstance(result, cable.CableSpec)
+    assert (result.type, result.insulation_code, result.vd_max) == ("POWER", "X-90", 2.5)
+    assert result == frozen.freeze(_spec()) and hash(result) == hash(frozen.freeze(_spec()))
+    assert result != frozen.freeze(_spec(armour="swa"))
+    assert {result: "memo"}[frozen.freeze(_spec())] == "memo"
+    assert frozen.freeze(result) is result
+    spec.vd_max = 5.0
+    assert result.vd_max == 2.5
+
+
+def test_freeze_spec_immutable():
+    result = frozen.freeze(_spec())
+    with pytest.raises(AttributeError):
+        result.vd_max = 5.0
+    with pytest.raises(AttributeError):
+        result.insulation_code = "v-75"
+    with pytest.raises(AttributeError):
+        result.insulation.code = "v-75"
+
+
+def test_freeze_cable():
+    source = cable.Cable(cable_type="power", active_size=35.0, unenclosed_spaced_ccc=150, mvam=1.2)
+    source.unshare()
+    result = frozen.freeze(source)
+    assert isinstance(result, cable.Cable)
+    assert result.to_dict() == source.to_dict()
+    assert result == frozen.freeze(cable.Cable(cable_type="power", active_size=35.0, unenclosed_spaced_ccc=150,
+                                               mvam=1.2))
+    assert result != frozen.freeze(cable.Cable(cable_type="power", active_size=50.0, unenclosed_spaced_ccc=150,
+                                               mvam=1.2))
+    assert cable.is_shared(result.impedance)
+    assert result.installation_ccc("unenclosed_spaced") == 150
+
+
+@pytest.mark.parametrize('change', [lambda each: setattr(each, "cable_type", "control"),
+                                    lambda each: setattr(each, "mvam", 2.0),
+                                    lambda each: each.unshare(),
+                                    lambda each: each.set_installation("ducts_single", 40),
+                                    lambda each: setattr(each.unenclosedSpaced, "ccc", 40)])
+def test_freeze_cable_immutable(change):
+    with pytest.raises(AttributeError):
+        change(frozen.freeze(cable.Cable(unenclosed_spaced_ccc=150)))
+
+
+def test_thaw():
+    result = frozen.thaw(frozen.freeze(cable.Cable(cable_type="power", unenclosed_spaced_ccc=150)))
+    result.unenclosedSpaced.ccc = 160
+    result.cable_type = "control"
+    assert (type(result), result.cable_type, result.installation_ccc("unenclosedSpaced")) == (cable.Cable, "CONTROL",
+                                                                                               160)
+    spec = frozen.thaw(frozen.freeze(_spec()))
+    spec.vd_max = 5.0
+    assert (type(spec), spec.to_dict()) == (cable.CableSpec, dict(_spec().to_dict(), vd_max=5.0))
+
+
+def test_digest():
+    assert frozen.freeze(_spec()).digest == frozen.freeze(_spec()).digest
+    assert frozen.freeze(_spec()).digest != frozen.freeze(_spec(armour="swa")).digest
+
+
+def test_freeze_exception():
+    with pytest.raises(ValueError):
+        frozen.freeze(cable.Insulation())
@@ -0,0 +1,114 @@
+import pytest
+import CableSizer.catalogue as catalogue
+import CableSizer.cable as cable
+import CableSizer.cablesizer as cablesizer
+import CableSizer.indexes as indexes
+
+
+@pytest.fixture
+def test_catalogue(make_row):
+    return catalogue.CableCatalogue([make_row(4.0, 36, 9.5, "p-1"),
+                                     make_row(6.0, 46, 6.4, "p-2", armour="swa"),
+                                     make_row(10.0, 63, 3.8, "p-3", material="al"),
+                                     make_row(16.0, 85, 2.4, "p-4", armour="swa", flexible="true")])
+
+
+@pytest.mark.parametrize('bitset,expected',
+                         [(0, []),
+                          (0b1011, [0, 1, 3]),
+                          (1 << 70 | 1 << 8, [8, 70])])
+def test_iter_rows(bitset, expected):
+    assert list(indexes.iter_rows(bitset)) == expected
+    assert indexes.count_rows(bitset) == len(expected)
+
+
+def test_build_bitset():
+    assert indexes.build_bitset([0, 1, 3, 9], 10) == 0b1000001011
+
+
+def test_cls_bitmap_index_bitmap(test_catalogue):
+    test_class = test_catalogue.bitmap_index
+    assert test_class.bitmap("armoured", "swa") == 0b1010
+    assert test_class.bitmap("conductorMaterial", "CU") == 0b0011 | 0b1000
+    assert test_class.bitmap("isFlex", True) == 0b1000
+    assert test_class.bitmap("sheath", "hdpe") == 0
+    assert set(test_class.values("armoured")) == {"NIL", "SWA"}
+
+
+def test_cls_bitmap_index_match(test_catalogue):
+    test_class = test_catalogue.bitmap_index
+    assert test_class.match() == 0b1111
+    assert test_class.match(armoured="swa", conductorMaterial="cu") == 0b1010
+    assert test_class.match(armoured=["nil", "dwa"]) == 0b0101
+    assert test_class.match(0b0011, armoured="swa") == 0b0010
+
+
+def test_cls_bitmap_index_query(test_catalogue):
+    spec = cable.CableSpec(conductor_material="cu", armour="swa", insulation_code="x-90", volt_rating="0.6/1kv")
+    assert list(indexes.iter_rows(cablesizer.filter_catalogue(test_catalogue, spec))) == [1, 3]
+    spec.flexible = True
+    assert list(indexes.iter_rows(cablesizer.filter_catalogue(test_catalogue, spec))) == [3]
+    spec.sheath = "hdpe"
+    assert cablesizer.filter_catalogue(test_catalogue, spec) == 0
+
+
+def test_cls_bitmap_index_rebuilt_on_append(test_catalogue, make_row):
+    assert test_catalogue.bitmap_index.bitmap("armoured", "dwa") == 0
+    test_catalogue.append(make_row(25.0, 110, 1.5, "p-5", armour="dwa"))
+    assert test_catalogue.bitmap_index.bitmap("armoured", "dwa") == 0b10000
+
+
+@pytest.mark.parametrize('name,expected',
+                         [("UNENCLOSED_SPACED", "unenclosed_spaced"),
+                          ("unenclosedSpaced", "unenclosed_spaced"),
+                          ("ductsPerCable", "ducts_per_cable"),
+                          ("underground_ducts", "underground_ducts")])
+def test_normalise_install_method(name, expected):
+    assert indexes.normalise_install_method(name) == expected
+
+
+def test_normalise_install_method_exception():
+    with pytest.raises(ValueError):
+        indexes.normalise_install_method("on_a_cloud")
+
+
+def test_cls_ampacity_index_order(make_row):
+    test_catalogue = catalogue.CableCatalogue([make_row(10.0, 63, 3.8, "p-1"), make_row(4.0, 36, 9.5, "p-2"),
+                                               make_row(6.0, 0, 6.4, "p-3"), make_row(2.5, 36, 15.0, "p-4")])
+    test_class = test_catalogue.ampacity_index
+    assert list(test_class.rows("unenclosed_spaced")) == [3, 1, 0]
+    assert list(test_class.capacities("unenclosed_spaced")) == [36.0, 36.0, 63.0]
+    assert list(test_class.rows("buried_direct")) == []
+
+
+@pytest.mark.parametrize('required_ccc,bitset,min_size,expected',
+                         [(30.0, None, 0.0, 0),
+                          (36.0, None, 0.0, 0),
+                          (36.1, None, 0.0, 1),
+                          (50.0, 0b0101, 0.0, 2),
+                          (30.0, None, 10.0, 2),
+                          (100.0, None, 0.0, None)])
+def test_cls_ampacity_index_smallest(test_catalogue, required_ccc, bitset, min_size, expected):
+    result = test_catalogue.ampacity_index.smallest("UNENCLOSED_SPACED", required_ccc, bitset, min_size)
+    assert result == expected
+
+
+def test_find_smallest_cable(test_catalogue):
+    run = cable.CableRun(required_ccc=40.0)
+    spec = cable.CableSpec(armour="swa")
+    assert cablesizer.find_smallest_cable(test_catalogue, run, spec, "unenclosed_spaced") == 1
+    assert cablesizer.find_smallest_cable(test_catalogue, run, spec, "enclosed_conduit") == 3
+    spec.conductor_material = "al"
+    assert cablesizer.find_smallest_cable(test_catalogue, run, spec, "unenclosed_spaced") is None
+
+
+def test_find_smallest_cable_min_size_awg(make_row):
+    awg = make_row(4.0, 90, 2.0, "awg-4")
+    awg["activeCores_sizeUnit"] = "awg"
+    test_catalogue = catalogue.CableCatalogue([awg, make_row(25.0, 110, 1.5, "p-25")])
+    run = cable.CableRun(required_ccc=80.0)
+    run.circuit_details.installation.physical_installation = "unenclosed_spaced"
+    for min_size, expected in ((10.0, 0), (25.0, 1)):
+        spec = cable.CableSpec(min_size=min_size)
+        assert cablesizer.find_smallest_cable(test_catalogue, run, spec, "unenclosed_spaced") == expected
+        assert cablesizer.select_cable_from_database(test_catalogue, [(run, spec)])[0].row == expected
@@ -0,0 +1,44 @@
+import pytest
+import CableSizer.ingest as ingest
+import CableSizer.csvimporter as csvimporter
+import shutil
+from pathlib import Path
+
+
+path = Path("../test_resources/cable_catalogue_test.csv")
+
+
+@pytest.fixture
+def sources(tmp_path):
+    first = tmp_path / "first.csv"
+    shutil.copy(path.resolve(), first)
+    lines = first.read_text(encoding="utf-8-sig").splitlines(keepends=True)
+    second = tmp_path / "second.csv"
+    second.write_text("".join(lines[:1] + [line.replace("XL-", "YL-") for line in lines[1:]]), encoding="utf-8")
+    return first, second
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_ingest_files(sources, jobs):
+    expected = csvimporter.CSVImporter(sources[0]).load()
+    result = ingest.ingest_files(sources, jobs=jobs)
+    assert len(result) == 10
+    for name in expected.columns:
+        assert list(result.column(name))[:5] == list(expected.column(name))
+    assert result.column("manufacturer_partNumber")[5].startswith("YL-")
+
+
+def test_ingest_files_duplicate(sources):
+    result = ingest.ingest_files([sources[0], sources[0]], jobs=1)
+    assert len(result) == 5
+
+
+def test_ingest_files_conflict(sources, tmp_path):
+    changed = tmp_path / "changed.csv"
+    text = sources[0].read_text(encoding="utf-8-sig")
+    changed.write_text(text.replace("4.0mm2 4C+E,36,", "4.0mm2 4C+E,37,"), encoding="utf-8")
+    with pytest.raises(ValueError, match="changed.csv"):
+        ingest.ingest_files([sources[0], changed], jobs=1)
+    result = ingest.ingest_files([sources[0], changed], jobs=1, on_conflict="last")
+    assert len(result) == 5
+    assert result.get_row(0)["unenclosed_spaced_current"] == 37.0
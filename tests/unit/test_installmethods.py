@@ -0,0 +1,33 @@
+import pytest
+import CableSizer.installmethods as installmethods
+
+
+def test_methods():
+    names = [method.name for method in installmethods.METHODS]
+    assert names[:9] == ["unenclosed_spaced", "unenclosed_surface", "unenclosed_touching", "enclosed_conduit",
+                         "enclosed_partial", "enclosed_complete", "buried_direct", "ducts_single", "ducts_per_cable"]
+    assert {"unenclosed_partial", "unenclosed_complete", "underground_ducts", "enclosed_buried_separate"} <= set(names)
+    assert [method.id for method in installmethods.METHODS] == list(range(installmethods.COUNT))
+    assert len(set(map(installmethods.key, names))) == installmethods.COUNT
+
+
+@pytest.mark.parametrize('name,expected',
+                         [("UNENCLOSED_SPACED", ("unenclosed_spaced", "unenclosedSpaced", "unenclosed_spaced")),
+                          ("undergroundDucts", ("underground_ducts", "undergroundDucts", "underground_ducts")),
+                          ("Enclosed_Buried_Separate", ("enclosed_buried_separate", "enclosedBuriedSeparate", None))])
+def test_get(name, expected):
+    method = installmethods.get(name)
+    assert (method.name, method.attribute, method.column) == expected
+    assert installmethods.get(method.id) is method
+
+
+def test_find():
+    assert installmethods.find("ductsPerCable") == installmethods.find("DUCTS_PER_CABLE") == 8
+    assert installmethods.find("on_a_cloud") is None
+    assert installmethods.find(installmethods.COUNT) is None
+
+
+def test_method_ids():
+    assert installmethods.method_ids(["ducts_single", 0, "unenclosedSurface"]) == (7, 0, 1)
+    with pytest.raises(ValueError):
+        installmethods.method_ids(["ducts_single", "on_a_cloud"])
@@ -0,0 +1,71 @@
+import datetime
+import json
+import pytest
+import CableSizer.cable as cable
+import CableSizer.catalogue as catalogue
+import CableSizer.jsonlines as jsonlines
+
+
+@pytest.fixture
+def records_file(tmp_path):
+    fp = tmp_path / "records.jsonl"
+    records = [{"n": n, "text": "x" * (n % 7)} for n in range(50)]
+    jsonlines.write_lines(records[:30], fp, chunk_size=7)
+    jsonlines.write_lines(iter(records[30:]), fp, append=True)
+    return fp, records
+
+
+def test_write_lines(records_file):
+    fp, records = records_file
+    lines = fp.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == records
+    assert jsonlines.write_lines([{"date": datetime.date(2020, 3, 2)}], fp) == 1
+    assert fp.read_text(encoding="utf-8") == '{"date":"2020-03-02"}\n'
+
+
+def test_iter_lines(tmp_path):
+    fp = tmp_path / "records.jsonl"
+    fp.write_bytes(b'{"a": 1}\r\n\n[2]\n3')
+    assert list(jsonlines.iter_lines(fp)) == [{"a": 1}, [2], 3]
+    fp.write_bytes(b'{"a": 1}\n{"a": \n')
+    with pytest.raises(ValueError, match="at byte 9"):
+        list(jsonlines.iter_lines(fp))
+
+
+@pytest.mark.parametrize('parts', [1, 2, 5, 200])
+def test_byte_ranges(records_file, parts):
+    fp, records = records_file
+    data = fp.read_bytes()
+    ranges = jsonlines.byte_ranges(fp, parts)
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+    assert all(data[start - 1:start] == b"\n" for start, _ in ranges[1:])
+    assert len(ranges) <= min(parts, len(records))
+    assert [each for start, end in ranges for each in jsonlines.read_range(fp, start, end)] == records
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_read_lines(records_file, jobs):
+    fp, records = records_file
+    assert jsonlines.read_lines(fp, jobs=jobs, min_range=64) == records
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_catalogue(make_row, tmp_path, jobs):
+    fp = tmp_path / "catalogue.jsonl"
+    source = catalogue.CableCatalogue([make_row(float(size), size * 9, 40 / size, f"p-{size}")
+                                       for size in range(1, 41)])
+    assert jsonlines.dump_catalogue(source, fp) == 40
+    result = jsonlines.load_catalogue(fp, jobs=jobs, min_range=512)
+    assert [result.get_row(index) for index in range(40)] == [source.get_row(index) for index in range(40)]
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_runs(tmp_path, jobs):
+    fp = tmp_path / "runs.jsonl"
+    runs = [cable.CableRun(cable.Cable(cable_type="power", active_size=float(size)), tag=f"RUN-{size}", length=50.0)
+            for size in range(1, 21)]
+    assert jsonlines.dump_runs(runs[:10], fp) == 10
+    assert jsonlines.dump_runs(iter(runs[10:]), fp, append=True) == 10
+    result = jsonlines.load_runs(fp, jobs=jobs, min_range=512)
+    assert [each.to_dict() for each in result] == [each.to_dict() for each in runs]
@@ -0,0 +1,77 @@
+import datetime
+import io
+import json
+import pytest
+import CableSizer.cable as cable
+import CableSizer.catalogue as catalogue
+import CableSizer.jsonstream as jsonstream
+
+
+class _Recorder(io.StringIO):
+    """
+    A file that records the length of its contents at each flush.
+    """
+    def __init__(self):
+        super().__init__()
+        self.flushes = []
+
+    def flush(self):
+        self.flushes.append(len(self.getvalue()))
+
+
+@pytest.mark.parametrize('block_size', [1, 3, 7, 1 << 16])
+def test_iter_array(block_size):
+    records = [{"a": 1.5, "b": [1, 2, {"c": "x, ]"}]}, 12345, "text", None, True, [], {}]
+    text = " \n[ " + " ,\n".join(json.dumps(each) for each in records) + " ] "
+    assert list(jsonstream.iter_array(io.StringIO(text), block_size)) == records
+    assert list(jsonstream.iter_array(io.BytesIO(("\ufeff" + text).encode()), block_size)) == records
+
+
+def test_iter_array_incremental():
+    file = io.StringIO('[{"a": 1}, {"a": 2}, {"a"')
+    records = jsonstream.iter_array(file, block_size=4)
+    assert next(records) == {"a": 1}
+    assert file.tell() < len(file.getvalue())
+    assert next(records) == {"a": 2}
+    with pytest.raises(ValueError):
+        next(records)
+
+
+@pytest.mark.parametrize('text', ['{"a": 1}', '[1, 2', '[1 2]', ''])
+def test_iter_array_exception(text):
+    with pytest.raises(ValueError):
+        list(jsonstream.iter_array(io.StringIO(text)))
+
+
+def test_write_array():
+    file = _Recorder()
+    assert jsonstream.write_array(({"n": n, "date": datetime.date(2020, 1, n + 1)} for n in range(5)), file, 2) == 5
+    assert json.loads(file.getvalue()) == [{"n": n, "date": f"2020-01-0{n + 1}"} for n in range(5)]
+    assert len(file.flushes) == 3
+    assert jsonstream.write_array([], file := io.StringIO()) == 0 and file.getvalue() == "[]"
+
+
+def test_array_writer_exception():
+    file = io.StringIO()
+    with pytest.raises(RuntimeError):
+        with jsonstream.ArrayWriter(file, 1) as writer:
+            writer.write(1)
+            raise RuntimeError()
+    assert file.getvalue() == "[1"
+
+
+def test_catalogue(make_row, tmp_path):
+    rows = [make_row(4.0, 36, 9.5, "p-4"), dict(make_row(6.0, 46, 6.4, "p-6"), rev_date="02/03/2020")]
+    source = catalogue.CableCatalogue(rows)
+    assert jsonstream.dump_catalogue(source, tmp_path / "catalogue.json", chunk_size=1) == 2
+    result = jsonstream.load_catalogue(tmp_path / "catalogue.json", block_size=64)
+    assert [result.get_row(index) for index in range(2)] == [source.get_row(index) for index in range(2)]
+    assert result.get_cable(1).revision.date == datetime.date(2020, 3, 2)
+
+
+def test_runs(tmp_path):
+    runs = [cable.CableRun(cable.Cable(cable_type="power", active_size=size, rev_date=datetime.date(2020, 3, 2)),
+                           tag=f"RUN-{size}", length=50.0) for size in (4.0, 6.0)]
+    assert jsonstream.dump_runs(iter(runs), tmp_path / "runs.json") == 2
+    result = list(jsonstream.iter_runs(tmp_path / "runs.json"))
+    assert [each.to_dict() for each in result] == [each.to_dict() for each in runs]
@@ -0,0 +1,64 @@
+import time
+import pytest
+import CableSizer.resultstore as resultstore
+
+
+A, B, C = ("g-1", 40.0, 0.0, 0.0), ("g-1", 63.0, 40.0, 100.0), ("g-2", 40.0, 0.0, 0.0)
+
+
+def test_group_key():
+    assert resultstore.group_key(("csa", "unenclosed_spaced", 40.0)) == \
+        resultstore.group_key(("csa", "unenclosed_spaced", 40.0))
+    assert len(resultstore.group_key(())) == 32
+
+
+def test_cls_resultstore(tmp_path):
+    fp = tmp_path / "results.sqlite"
+    with resultstore.ResultStore(fp) as test_class:
+        test_class.put_many("cat-1", [(A, (3, 1, 85.0, 9.6)), (B, (None, 0, 0.0, 0.0))])
+        test_class.put_many("cat-2", [(A, (4, 2, 63.0, 1.5))])
+    with resultstore.ResultStore(fp) as test_class:
+        assert test_class.get_many("cat-1", [C, A, B]) == [None, (3, 1, 85.0, 9.6), (None, 0, 0.0, 0.0)]
+        assert test_class.get_many("cat-2", [A]) == [(4, 2, 63.0, 1.5)]
+        assert test_class.get_many("cat-2", [("g-1", 40, 0, 0)]) == [(4, 2, 63.0, 1.5)]
+        assert test_class.get_many("cat-2", []) == []
+        assert (test_class.hits, test_class.misses, len(test_class)) == (4, 1, 3)
+
+
+def test_cls_resultstore_journal_mode(tmp_path):
+    with resultstore.ResultStore(tmp_path / "shared.sqlite") as test_class:
+        assert test_class._connection.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    with resultstore.ResultStore(tmp_path / "local.sqlite", journal_mode="wal") as test_class:
+        assert test_class._connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    with pytest.raises(ValueError):
+        resultstore.ResultStore(tmp_path / "other.sqlite", journal_mode="memory")
+
+
+def test_cls_resultstore_vacuum(tmp_path):
+    fp = tmp_path / "results.sqlite"
+    with resultstore.ResultStore(fp, touch_interval=0) as test_class:
+        test_class.put_many("cat-1", [(A, (3, 1, 85.0, 9.6)), (B, (2, 1, 63.0, 1.0))])
+        test_class.put_many("cat-2", [(A, (4, 2, 63.0, 1.5))])
+        assert test_class.vacuum(catalogues=["cat-1"]) == 1
+        assert test_class.vacuum(max_age=60) == 0
+        time.sleep(0.5)
+        test_class.get_many("cat-1", [A])
+        assert test_class.vacuum(max_age=0.25) == 1
+        assert test_class.get_many("cat-1", [A, B]) == [(3, 1, 85.0, 9.6), None]
+
+
+def test_main(tmp_path, capsys):
+    fp = tmp_path / "results.sqlite"
+    with resultstore.ResultStore(fp) as test_class:
+        test_class.put_many("cat-1", [(A, (3, 1, 85.0, 9.6))])
+    assert resultstore.main([str(fp), "30"]) == 0
+    assert "0 selections deleted, 1 kept" in capsys.readouterr().out
+    assert resultstore.main([]) == 2
+
+
+def test_cls_resultstore_touch_interval(tmp_path):
+    with resultstore.ResultStore(tmp_path / "results.sqlite") as test_class:
+        test_class.put_many("cat-1", [(A, (3, 1, 85.0, 9.6))])
+        time.sleep(0.5)
+        test_class.get_many("cat-1", [A])
+        assert test_class.vacuum(max_age=0.25) == 1
@@ -0,0 +1,81 @@
+import pytest
+import CableSizer.schema as schema
+import datetime as dt
+
+
+@pytest.mark.parametrize('header,expected',
+                         [("activeCores_size", "d"),
+                          ("activeCores_number", "l"),
+                          ("rev_number", schema.ENUM),
+                          ("manufacturer_partNumber", schema.STRING),
+                          ("description", schema.STRING),
+                          ("rev_date", "l"),
+                          ("isFlex", "b"),
+                          ("impedance_MVAM", "d"),
+                          ("ducts_single_installTemp", "l"),
+                          ("voltRating", schema.ENUM),
+                          ("ducts_single_cableArrangement", schema.ENUM)])
+def test_column_typecode(header, expected):
+    assert schema.column_typecode(header) == expected
+
+
+@pytest.mark.parametrize('converter,value,expected',
+                         [(schema.to_float, "2.5", 2.5),
+                          (schema.to_float, " ", 0.0),
+                          (schema.to_float, None, 0.0),
+                          (schema.to_size, "16", 16.0),
+                          (schema.to_size, " 4/0 ", -4.0),
+                          (schema.to_size, "00", -2.0),
+                          (schema.to_size, "0", 0.0),
+                          (schema.to_size, "", 0.0),
+                          (schema.to_int, "32", 32),
+                          (schema.to_int, "32.0", 32),
+                          (schema.to_int, "", 0),
+                          (schema.to_bool, "true", 1),
+                          (schema.to_bool, "No", 0),
+                          (schema.to_bool, True, 1),
+                          (schema.to_enum, " x-90 ", "X-90"),
+                          (schema.to_text, " 4C+E mm2 ", "4C+E mm2"),
+                          (schema.to_date, "2020-03-02", dt.date(2020, 3, 2).toordinal()),
+                          (schema.to_date, "02/03/2020", dt.date(2020, 3, 2).toordinal()),
+                          (schema.to_date, "", 0)])
+def test_converters(converter, value, expected):
+    assert converter(value) == expected
+
+
+def test_converter_exception():
+    with pytest.raises(ValueError):
+        schema.to_float("abc")
+    with pytest.raises(ValueError):
+        schema.to_date("March")
+    with pytest.raises(ValueError):
+        schema.to_size("5/0")
+    assert schema.column_converter("activeCores_size") is schema.to_size
+    assert schema.column_converter("unenclosed_spaced_current") is schema.to_float
+
+
+def test_from_date():
+    assert schema.from_date(0) is None
+    assert schema.from_date(dt.date(2020, 3, 2).toordinal()) == dt.date(2020, 3, 2)
+
+
+def test_enum_interned():
+    assert schema.to_enum("swa".lower()) is schema.to_enum("SWA")
+
+
+def test_cls_compiled_header_convert():
+    test_class = schema.CompiledHeader(["isFlex", "activeCores_size", "CableScreen_name", "unknown"])
+    result = test_class.convert([["true", "4", "os", "x"], ["false", "6"]])
+    assert result["isFlex"] == [1, 0]
+    assert result["activeCores_size"] == [4.0, 6.0]
+    assert schema.TABLES["cableScreen_name"].decode_many(result["cableScreen_name"]) == ["OS", ""]
+    assert result["voltRating"] == [0, 0]
+    assert "unknown" not in result
+    assert "voltRating" in test_class.missing
+
+
+def test_cls_compiled_header_alias_fallback():
+    test_class = schema.CompiledHeader(["CableScreen_name", "cableScreen_name"])
+    result = test_class.convert([["os", ""], ["os", "cws"], ["", ""]])
+    assert schema.TABLES["cableScreen_name"].decode_many(result["cableScreen_name"]) == ["OS", "CWS", ""]
+    assert "CableScreen_name" not in result
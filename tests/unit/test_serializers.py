@@ -0,0 +1,75 @@
+import datetime
+import pytest
+import CableSizer.cable as cable
+import CableSizer.serializers as serializers
+
+
+@pytest.fixture
+def test_cable():
+    return cable.Cable(cable_type="power", active_size=4.0, active_unit="mm2", active_number=3, earth_size=2.5,
+                       earth_unit="mm2", earth_number=1, unenclosed_spaced_ccc=36, unenclosed_spaced_install_temp=40,
+                       mvam=9.5, r=4.6, r_unit="ohm/km", insulation_material="xlpe", insulation_code="x-90",
+                       cable_sheath="pvc", volt_rating="0.6/1kv", rev_number="a",
+                       rev_date=datetime.date(2020, 3, 2), description="4mm2 3C+E", conductor_material="cu")
+
+
+@pytest.fixture
+def test_run(test_cable):
+    run = cable.CableRun(test_cable, tag="1234-PU-01", length=150.0, description="Pump", required_ccc=30.0,
+                         derating_run=0.8)
+    run.circuit_details = cable.Circuit("multi_phase", 415, "vac", 50, "hz", "ac", 3, True, "enclosed_conduit",
+                                        "trefoil", 24.0)
+    return run
+
+
+def test_to_dict(test_cable, test_run):
+    assert serializers.to_dict(test_cable) == test_cable.to_dict()
+    assert serializers.to_dict(test_run) == test_run.to_dict()
+    spec = cable.CableSpec(armour="swa", insulation_code="x-90", vd_max=5.0)
+    assert serializers.to_dict(spec) == spec.to_dict()
+
+
+def test_to_key(test_cable, test_run):
+    other = cable.Cable()
+    other.from_dict(test_cable.to_dict())
+    assert serializers.to_key(other) == serializers.to_key(test_cable)
+    assert hash(serializers.to_key(test_run)) == hash(serializers.to_key(test_run))
+    other.unenclosedSpaced.ccc = 40
+    assert serializers.to_key(other) != serializers.to_key(test_cable)
+
+
+def test_from_dict(test_cable, test_run):
+    result = serializers.from_dict(cable.Cable, test_cable.to_dict())
+    assert isinstance(result, cable.Cable)
+    assert result.to_dict() == test_cable.to_dict()
+    assert cable.is_shared(result.dataCores)
+    result = serializers.from_dict(cable.CableRun, test_run.to_dict())
+    assert result.to_dict() == test_run.to_dict()
+    assert result.circuit_details.installation.physical_installation == "ENCLOSED_CONDUIT"
+
+
+def test_from_dict_normalised(test_cable):
+    details = test_cable.to_dict()
+    details["sheath"] = "hdpe"
+    assert serializers.from_dict(cable.Cable, details).sheath == "HDPE"
+
+
+def test_dump_many_load_many(test_cable, test_run):
+    result = serializers.dump_many([test_run, test_run])
+    assert result == [test_run.to_dict()] * 2
+    assert [run.to_dict() for run in serializers.load_many(cable.CableRun, result)] == result
+
+
+def test_save_load(test_run, tmp_path):
+    fp = tmp_path / "project.json"
+    serializers.save([test_run], fp)
+    result = serializers.load(cable.CableRun, fp)
+    assert result[0].to_dict() == test_run.to_dict()
+    assert result[0].cables[0].revision.date == datetime.date(2020, 3, 2)
+
+
+def test_serializer_exception():
+    with pytest.raises(ValueError):
+        serializers.to_dict(object())
+    with pytest.raises(ValueError):
+        serializers.from_dict(dict, {})
@@ -0,0 +1,28 @@
+import pytest
+import CableSizer.sizingcache as sizingcache
+
+
+@pytest.mark.parametrize("value, step, expected", [(40.0, 0.1, 40.0), (40.01, 0.1, 40.1), (0.3, 0.1, 0.3),
+                                                   (12.5, 5, 15), (12.5, 0, 12.5)])
+def test_quantise(value, step, expected):
+    assert sizingcache.quantise(value, step) == pytest.approx(expected)
+
+
+def test_cls_sizingcache_lru():
+    test_class = sizingcache.SizingCache(maxsize=2)
+    test_class.put("a", 1)
+    test_class.put("b", 2)
+    assert test_class.get("a") == 1
+    test_class.put("c", 3)
+    assert (test_class.get("b"), test_class.get("a"), test_class.get("c")) == (None, 1, 3)
+    assert test_class.info() == {"hits": 3, "misses": 1, "evictions": 1, "size": 2, "maxsize": 2, "hit_ratio": 0.75}
+    test_class.clear()
+    assert (len(test_class), test_class.hits, test_class.get("a")) == (0, 0, None)
+
+
+def test_cls_sizingcache_disabled():
+    test_class = sizingcache.SizingCache(maxsize=0)
+    test_class.put("a", 1)
+    assert (len(test_class), test_class.get("a")) == (0, None)
+    with pytest.raises(ValueError):
+        sizingcache.SizingCache(maxsize=-1)